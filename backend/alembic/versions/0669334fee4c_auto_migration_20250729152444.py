@@ -1,32 +0,0 @@
-"""auto migration 20250729152444
-
-Revision ID: 0669334fee4c
-Revises: edd281cd9bf2
-Create Date: 2025-07-29 15:24:47.093681
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '0669334fee4c'
-down_revision: Union[str, Sequence[str], None] = 'edd281cd9bf2'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730031905
-
-Revision ID: 0a8071807115
-Revises: 2c9fe590feff
-Create Date: 2025-07-30 03:19:07.671645
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '0a8071807115'
-down_revision: Union[str, Sequence[str], None] = '2c9fe590feff'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
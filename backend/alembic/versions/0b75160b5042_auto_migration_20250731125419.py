@@ -1,32 +0,0 @@
-"""auto migration 20250731125419
-
-Revision ID: 0b75160b5042
-Revises: 76f4e2698246
-Create Date: 2025-07-31 12:54:22.409685
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '0b75160b5042'
-down_revision: Union[str, Sequence[str], None] = '76f4e2698246'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
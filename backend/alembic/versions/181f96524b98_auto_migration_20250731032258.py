@@ -1,32 +0,0 @@
-"""auto migration 20250731032258
-
-Revision ID: 181f96524b98
-Revises: d39f22f46f1e
-Create Date: 2025-07-31 03:22:59.299755
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '181f96524b98'
-down_revision: Union[str, Sequence[str], None] = 'd39f22f46f1e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
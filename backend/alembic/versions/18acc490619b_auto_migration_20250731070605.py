@@ -1,32 +0,0 @@
-"""auto migration 20250731070605
-
-Revision ID: 18acc490619b
-Revises: 67d6596d4edd
-Create Date: 2025-07-31 07:06:06.940220
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '18acc490619b'
-down_revision: Union[str, Sequence[str], None] = '67d6596d4edd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731124358
-
-Revision ID: 199d39c38137
-Revises: 18acc490619b
-Create Date: 2025-07-31 12:43:59.498420
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '199d39c38137'
-down_revision: Union[str, Sequence[str], None] = '18acc490619b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729125010
-
-Revision ID: 1a177fed7c21
-Revises: eebf2d0124da
-Create Date: 2025-07-29 12:50:12.116521
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1a177fed7c21'
-down_revision: Union[str, Sequence[str], None] = 'eebf2d0124da'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730061309
-
-Revision ID: 1cff18e9ef12
-Revises: f63676314297
-Create Date: 2025-07-30 06:13:11.439247
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1cff18e9ef12'
-down_revision: Union[str, Sequence[str], None] = 'f63676314297'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731142129
-
-Revision ID: 1d2480dc89ad
-Revises: ec8b9c259d1b
-Create Date: 2025-07-31 14:21:32.371242
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1d2480dc89ad'
-down_revision: Union[str, Sequence[str], None] = 'ec8b9c259d1b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731140901
-
-Revision ID: 1f3927f91161
-Revises: f02e20f17b08
-Create Date: 2025-07-31 14:09:04.488990
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '1f3927f91161'
-down_revision: Union[str, Sequence[str], None] = 'f02e20f17b08'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
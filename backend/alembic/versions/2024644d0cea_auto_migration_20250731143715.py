@@ -1,32 +0,0 @@
-"""auto migration 20250731143715
-
-Revision ID: 2024644d0cea
-Revises: ce6aef5346e0
-Create Date: 2025-07-31 14:37:19.197893
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2024644d0cea'
-down_revision: Union[str, Sequence[str], None] = 'ce6aef5346e0'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731142457
-
-Revision ID: 2665c7334afd
-Revises: 1d2480dc89ad
-Create Date: 2025-07-31 14:25:00.919391
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2665c7334afd'
-down_revision: Union[str, Sequence[str], None] = '1d2480dc89ad'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
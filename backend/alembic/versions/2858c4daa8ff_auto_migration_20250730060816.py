@@ -1,32 +0,0 @@
-"""auto migration 20250730060816
-
-Revision ID: 2858c4daa8ff
-Revises: f126b959ac71
-Create Date: 2025-07-30 06:08:17.462466
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2858c4daa8ff'
-down_revision: Union[str, Sequence[str], None] = 'f126b959ac71'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730025359
-
-Revision ID: 2c9fe590feff
-Revises: a8040a28453a
-Create Date: 2025-07-30 02:54:01.831481
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '2c9fe590feff'
-down_revision: Union[str, Sequence[str], None] = 'a8040a28453a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730011917
-
-Revision ID: 323670d42a8c
-Revises: 48f2c09c06d4
-Create Date: 2025-07-30 01:19:19.645173
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '323670d42a8c'
-down_revision: Union[str, Sequence[str], None] = '48f2c09c06d4'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731132235
-
-Revision ID: 361c665f46b0
-Revises: ee73e861bf80
-Create Date: 2025-07-31 13:22:38.916303
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '361c665f46b0'
-down_revision: Union[str, Sequence[str], None] = 'ee73e861bf80'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729121917
-
-Revision ID: 39de72adf65a
-Revises: b769dbd98b8a
-Create Date: 2025-07-29 12:19:18.938311
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '39de72adf65a'
-down_revision: Union[str, Sequence[str], None] = 'b769dbd98b8a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731135719
-
-Revision ID: 3a6b6ed66a74
-Revises: b892eda65cad
-Create Date: 2025-07-31 13:57:23.092244
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '3a6b6ed66a74'
-down_revision: Union[str, Sequence[str], None] = 'b892eda65cad'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
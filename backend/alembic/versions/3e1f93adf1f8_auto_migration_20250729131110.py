@@ -1,32 +0,0 @@
-"""auto migration 20250729131110
-
-Revision ID: 3e1f93adf1f8
-Revises: 1a177fed7c21
-Create Date: 2025-07-29 13:11:12.599085
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '3e1f93adf1f8'
-down_revision: Union[str, Sequence[str], None] = '1a177fed7c21'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731134238
-
-Revision ID: 41266428be81
-Revises: fff926c00eac
-Create Date: 2025-07-31 13:42:42.028839
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '41266428be81'
-down_revision: Union[str, Sequence[str], None] = 'fff926c00eac'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729115908
-
-Revision ID: 41acb5f275fd
-Revises: c61c25a89a4d
-Create Date: 2025-07-29 11:59:10.101881
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '41acb5f275fd'
-down_revision: Union[str, Sequence[str], None] = 'c61c25a89a4d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731150413
-
-Revision ID: 4218a8c62cd4
-Revises: 2024644d0cea
-Create Date: 2025-07-31 15:04:17.662556
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4218a8c62cd4'
-down_revision: Union[str, Sequence[str], None] = '2024644d0cea'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
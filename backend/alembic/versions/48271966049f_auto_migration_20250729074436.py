@@ -1,32 +0,0 @@
-"""auto migration 20250729074436
-
-Revision ID: 48271966049f
-Revises: b6a69f2bd12e
-Create Date: 2025-07-29 07:44:38.481740
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '48271966049f'
-down_revision: Union[str, Sequence[str], None] = 'b6a69f2bd12e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
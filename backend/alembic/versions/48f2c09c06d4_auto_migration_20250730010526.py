@@ -1,32 +0,0 @@
-"""auto migration 20250730010526
-
-Revision ID: 48f2c09c06d4
-Revises: 0669334fee4c
-Create Date: 2025-07-30 01:05:28.883761
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '48f2c09c06d4'
-down_revision: Union[str, Sequence[str], None] = '0669334fee4c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
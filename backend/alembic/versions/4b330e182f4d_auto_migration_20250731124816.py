@@ -1,32 +0,0 @@
-"""auto migration 20250731124816
-
-Revision ID: 4b330e182f4d
-Revises: b6734b3ba22a
-Create Date: 2025-07-31 12:48:17.415166
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4b330e182f4d'
-down_revision: Union[str, Sequence[str], None] = 'b6734b3ba22a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
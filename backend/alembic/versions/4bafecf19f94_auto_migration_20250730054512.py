@@ -1,32 +0,0 @@
-"""auto migration 20250730054512
-
-Revision ID: 4bafecf19f94
-Revises: 4e2b14239a54
-Create Date: 2025-07-30 05:45:13.154136
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4bafecf19f94'
-down_revision: Union[str, Sequence[str], None] = '4e2b14239a54'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730054137
-
-Revision ID: 4e2b14239a54
-Revises: ccc889bea4b1
-Create Date: 2025-07-30 05:41:38.267112
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '4e2b14239a54'
-down_revision: Union[str, Sequence[str], None] = 'ccc889bea4b1'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
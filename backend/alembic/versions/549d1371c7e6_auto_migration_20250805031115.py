@@ -1,32 +0,0 @@
-"""auto migration 20250805031115
-
-Revision ID: 549d1371c7e6
-Revises: 996e45cec901
-Create Date: 2025-08-05 03:11:19.437677
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '549d1371c7e6'
-down_revision: Union[str, Sequence[str], None] = '996e45cec901'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
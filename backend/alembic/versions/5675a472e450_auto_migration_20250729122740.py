@@ -1,32 +0,0 @@
-"""auto migration 20250729122740
-
-Revision ID: 5675a472e450
-Revises: d55f2700e0f6
-Create Date: 2025-07-29 12:27:42.443836
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '5675a472e450'
-down_revision: Union[str, Sequence[str], None] = 'd55f2700e0f6'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -0,0 +1,28 @@
+"""add recommendations.recommended_categories
+
+Revision ID: 5c2e9a7d4b1f
+Revises: db1e693bec10
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e9a7d4b1f'
+down_revision: Union[str, Sequence[str], None] = 'db1e693bec10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recommendations', sa.Column('recommended_categories', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('recommendations', 'recommended_categories')
@@ -1,32 +0,0 @@
-"""auto migration 20250801061601
-
-Revision ID: 629acada33bf
-Revises: 98f64f12bd6c
-Create Date: 2025-08-01 06:16:03.509249
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '629acada33bf'
-down_revision: Union[str, Sequence[str], None] = '98f64f12bd6c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729145222
-
-Revision ID: 63a8ecc0cc8d
-Revises: da176484788b
-Create Date: 2025-07-29 14:52:23.888683
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '63a8ecc0cc8d'
-down_revision: Union[str, Sequence[str], None] = 'da176484788b'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('users', sa.Column('gender', sa.String(length=10), nullable=True))
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.drop_column('users', 'gender')
-    # ### end Alembic commands ###
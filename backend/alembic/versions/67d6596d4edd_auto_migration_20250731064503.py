@@ -1,32 +0,0 @@
-"""auto migration 20250731064503
-
-Revision ID: 67d6596d4edd
-Revises: e298086874ec
-Create Date: 2025-07-31 06:45:04.444598
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '67d6596d4edd'
-down_revision: Union[str, Sequence[str], None] = 'e298086874ec'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250805032032
-
-Revision ID: 6893f846be37
-Revises: 549d1371c7e6
-Create Date: 2025-08-05 03:20:35.624623
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '6893f846be37'
-down_revision: Union[str, Sequence[str], None] = '549d1371c7e6'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
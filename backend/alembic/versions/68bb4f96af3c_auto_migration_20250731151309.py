@@ -1,32 +0,0 @@
-"""auto migration 20250731151309
-
-Revision ID: 68bb4f96af3c
-Revises: 4218a8c62cd4
-Create Date: 2025-07-31 15:13:13.690172
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '68bb4f96af3c'
-down_revision: Union[str, Sequence[str], None] = '4218a8c62cd4'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729122139
-
-Revision ID: 6c80244191f0
-Revises: 39de72adf65a
-Create Date: 2025-07-29 12:21:41.324721
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '6c80244191f0'
-down_revision: Union[str, Sequence[str], None] = '39de72adf65a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
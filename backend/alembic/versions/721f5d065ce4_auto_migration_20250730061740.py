@@ -1,32 +0,0 @@
-"""auto migration 20250730061740
-
-Revision ID: 721f5d065ce4
-Revises: 1cff18e9ef12
-Create Date: 2025-07-30 06:17:42.344762
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '721f5d065ce4'
-down_revision: Union[str, Sequence[str], None] = '1cff18e9ef12'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731143055
-
-Revision ID: 735a666a3bee
-Revises: c32467ebe699
-Create Date: 2025-07-31 14:30:58.814761
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '735a666a3bee'
-down_revision: Union[str, Sequence[str], None] = 'c32467ebe699'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
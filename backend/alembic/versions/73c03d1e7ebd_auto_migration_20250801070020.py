@@ -1,32 +0,0 @@
-"""auto migration 20250801070020
-
-Revision ID: 73c03d1e7ebd
-Revises: d92edd40c975
-Create Date: 2025-08-01 07:00:22.774967
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '73c03d1e7ebd'
-down_revision: Union[str, Sequence[str], None] = 'd92edd40c975'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731124944
-
-Revision ID: 76f4e2698246
-Revises: 4b330e182f4d
-Create Date: 2025-07-31 12:49:46.023942
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '76f4e2698246'
-down_revision: Union[str, Sequence[str], None] = '4b330e182f4d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
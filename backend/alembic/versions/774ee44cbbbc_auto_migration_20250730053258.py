@@ -1,32 +0,0 @@
-"""auto migration 20250730053258
-
-Revision ID: 774ee44cbbbc
-Revises: cae39692da0a
-Create Date: 2025-07-30 05:32:59.865178
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '774ee44cbbbc'
-down_revision: Union[str, Sequence[str], None] = 'cae39692da0a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
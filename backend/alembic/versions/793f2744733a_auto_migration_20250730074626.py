@@ -1,32 +0,0 @@
-"""auto migration 20250730074626
-
-Revision ID: 793f2744733a
-Revises: a92918c8a25f
-Create Date: 2025-07-30 07:46:29.083336
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '793f2744733a'
-down_revision: Union[str, Sequence[str], None] = 'a92918c8a25f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250803045438
-
-Revision ID: 813c0d866a60
-Revises: bb3c436b3d6d
-Create Date: 2025-08-03 04:54:42.840644
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '813c0d866a60'
-down_revision: Union[str, Sequence[str], None] = 'bb3c436b3d6d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250806125655
-
-Revision ID: 8199856c3850
-Revises: 6893f846be37
-Create Date: 2025-08-06 12:56:58.365654
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8199856c3850'
-down_revision: Union[str, Sequence[str], None] = '6893f846be37'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250801040819
-
-Revision ID: 81c6d2459d0e
-Revises: a464a4f89b0d
-Create Date: 2025-08-01 04:08:23.405118
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '81c6d2459d0e'
-down_revision: Union[str, Sequence[str], None] = 'a464a4f89b0d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
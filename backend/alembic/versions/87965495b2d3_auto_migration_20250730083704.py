@@ -1,32 +0,0 @@
-"""auto migration 20250730083704
-
-Revision ID: 87965495b2d3
-Revises: 793f2744733a
-Create Date: 2025-07-30 08:37:07.398983
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '87965495b2d3'
-down_revision: Union[str, Sequence[str], None] = '793f2744733a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
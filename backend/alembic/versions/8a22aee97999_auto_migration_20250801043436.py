@@ -1,32 +0,0 @@
-"""auto migration 20250801043436
-
-Revision ID: 8a22aee97999
-Revises: 81c6d2459d0e
-Create Date: 2025-08-01 04:34:40.280955
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8a22aee97999'
-down_revision: Union[str, Sequence[str], None] = '81c6d2459d0e'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
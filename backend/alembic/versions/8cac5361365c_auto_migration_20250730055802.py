@@ -1,32 +0,0 @@
-"""auto migration 20250730055802
-
-Revision ID: 8cac5361365c
-Revises: af8f038bbe8c
-Create Date: 2025-07-30 05:58:03.698487
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '8cac5361365c'
-down_revision: Union[str, Sequence[str], None] = 'af8f038bbe8c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
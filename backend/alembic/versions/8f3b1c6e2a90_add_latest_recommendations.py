@@ -0,0 +1,49 @@
+"""add latest_recommendations
+
+Revision ID: 8f3b1c6e2a90
+Revises: 5c2e9a7d4b1f
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3b1c6e2a90'
+down_revision: Union[str, Sequence[str], None] = '5c2e9a7d4b1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('latest_recommendations',
+    sa.Column('user_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('recommended_items', sa.Text(), nullable=False),
+    sa.Column('recommended_categories', sa.JSON(), nullable=True),
+    sa.Column('model_type', sa.Enum('COLLABORATIVE', 'CONTENT_BASED', 'DEEP_LEARNING', name='model_type_enum'), nullable=False),
+    sa.Column('generated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_latest_recommendations_generated_at'), 'latest_recommendations', ['generated_at'], unique=False)
+
+    # 기존 이력에서 사용자별 가장 최근 추천 1건으로 채움
+    op.execute("""
+        INSERT INTO latest_recommendations (user_id, recommended_items, recommended_categories, model_type, generated_at)
+        SELECT user_id, recommended_items, recommended_categories, model_type, generated_at
+        FROM (
+            SELECT r.*, ROW_NUMBER() OVER (PARTITION BY r.user_id ORDER BY r.generated_at DESC, r.id DESC) AS rn
+            FROM recommendations r
+        ) ranked
+        WHERE ranked.rn = 1
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_latest_recommendations_generated_at'), table_name='latest_recommendations')
+    op.drop_table('latest_recommendations')
@@ -1,32 +0,0 @@
-"""auto migration 20250730071053
-
-Revision ID: 944675144dfd
-Revises: 9c3f01a128b7
-Create Date: 2025-07-30 07:10:54.717868
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '944675144dfd'
-down_revision: Union[str, Sequence[str], None] = '9c3f01a128b7'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250801055115
-
-Revision ID: 98f64f12bd6c
-Revises: 8a22aee97999
-Create Date: 2025-08-01 05:51:19.193416
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '98f64f12bd6c'
-down_revision: Union[str, Sequence[str], None] = '8a22aee97999'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
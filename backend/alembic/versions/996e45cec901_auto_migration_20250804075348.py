@@ -1,32 +0,0 @@
-"""auto migration 20250804075348
-
-Revision ID: 996e45cec901
-Revises: c6aa588d7162
-Create Date: 2025-08-04 07:53:52.446771
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '996e45cec901'
-down_revision: Union[str, Sequence[str], None] = 'c6aa588d7162'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730064718
-
-Revision ID: 9c3f01a128b7
-Revises: 03cb20dc4ce3
-Create Date: 2025-07-30 06:47:19.658789
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = '9c3f01a128b7'
-down_revision: Union[str, Sequence[str], None] = '03cb20dc4ce3'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730013103
-
-Revision ID: a8040a28453a
-Revises: 323670d42a8c
-Create Date: 2025-07-30 01:31:04.889040
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'a8040a28453a'
-down_revision: Union[str, Sequence[str], None] = '323670d42a8c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
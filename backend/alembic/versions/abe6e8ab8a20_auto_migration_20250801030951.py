@@ -1,32 +0,0 @@
-"""auto migration 20250801030951
-
-Revision ID: abe6e8ab8a20
-Revises: d62ebba55c6a
-Create Date: 2025-08-01 03:09:55.443258
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'abe6e8ab8a20'
-down_revision: Union[str, Sequence[str], None] = 'd62ebba55c6a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730055543
-
-Revision ID: af8f038bbe8c
-Revises: 75bbc7eb971c
-Create Date: 2025-07-30 05:55:44.060027
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'af8f038bbe8c'
-down_revision: Union[str, Sequence[str], None] = '75bbc7eb971c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250801005725
-
-Revision ID: b374dcfe64fe
-Revises: efa3b189f046
-Create Date: 2025-08-01 00:57:27.007311
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'b374dcfe64fe'
-down_revision: Union[str, Sequence[str], None] = 'efa3b189f046'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
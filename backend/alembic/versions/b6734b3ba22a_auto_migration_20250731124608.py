@@ -1,32 +0,0 @@
-"""auto migration 20250731124608
-
-Revision ID: b6734b3ba22a
-Revises: 199d39c38137
-Create Date: 2025-07-31 12:46:10.079948
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'b6734b3ba22a'
-down_revision: Union[str, Sequence[str], None] = '199d39c38137'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
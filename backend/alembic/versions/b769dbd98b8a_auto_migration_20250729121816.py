@@ -1,32 +0,0 @@
-"""auto migration 20250729121816
-
-Revision ID: b769dbd98b8a
-Revises: 41acb5f275fd
-Create Date: 2025-07-29 12:18:17.515753
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'b769dbd98b8a'
-down_revision: Union[str, Sequence[str], None] = '41acb5f275fd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731134824
-
-Revision ID: b892eda65cad
-Revises: 41266428be81
-Create Date: 2025-07-31 13:48:28.021770
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'b892eda65cad'
-down_revision: Union[str, Sequence[str], None] = '41266428be81'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731125618
-
-Revision ID: bb05b0e1873d
-Revises: 0b75160b5042
-Create Date: 2025-07-31 12:56:21.800243
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'bb05b0e1873d'
-down_revision: Union[str, Sequence[str], None] = '0b75160b5042'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
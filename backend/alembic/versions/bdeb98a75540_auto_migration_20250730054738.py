@@ -1,32 +0,0 @@
-"""auto migration 20250730054738
-
-Revision ID: bdeb98a75540
-Revises: 4bafecf19f94
-Create Date: 2025-07-30 05:47:40.191625
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'bdeb98a75540'
-down_revision: Union[str, Sequence[str], None] = '4bafecf19f94'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731142743
-
-Revision ID: c32467ebe699
-Revises: 2665c7334afd
-Create Date: 2025-07-31 14:27:47.097897
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c32467ebe699'
-down_revision: Union[str, Sequence[str], None] = '2665c7334afd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
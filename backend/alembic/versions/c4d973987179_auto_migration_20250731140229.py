@@ -1,32 +0,0 @@
-"""auto migration 20250731140229
-
-Revision ID: c4d973987179
-Revises: f56de5c75d0d
-Create Date: 2025-07-31 14:02:32.717855
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c4d973987179'
-down_revision: Union[str, Sequence[str], None] = 'f56de5c75d0d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729075004
-
-Revision ID: c61c25a89a4d
-Revises: 48271966049f
-Create Date: 2025-07-29 07:50:06.576613
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c61c25a89a4d'
-down_revision: Union[str, Sequence[str], None] = '48271966049f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
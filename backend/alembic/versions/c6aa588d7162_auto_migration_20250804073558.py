@@ -1,32 +0,0 @@
-"""auto migration 20250804073558
-
-Revision ID: c6aa588d7162
-Revises: 960df25b2f86
-Create Date: 2025-08-04 07:36:01.535592
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'c6aa588d7162'
-down_revision: Union[str, Sequence[str], None] = '960df25b2f86'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
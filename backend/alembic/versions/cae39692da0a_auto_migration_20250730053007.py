@@ -1,32 +0,0 @@
-"""auto migration 20250730053007
-
-Revision ID: cae39692da0a
-Revises: 0a8071807115
-Create Date: 2025-07-30 05:30:09.488691
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'cae39692da0a'
-down_revision: Union[str, Sequence[str], None] = '0a8071807115'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731143447
-
-Revision ID: ce6aef5346e0
-Revises: f0d7087fc98a
-Create Date: 2025-07-31 14:34:51.045722
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ce6aef5346e0'
-down_revision: Union[str, Sequence[str], None] = 'f0d7087fc98a'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250804063203
-
-Revision ID: d1aaf1f0659f
-Revises: 813c0d866a60
-Create Date: 2025-08-04 06:32:04.545427
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd1aaf1f0659f'
-down_revision: Union[str, Sequence[str], None] = '813c0d866a60'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730100647
-
-Revision ID: d33de49d868f
-Revises: e1891ba7d735
-Create Date: 2025-07-30 10:06:49.766655
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd33de49d868f'
-down_revision: Union[str, Sequence[str], None] = 'e1891ba7d735'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
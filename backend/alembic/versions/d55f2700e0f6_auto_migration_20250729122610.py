@@ -1,32 +0,0 @@
-"""auto migration 20250729122610
-
-Revision ID: d55f2700e0f6
-Revises: 6c80244191f0
-Create Date: 2025-07-29 12:26:12.551142
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd55f2700e0f6'
-down_revision: Union[str, Sequence[str], None] = '6c80244191f0'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
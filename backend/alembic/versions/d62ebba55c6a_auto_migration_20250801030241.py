@@ -1,32 +0,0 @@
-"""auto migration 20250801030241
-
-Revision ID: d62ebba55c6a
-Revises: e396e6bb0f59
-Create Date: 2025-08-01 03:02:44.793018
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd62ebba55c6a'
-down_revision: Union[str, Sequence[str], None] = 'e396e6bb0f59'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250801065821
-
-Revision ID: d92edd40c975
-Revises: 629acada33bf
-Create Date: 2025-08-01 06:58:23.058663
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'd92edd40c975'
-down_revision: Union[str, Sequence[str], None] = '629acada33bf'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729135846
-
-Revision ID: da176484788b
-Revises: 3e1f93adf1f8
-Create Date: 2025-07-29 13:58:48.980214
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'da176484788b'
-down_revision: Union[str, Sequence[str], None] = '3e1f93adf1f8'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
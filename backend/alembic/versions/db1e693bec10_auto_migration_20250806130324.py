@@ -1,32 +0,0 @@
-"""auto migration 20250806130324
-
-Revision ID: db1e693bec10
-Revises: 8199856c3850
-Create Date: 2025-08-06 13:03:28.414980
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'db1e693bec10'
-down_revision: Union[str, Sequence[str], None] = '8199856c3850'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,9 +1,14 @@
-"""auto migration 20250729072306
+"""baseline (squashed history up to db1e693bec10)
 
-Revision ID: b6a69f2bd12e
-Revises: 
-Create Date: 2025-07-29 07:23:08.521087
+Revision ID: db1e693bec10
+Revises:
+Create Date: 2026-10-18 12:00:00.000000
 
+기존 자동 생성 리비전(db1e693bec10 까지의 auto migration 109개)을 하나로 합친 기준 리비전.
+- 리비전 ID 를 배포된 head(db1e693bec10) 와 같게 유지 → 이미 db1e693bec10 인 DB 는 이 리비전을 건너뛰고
+  이후 리비전(5c2e9a7d4b1f → 8f3b1c6e2a90 → c41d7e2f9b35)만 적용
+- 빈 DB 는 이 리비전으로 db1e693bec10 시점 스키마 생성 후 이후 리비전 적용
+- db1e693bec10 보다 이전 리비전에 있는 DB 는 지원하지 않음 (alembic/README 참고)
 """
 from typing import Sequence, Union
 
@@ -12,7 +17,7 @@ import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
-revision: str = 'b6a69f2bd12e'
+revision: str = 'db1e693bec10'
 down_revision: Union[str, Sequence[str], None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
@@ -20,7 +25,6 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('categories',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('name', sa.String(length=100), nullable=False),
@@ -34,6 +38,7 @@ def upgrade() -> None:
     sa.Column('password', sa.String(length=255), nullable=False),
     sa.Column('nickname', sa.String(length=100), nullable=False),
     sa.Column('age', sa.Integer(), nullable=True),
+    sa.Column('gender', sa.Enum('남', '여', name='gender_enum', native_enum=False), nullable=True),
     sa.Column('role', sa.Enum('CUSTOMER', 'SELLER', 'ADMIN', name='userrole'), nullable=False),
     sa.Column('created_at', sa.DateTime(), nullable=True),
     sa.PrimaryKeyConstraint('id'),
@@ -78,6 +83,15 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_products_id'), 'products', ['id'], unique=False)
+    op.create_table('recommendations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('recommended_items', sa.Text(), nullable=False),
+    sa.Column('model_type', sa.Enum('COLLABORATIVE', 'CONTENT_BASED', 'DEEP_LEARNING', name='model_type_enum'), nullable=False),
+    sa.Column('generated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
     op.create_table('user_profiles',
     sa.Column('id', sa.Integer(), nullable=False),
     sa.Column('user_id', sa.Integer(), nullable=False),
@@ -150,12 +164,10 @@ def upgrade() -> None:
     sa.ForeignKeyConstraint(['product_id'], ['products.id'], ),
     sa.PrimaryKeyConstraint('id')
     )
-    # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
     op.drop_table('order_items')
     op.drop_table('user_coupons')
     op.drop_table('product_reviews')
@@ -163,6 +175,7 @@ def downgrade() -> None:
     op.drop_table('orders')
     op.drop_table('cart_items')
     op.drop_table('user_profiles')
+    op.drop_table('recommendations')
     op.drop_index(op.f('ix_products_id'), table_name='products')
     op.drop_table('products')
     op.drop_table('coupons')
@@ -171,4 +184,3 @@ def downgrade() -> None:
     op.drop_index(op.f('ix_users_email'), table_name='users')
     op.drop_table('users')
     op.drop_table('categories')
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731054908
-
-Revision ID: dc87669acd11
-Revises: 181f96524b98
-Create Date: 2025-07-31 05:49:09.409807
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'dc87669acd11'
-down_revision: Union[str, Sequence[str], None] = '181f96524b98'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731060753
-
-Revision ID: e298086874ec
-Revises: dc87669acd11
-Create Date: 2025-07-31 06:07:55.230369
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e298086874ec'
-down_revision: Union[str, Sequence[str], None] = 'dc87669acd11'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250801013829
-
-Revision ID: e396e6bb0f59
-Revises: b374dcfe64fe
-Create Date: 2025-08-01 01:38:33.903893
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e396e6bb0f59'
-down_revision: Union[str, Sequence[str], None] = 'b374dcfe64fe'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
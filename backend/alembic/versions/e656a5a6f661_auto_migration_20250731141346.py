@@ -1,32 +0,0 @@
-"""auto migration 20250731141346
-
-Revision ID: e656a5a6f661
-Revises: 1f3927f91161
-Create Date: 2025-07-31 14:13:48.856980
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'e656a5a6f661'
-down_revision: Union[str, Sequence[str], None] = '1f3927f91161'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
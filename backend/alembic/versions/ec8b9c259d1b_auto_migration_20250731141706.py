@@ -1,32 +0,0 @@
-"""auto migration 20250731141706
-
-Revision ID: ec8b9c259d1b
-Revises: e656a5a6f661
-Create Date: 2025-07-31 14:17:10.186235
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ec8b9c259d1b'
-down_revision: Union[str, Sequence[str], None] = 'e656a5a6f661'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729151121
-
-Revision ID: edd281cd9bf2
-Revises: d43cc0a68af8
-Create Date: 2025-07-29 15:11:23.316268
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'edd281cd9bf2'
-down_revision: Union[str, Sequence[str], None] = 'd43cc0a68af8'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731131513
-
-Revision ID: ee73e861bf80
-Revises: caf1ffc87eb7
-Create Date: 2025-07-31 13:15:16.144038
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ee73e861bf80'
-down_revision: Union[str, Sequence[str], None] = 'caf1ffc87eb7'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250729124804
-
-Revision ID: eebf2d0124da
-Revises: f0d40dcde6c1
-Create Date: 2025-07-29 12:48:06.988531
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'eebf2d0124da'
-down_revision: Union[str, Sequence[str], None] = 'f0d40dcde6c1'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731153119
-
-Revision ID: efa3b189f046
-Revises: 4a51dcbfe8fd
-Create Date: 2025-07-31 15:31:21.396669
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'efa3b189f046'
-down_revision: Union[str, Sequence[str], None] = '4a51dcbfe8fd'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731140533
-
-Revision ID: f02e20f17b08
-Revises: c4d973987179
-Create Date: 2025-07-31 14:05:36.602953
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f02e20f17b08'
-down_revision: Union[str, Sequence[str], None] = 'c4d973987179'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
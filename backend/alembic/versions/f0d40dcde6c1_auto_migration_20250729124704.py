@@ -1,32 +0,0 @@
-"""auto migration 20250729124704
-
-Revision ID: f0d40dcde6c1
-Revises: 5675a472e450
-Create Date: 2025-07-29 12:47:05.871432
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f0d40dcde6c1'
-down_revision: Union[str, Sequence[str], None] = '5675a472e450'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731143351
-
-Revision ID: f0d7087fc98a
-Revises: 735a666a3bee
-Create Date: 2025-07-31 14:33:54.601588
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f0d7087fc98a'
-down_revision: Union[str, Sequence[str], None] = '735a666a3bee'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730060228
-
-Revision ID: f126b959ac71
-Revises: 8cac5361365c
-Create Date: 2025-07-30 06:02:29.905664
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f126b959ac71'
-down_revision: Union[str, Sequence[str], None] = '8cac5361365c'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730061904
-
-Revision ID: f48f554cbf20
-Revises: 721f5d065ce4
-Create Date: 2025-07-30 06:19:05.897915
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f48f554cbf20'
-down_revision: Union[str, Sequence[str], None] = '721f5d065ce4'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730061009
-
-Revision ID: f63676314297
-Revises: 2858c4daa8ff
-Create Date: 2025-07-30 06:10:10.735754
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f63676314297'
-down_revision: Union[str, Sequence[str], None] = '2858c4daa8ff'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250730101455
-
-Revision ID: f734bec9756c
-Revises: d33de49d868f
-Create Date: 2025-07-30 10:14:58.077231
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'f734bec9756c'
-down_revision: Union[str, Sequence[str], None] = 'd33de49d868f'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
@@ -1,32 +0,0 @@
-"""auto migration 20250731125717
-
-Revision ID: ffc63250741d
-Revises: bb05b0e1873d
-Create Date: 2025-07-31 12:57:20.612406
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'ffc63250741d'
-down_revision: Union[str, Sequence[str], None] = 'bb05b0e1873d'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
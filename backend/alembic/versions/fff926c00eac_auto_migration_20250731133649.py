@@ -1,32 +0,0 @@
-"""auto migration 20250731133649
-
-Revision ID: fff926c00eac
-Revises: b05607931791
-Create Date: 2025-07-31 13:36:52.707735
-
-"""
-from typing import Sequence, Union
-
-from alembic import op
-import sqlalchemy as sa
-
-
-# revision identifiers, used by Alembic.
-revision: str = 'fff926c00eac'
-down_revision: Union[str, Sequence[str], None] = 'b05607931791'
-branch_labels: Union[str, Sequence[str], None] = None
-depends_on: Union[str, Sequence[str], None] = None
-
-
-def upgrade() -> None:
-    """Upgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
-
-
-def downgrade() -> None:
-    """Downgrade schema."""
-    # ### commands auto generated by Alembic - please adjust! ###
-    pass
-    # ### end Alembic commands ###
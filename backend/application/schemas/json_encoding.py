@@ -0,0 +1,13 @@
+# [file] application / schemas / json_encoding.py
+# [description] 이미 검증된 응답 스키마를 orjson 으로 바로 직렬화 (pydantic 재검증/재인코딩 생략)
+import orjson
+from pydantic import BaseModel
+
+def _model_fields(obj):
+    # BaseModel 은 필드 dict 를 그대로 넘겨 orjson 이 재귀적으로 직렬화 (선언 순서 유지)
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f"JSON 직렬화 불가 타입: {type(obj).__name__}")
+
+def dumps(obj) -> bytes:
+    return orjson.dumps(obj, default=_model_fields)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional
 
 class RecommendationItem(BaseModel):
@@ -10,4 +10,13 @@ class RecommendationItem(BaseModel):
 
 class RecommendationResponse(BaseModel):
     user_nickname: Optional[str]
-    recommendations: List[RecommendationItem]
\ No newline at end of file
+    recommendations: List[RecommendationItem]
+
+class UserRecommendationResponse(RecommendationResponse):
+    user_id: int
+
+class BatchRecommendationRequest(BaseModel):
+    user_ids: List[int] = []                 # 지정한 사용자들
+    user_id_from: Optional[int] = None       # 또는 ID 범위 (양 끝 포함)
+    user_id_to: Optional[int] = None
+    limit: int = Field(4, ge=1, le=20)       # 사용자별 추천 상품 수
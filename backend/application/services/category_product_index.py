@@ -0,0 +1,224 @@
+# [file] application / category_product_index.py
+# [description] 카테고리별 최신 미판매 상품 N개(첫 이미지 포함)를 메모리에 유지하는 홈 추천용 인덱스
+import os
+import threading
+import time
+import zlib
+from datetime import datetime
+from sqlalchemy import event, func, or_
+from sqlalchemy.orm import Session
+from infra.db_models.product import Product, ProductImage, Category
+from application.schemas.recommendation import RecommendationItem
+
+CATEGORY_INDEX_SIZE = int(os.getenv("CATEGORY_INDEX_SIZE", 20))                          # 카테고리별 유지할 상품 수
+CATEGORY_INDEX_REFRESH_INTERVAL = int(os.getenv("CATEGORY_INDEX_REFRESH_INTERVAL", 30))  # 증분 갱신 주기 (초)
+
+def _unsold():
+    return or_(Product.is_sold.is_(False), Product.is_sold.is_(None))
+
+class CategoryProductIndex:
+    """
+    - category_id(name): 대소문자 무시 정확 일치 카테고리명 → categories.id
+    - products(category_id): 최신순 미판매 상품 RecommendationItem 목록 (최대 size 개)
+    - ensure_fresh(): 최초 호출 시 전체 구축, 이후 refresh_interval 마다 (또는 상품 변경 감지 시) 증분 갱신
+      1) 마지막으로 본 id 이후 새 상품 반영
+      2) 인덱스에 있는 상품 중 판매된 상품 제거 후 해당 카테고리만 다시 채움
+      3) 이미지가 없던 상품의 첫 이미지 보충
+    - 조회 경로는 잠금 없이 dict 참조만 읽고, 갱신은 카테고리별 새 리스트로 교체
+    - digest_for(category_ids) / changed_at(category_ids): 해당 카테고리 상품 목록의 내용 해시 / 마지막 변경 시각
+      (홈 응답 캐시가 자기 카테고리가 바뀌었는지 확인하는 데 사용)
+    """
+    def __init__(self, size=CATEGORY_INDEX_SIZE, refresh_interval=CATEGORY_INDEX_REFRESH_INTERVAL):
+        self.size = size
+        self.refresh_interval = refresh_interval
+        self.version = 0
+        self.digest = None  # 인덱스 내용 해시 (프로세스/워커가 달라도 DB 상태가 같으면 같은 값 → ETag 에 사용)
+        self._by_category = {}
+        self._category_digests = {}
+        self._changed_at = {}
+        self._category_ids = {}
+        self._max_product_id = None
+        self._checked_at = 0.0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def category_id(self, name):
+        return self._category_ids.get(name.strip().casefold())
+
+    def products(self, category_id):
+        return self._by_category.get(category_id, [])
+
+    def digest_for(self, category_ids):
+        content = ",".join(f"{category_id}:{self._category_digests.get(category_id, 0):08x}" for category_id in category_ids)
+        return f"{zlib.crc32(content.encode()):08x}"
+
+    def changed_at(self, category_ids):
+        stamps = [self._changed_at[category_id] for category_id in category_ids if category_id in self._changed_at]
+        return max(stamps) if stamps else None
+
+    def mark_dirty(self):
+        self._dirty = True
+
+    def needs_refresh(self):
+        return self._max_product_id is None or self._dirty \
+            or time.monotonic() - self._checked_at >= self.refresh_interval
+
+    def ensure_fresh(self, db: Session):
+        if not self.needs_refresh():
+            return
+        now = time.monotonic()
+        if not self._lock.acquire(blocking=self._max_product_id is None):
+            return  # 다른 스레드가 갱신 중 → 기존 인덱스 사용
+        try:
+            self._checked_at = now
+            self._dirty = False
+            if self._max_product_id is None:
+                self._build(db)
+            else:
+                self._refresh(db)
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        return {
+            "version": self.version,
+            "digest": self.digest,
+            "categories": len(self._by_category),
+            "products": sum(len(items) for items in self._by_category.values()),
+            "size": self.size,
+            "max_product_id": self._max_product_id,
+        }
+
+    def _build(self, db: Session):
+        self._load_categories(db)
+        max_product_id = db.query(func.max(Product.id)).scalar() or 0
+        self._by_category = self._load_newest(db)
+        self._max_product_id = max_product_id
+        self._bump(self._by_category)
+
+    def _refresh(self, db: Session):
+        self._load_categories(db)
+        changed = {}
+
+        # 1) 새 상품
+        new_products = db.query(Product.id, Product.category_id, Product.title, Product.price)\
+            .filter(Product.id > self._max_product_id, Product.category_id.isnot(None), _unsold())\
+            .order_by(Product.id)\
+            .all()
+        if new_products:
+            images = self._first_images(db, [p.id for p in new_products])
+            for p in new_products:
+                items = changed.get(p.category_id, list(self.products(p.category_id)))
+                if any(item.product_id == p.id for item in items):
+                    continue
+                items.insert(0, self._to_item(p, images.get(p.id)))
+                changed[p.category_id] = items[:self.size]
+            self._max_product_id = new_products[-1].id
+
+        # 2) 판매된 상품 제거 → 해당 카테고리 다시 채움
+        indexed_ids = [item.product_id for items in self._by_category.values() for item in items]
+        sold_ids = set()
+        for start in range(0, len(indexed_ids), 1000):
+            sold_ids.update(product_id for product_id, in db.query(Product.id)
+                            .filter(Product.id.in_(indexed_ids[start:start + 1000]), Product.is_sold.is_(True)))
+        refill = {category_id for category_id, items in self._by_category.items()
+                  if any(item.product_id in sold_ids for item in items)}
+        if refill:
+            changed.update(self._load_newest(db, refill))
+
+        # 3) 이미지 보충
+        missing = [item.product_id for items in self._by_category.values() for item in items
+                   if item.image_url is None and item.category_id not in changed]
+        if missing:
+            images = self._first_images(db, missing)
+            for category_id, items in self._by_category.items():
+                if category_id in changed or not any(item.product_id in images for item in items):
+                    continue
+                changed[category_id] = [
+                    item.model_copy(update={"image_url": images[item.product_id]})
+                    if item.product_id in images else item
+                    for item in items
+                ]
+
+        if changed:
+            self._by_category = {**self._by_category, **changed}
+            self._bump(changed)
+
+    def _bump(self, changed):
+        now = datetime.utcnow()
+        self._category_digests = {**self._category_digests, **{
+            category_id: zlib.crc32(",".join(f"{item.product_id}/{item.image_url or ''}"
+                                             for item in self._by_category.get(category_id, [])).encode())
+            for category_id in changed
+        }}
+        self._changed_at = {**self._changed_at, **{category_id: now for category_id in changed}}
+        content = ";".join(
+            f"{category_id}:" + ",".join(f"{item.product_id}/{item.image_url or ''}" for item in items)
+            for category_id, items in sorted(self._by_category.items())
+        )
+        self.digest = f"{zlib.crc32(content.encode()):08x}"
+        self.version += 1
+
+    def _load_categories(self, db: Session):
+        # 카테고리명 → id: 대소문자 무시 정확 일치 (backendMl save_recommendations.load_category_ids 와 같은 규칙, 같은 이름이면 큰 id)
+        self._category_ids = {name.casefold(): category_id
+                              for category_id, name in db.query(Category.id, Category.name).order_by(Category.id)}
+
+    def _load_newest(self, db: Session, category_ids=None):
+        """
+        카테고리별 최신 미판매 상품 size 개 (ROW_NUMBER 윈도우 한 번) + 첫 이미지
+        """
+        ranked = db.query(
+            Product.id, Product.category_id, Product.title, Product.price,
+            func.row_number().over(
+                partition_by=Product.category_id,
+                order_by=(Product.created_at.desc(), Product.id.desc())
+            ).label("rank")
+        ).filter(Product.category_id.isnot(None), _unsold())
+        if category_ids is not None:
+            ranked = ranked.filter(Product.category_id.in_(category_ids))
+        ranked = ranked.subquery()
+
+        rows = db.query(ranked.c.id, ranked.c.category_id, ranked.c.title, ranked.c.price)\
+            .filter(ranked.c.rank <= self.size)\
+            .order_by(ranked.c.category_id, ranked.c.rank)\
+            .all()
+        images = self._first_images(db, [row.id for row in rows])
+
+        by_category = {category_id: [] for category_id in (category_ids or [])}
+        for row in rows:
+            by_category.setdefault(row.category_id, []).append(self._to_item(row, images.get(row.id)))
+        return by_category
+
+    @staticmethod
+    def _first_images(db: Session, product_ids):
+        """
+        상품별 첫 이미지 (가장 작은 product_images.id) → {product_id: image_url}
+        """
+        images = {}
+        for start in range(0, len(product_ids), 1000):
+            first = db.query(func.min(ProductImage.id))\
+                .filter(ProductImage.product_id.in_(product_ids[start:start + 1000]))\
+                .group_by(ProductImage.product_id)
+            images.update(db.query(ProductImage.product_id, ProductImage.image_url)
+                          .filter(ProductImage.id.in_(first)))
+        return images
+
+    @staticmethod
+    def _to_item(row, image_url):
+        return RecommendationItem(
+            category_id=row.category_id,
+            product_id=row.id,
+            title=row.title,
+            price=float(row.price),
+            image_url=image_url
+        )
+
+# 프로세스 전역 인덱스
+category_product_index = CategoryProductIndex()
+
+# 이 프로세스에서 상품이 생성/수정(판매)되면 다음 조회 때 바로 증분 갱신
+@event.listens_for(Product, "after_insert")
+@event.listens_for(Product, "after_update")
+def _mark_category_index_dirty(mapper, connection, target):
+    category_product_index.mark_dirty()
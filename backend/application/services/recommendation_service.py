@@ -1,9 +1,225 @@
 # [file] application / recommendation_service.py
-from sqlalchemy.orm import Session, joinedload
-from infra.db_models.recommendation import Recommendation
-from infra.db_models.product import Product, Category
+import os
+import asyncio
+import threading
+import time
+import zlib
+import orjson
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from infra.db_models.recommendation import LatestRecommendation, RecommendationPayload
 from infra.db_models.user import User
-from application.schemas.recommendation import RecommendationResponse, RecommendationItem
+from application.schemas.recommendation import RecommendationResponse, RecommendationItem, UserRecommendationResponse
+from application.schemas.json_encoding import dumps
+from application.services.category_product_index import category_product_index
+from infra.cache.ttl_lru_cache import TTLLRUCache
+
+HOME_CACHE_TTL = int(os.getenv("HOME_CACHE_TTL", 600))                # 홈 추천 응답 캐시 유지 시간 (초)
+HOME_CACHE_MAXSIZE = int(os.getenv("HOME_CACHE_MAXSIZE", 10000))      # 캐시할 최대 사용자 수
+GENERATED_AT_CHECK_INTERVAL = int(os.getenv("GENERATED_AT_CHECK_INTERVAL", 30))  # 새 추천 결과 확인 주기 (초)
+BATCH_CHUNK_SIZE = 500          # 배치 조회 시 IN 쿼리 한 번에 처리할 사용자 수
+BATCH_MAX_USERS = 100000        # 배치 요청 한 번에 허용하는 최대 사용자 수
+
+home_cache = TTLLRUCache(maxsize=HOME_CACHE_MAXSIZE, ttl=HOME_CACHE_TTL)
+
+# 마지막으로 확인한 latest_recommendations.generated_at 최댓값 (프로세스 공유)
+_generated_at_state = {"max_generated_at": None, "checked_at": 0.0}
+_generated_at_lock = threading.Lock()
+
+# async 경로에서 인덱스 갱신을 코루틴 간 직렬화 (갱신 중인 코루틴이 await 하는 동안 다른 코루틴이 threading 잠금에서 이벤트 루프를 막지 않도록)
+_index_refresh_lock = asyncio.Lock()
+
+@dataclass(frozen=True)
+class HomePayload:
+    body: bytes                        # 응답 JSON
+    etag: str
+    last_modified: Optional[datetime]  # 추천 generated_at 과 추천 카테고리 상품 목록 변경 시각 중 늦은 값 (UTC)
+    category_ids: tuple = ()           # 응답을 만든 추천 카테고리 (순위순)
+    index_digest: Optional[str] = None # 응답을 만들 때의 해당 카테고리 인덱스 해시 → 바뀌면 캐시 항목 폐기
+
+@dataclass(frozen=True)
+class HomeSource:
+    user_nickname: Optional[str]
+    category_ids: tuple                # 순위별 추천 카테고리 id
+    generated_at: Optional[datetime]
+
+def make_etag(user_id: int, generated_at: Optional[datetime], body: bytes) -> str:
+    """
+    ETag = 사용자 + 추천 생성 시각 + 응답 본문 해시 (본문을 만든 경로와 무관하게 본문이 같으면 같은 값, 워커 간에도 동일)
+    """
+    stamp = int(generated_at.replace(tzinfo=timezone.utc).timestamp()) if generated_at else 0
+    return f'W/"{user_id}-{stamp}-{zlib.crc32(body):08x}"'
+
+def is_not_modified(home: HomePayload, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+    """
+    If-None-Match 가 있으면 ETag 비교 (약한 비교), 없으면 If-Modified-Since 와 Last-Modified 비교
+    """
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or home.etag.removeprefix("W/") in candidates
+    if if_modified_since and home.last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since).replace(tzinfo=None)
+        except (TypeError, ValueError):
+            return False
+        return home.last_modified.replace(microsecond=0) <= since
+    return False
+
+def is_current(home: HomePayload) -> bool:
+    """
+    캐시 항목의 추천 카테고리 상품 목록이 인덱스에서 바뀌지 않았는지 (다른 카테고리 변경은 무시)
+    """
+    return home.index_digest == category_product_index.digest_for(home.category_ids)
+
+def get_home_recommendations(db: Session, user_id: int) -> HomePayload:
+    """
+    /recommendations/home 응답 (user_id 단위 캐시, 조건부 요청 비교는 라우터에서)
+    1. GENERATED_AT_CHECK_INTERVAL 마다 한 번, 추천이 새로 생성된 사용자의 캐시를 무효화
+    2. 캐시에 있고 추천 카테고리 상품 목록이 그대로면 DB 조회 없이 반환
+    3. 없으면 build_home → 캐시에 저장
+    """
+    invalidate_regenerated_users(db)
+    category_product_index.ensure_fresh(db)
+
+    cached = home_cache.get(user_id)
+    if cached is not None and is_current(cached):
+        return cached
+
+    home = build_home(db, user_id)
+    home_cache.set(user_id, home)
+    return home
+
+async def get_home_recommendations_async(db: AsyncSession, user_id: int) -> HomePayload:
+    """
+    get_home_recommendations 의 비동기 버전 (같은 캐시/인덱스 공유)
+    """
+    await db.run_sync(invalidate_regenerated_users)
+    await ensure_index_fresh_async(db)
+
+    cached = home_cache.get(user_id)
+    if cached is not None and is_current(cached):
+        return cached
+
+    home = await db.run_sync(build_home, user_id)
+    home_cache.set(user_id, home)
+    return home
+
+def build_home(db: Session, user_id: int, limit: int = 4) -> HomePayload:
+    """
+    응답 본문 + 검증자
+    1. 닉네임 / 추천 카테고리 조회 (load_home_source)
+    2. 상품 구성 (메모리 카테고리 인덱스) → orjson 직렬화
+    3. ETag 는 본문 해시, Last-Modified 는 추천 생성 시각과 추천 카테고리 상품 변경 시각 중 늦은 값
+    """
+    source = load_home_source(db, user_id)
+    if source is None:
+        category_ids = ()
+        response = RecommendationResponse(user_nickname=None, recommendations=[])
+    else:
+        category_ids = source.category_ids
+        # 인덱스의 RecommendationItem 은 생성 시 검증됨 → 재검증 없이 구성
+        response = RecommendationResponse.model_construct(
+            user_nickname=source.user_nickname,
+            recommendations=get_diversified_products(list(category_ids), limit)
+        )
+    body = dumps(response)
+
+    generated_at = source.generated_at if source else None
+    stamps = [stamp for stamp in (generated_at, category_product_index.changed_at(category_ids)) if stamp]
+    return HomePayload(
+        body=body,
+        etag=make_etag(user_id, generated_at, body),
+        last_modified=max(stamps) if stamps else None,
+        category_ids=category_ids,
+        index_digest=category_product_index.digest_for(category_ids),
+    )
+
+def load_home_source(db: Session, user_id: int) -> Optional[HomeSource]:
+    """
+    응답을 만드는 입력 (사용자가 없으면 None)
+    1. ML 배치가 미리 풀어 둔 payload(닉네임 + 추천 카테고리) 가 latest_recommendations 보다 오래되지 않았으면 사용 (쿼리 1번)
+    2. 없으면 users / latest_recommendations 조회 (이전 형식은 카테고리명 → id)
+    - 상품은 어느 경우에도 저장하지 않음: 요청 시점의 category_product_index 에서 구성 → 배치 후 판매된 상품 제외
+    """
+    row = db.execute(stored_payload_query(user_id)).first()
+    if row is not None:
+        stored = orjson.loads(row.payload)
+        if "category_ids" in stored:
+            return HomeSource(stored["user_nickname"], tuple(stored["category_ids"]), row.generated_at)
+
+    user = db.execute(select(User.id, User.nickname).where(User.id == user_id)).first()
+    if user is None:
+        return None
+    recommendation = db.get(LatestRecommendation, user_id)
+    if not recommendation:
+        return HomeSource(user.nickname, (), None)
+    return HomeSource(user.nickname, tuple(get_recommended_category_ids(recommendation)), recommendation.generated_at)
+
+async def ensure_index_fresh_async(db: AsyncSession):
+    if category_product_index.needs_refresh():
+        async with _index_refresh_lock:
+            await db.run_sync(category_product_index.ensure_fresh)
+
+def stored_payload_query(user_id: int):
+    """
+    미리 풀어 둔 닉네임 / 추천 카테고리 payload + generated_at(= 저장 당시 latest_recommendations 값) 조회 (ORM 객체 생성 없음)
+    - 추천 저장 후 직렬화가 끝나기 전의 이전 payload 는 사용하지 않음 (generated_at 비교)
+    """
+    return select(RecommendationPayload.payload, RecommendationPayload.generated_at)\
+        .outerjoin(LatestRecommendation, LatestRecommendation.user_id == RecommendationPayload.user_id)\
+        .where(
+            RecommendationPayload.user_id == user_id,
+            or_(
+                LatestRecommendation.generated_at.is_(None),
+                RecommendationPayload.generated_at >= LatestRecommendation.generated_at
+            )
+        )
+
+def invalidate_regenerated_users(db: Session) -> int:
+    """
+    마지막 확인 이후 generated_at 이 앞으로 간 사용자의 캐시 항목 제거
+    - 주기 내 재호출이나 다른 스레드가 확인 중일 때는 바로 반환 → 요청당 추가 쿼리 없음
+    - 변경 사용자가 캐시 크기보다 많으면 (배치 전체 갱신) 캐시를 통째로 비움
+
+    Returns:
+        int - 무효화한 사용자 수
+    """
+    now = time.monotonic()
+    if now - _generated_at_state["checked_at"] < GENERATED_AT_CHECK_INTERVAL:
+        return 0
+    if not _generated_at_lock.acquire(blocking=False):
+        return 0
+    try:
+        _generated_at_state["checked_at"] = now
+        last = _generated_at_state["max_generated_at"]
+
+        # 최초 확인: 기준 시각만 기록 (이 시점의 캐시는 비어 있음)
+        if last is None:
+            max_generated_at = db.query(func.max(LatestRecommendation.generated_at)).scalar()
+            _generated_at_state["max_generated_at"] = max_generated_at or datetime.min
+            return 0
+
+        changed = db.query(LatestRecommendation.user_id, LatestRecommendation.generated_at)\
+            .filter(LatestRecommendation.generated_at > last)\
+            .all()
+        if not changed:
+            return 0
+
+        changed_users = {user_id for user_id, _ in changed}
+        if len(changed_users) >= home_cache.maxsize:
+            home_cache.clear()
+        else:
+            for user_id in changed_users:
+                home_cache.invalidate(user_id)
+        _generated_at_state["max_generated_at"] = max(generated_at for _, generated_at in changed)
+        return len(changed_users)
+    finally:
+        _generated_at_lock.release()
 
 def get_recommendation_products_with_user(db: Session, user_id: int, limit: int = 4) -> RecommendationResponse:
     user = db.query(User).filter(User.id == user_id).first()
@@ -12,44 +228,124 @@ def get_recommendation_products_with_user(db: Session, user_id: int, limit: int
 
     user_nickname = user.nickname
 
-    recommendation = db.query(Recommendation)\
-        .filter(Recommendation.user_id == user_id)\
-        .order_by(Recommendation.generated_at.desc())\
-        .first()
+    recommendation = db.get(LatestRecommendation, user_id)
 
     if not recommendation:
         return RecommendationResponse(user_nickname=user_nickname, recommendations=[])
 
-    recommended_texts = [text.strip() for text in recommendation.recommended_items.split(",") if text.strip()]
-    if not recommended_texts:
+    category_product_index.ensure_fresh(db)
+    category_ids = get_recommended_category_ids(recommendation)
+    if not category_ids:
         return RecommendationResponse(user_nickname=user_nickname, recommendations=[])
 
-    first_text = recommended_texts[0]
+    result = get_diversified_products(category_ids, limit)
+
+    # 인덱스의 RecommendationItem 은 생성 시 검증됨 → 재검증 없이 구성
+    return RecommendationResponse.model_construct(user_nickname=user_nickname, recommendations=result)
 
-    matched_category = db.query(Category)\
-        .filter(Category.name.ilike(f"%{first_text}%"))\
-        .first()
-    if not matched_category:
+async def get_recommendation_products_with_user_async(db: AsyncSession, user_id: int, limit: int = 4) -> RecommendationResponse:
+    user = await db.scalar(select(User).where(User.id == user_id))
+    if not user:
+        return RecommendationResponse(user_nickname=None, recommendations=[])
+
+    user_nickname = user.nickname
+
+    recommendation = await db.get(LatestRecommendation, user_id)
+
+    if not recommendation:
         return RecommendationResponse(user_nickname=user_nickname, recommendations=[])
 
-    category_id = matched_category.id
-
-    recommended_products = db.query(Product)\
-        .options(joinedload(Product.images))\
-        .filter(Product.category_id == category_id)\
-        .order_by(Product.created_at.desc())\
-        .limit(limit)\
-        .all()
-
-    result = [
-        RecommendationItem(
-            category_id=category_id,
-            product_id=p.id,
-            title=p.title,
-            price=float(p.price),
-            image_url=p.images[0].image_url if p.images else None
-        )
-        for p in recommended_products
-    ]
+    await ensure_index_fresh_async(db)
+    category_ids = get_recommended_category_ids(recommendation)
+    if not category_ids:
+        return RecommendationResponse(user_nickname=user_nickname, recommendations=[])
+
+    result = get_diversified_products(category_ids, limit)
+
+    # 인덱스의 RecommendationItem 은 생성 시 검증됨 → 재검증 없이 구성
+    return RecommendationResponse.model_construct(user_nickname=user_nickname, recommendations=result)
+
+async def iter_batch_recommendations_async(db: AsyncSession, user_ids=None, user_id_from=None, user_id_to=None,
+                                           limit: int = 4, chunk_size: int = BATCH_CHUNK_SIZE):
+    """
+    여러 사용자의 홈 추천을 chunk_size 명 단위 집합 쿼리로 조회해 사용자별로 yield
+    1. user_ids 가 있으면 (중복 제거, 순서 유지) 그대로, 없으면 user_id_from~user_id_to 범위의 사용자를 id 순 keyset 페이징
+    2. chunk 마다 users / latest_recommendations 를 IN 쿼리 한 번씩 조회
+    3. 상품은 category_product_index 에서 조회 (DB 접근 없음)
+    - 존재하지 않는 user_id 는 user_nickname=None, 빈 추천으로 반환
+    """
+    await ensure_index_fresh_async(db)
+
+    async for chunk, nicknames in _iter_user_chunks(db, user_ids, user_id_from, user_id_to, chunk_size):
+        latest = {
+            rec.user_id: rec
+            for rec in await db.scalars(select(LatestRecommendation).where(LatestRecommendation.user_id.in_(chunk)))
+        }
+        for user_id in chunk:
+            recommendation = latest.get(user_id)
+            category_ids = get_recommended_category_ids(recommendation) if recommendation else []
+            yield UserRecommendationResponse.model_construct(
+                user_id=user_id,
+                user_nickname=nicknames.get(user_id),
+                recommendations=get_diversified_products(category_ids, limit) if user_id in nicknames else []
+            )
+
+async def _iter_user_chunks(db: AsyncSession, user_ids, user_id_from, user_id_to, chunk_size):
+    """
+    (user_id 목록, {user_id: nickname}) 을 chunk 단위로 yield
+    """
+    if user_ids:
+        user_ids = list(dict.fromkeys(user_ids))
+        for start in range(0, len(user_ids), chunk_size):
+            chunk = user_ids[start:start + chunk_size]
+            rows = await db.execute(select(User.id, User.nickname).where(User.id.in_(chunk)))
+            yield chunk, dict(rows.all())
+        return
+
+    last_id = user_id_from - 1
+    while True:
+        rows = (await db.execute(
+            select(User.id, User.nickname)
+            .where(User.id > last_id, User.id <= user_id_to)
+            .order_by(User.id)
+            .limit(chunk_size)
+        )).all()
+        if not rows:
+            return
+        nicknames = dict(rows)
+        yield list(nicknames), nicknames
+        last_id = rows[-1][0]
+
+def get_recommended_category_ids(recommendation: LatestRecommendation) -> list[int]:
+    """
+    추천 카테고리 ID 목록 (점수 내림차순)
+    1. recommended_categories([[category_id, score], ...]) 가 있으면 그대로 사용
+    2. 없으면 (이전 형식) recommended_items 문자열을 쉼표로 나눠 카테고리명(대소문자 무시 정확 일치)으로 조회
+    """
+    if recommendation.recommended_categories:
+        return [int(category_id) for category_id, _ in recommendation.recommended_categories]
+
+    recommended_texts = [text.strip() for text in recommendation.recommended_items.split(",") if text.strip()]
+    category_ids = []
+    for text in recommended_texts:
+        category_id = category_product_index.category_id(text)
+        if category_id is not None and category_id not in category_ids:
+            category_ids.append(category_id)
+    return category_ids
+
+def get_diversified_products(category_ids: list[int], limit: int) -> list[RecommendationItem]:
+    """
+    추천 카테고리별 최신 미판매 상품(category_product_index)을 카테고리 순서대로 번갈아 뽑아 limit 개 구성
+    - 1순위 카테고리 상품이 부족하면 다음 카테고리 상품으로 채워짐
+    """
+    by_category = [category_product_index.products(category_id) for category_id in category_ids]
 
-    return RecommendationResponse(user_nickname=user_nickname, recommendations=result)
\ No newline at end of file
+    # 라운드 로빈: (1순위 1번째, 2순위 1번째, ..., 1순위 2번째, ...)
+    result = []
+    for rank in range(limit):
+        for items in by_category:
+            if rank < len(items):
+                result.append(items[rank])
+                if len(result) == limit:
+                    return result
+    return result
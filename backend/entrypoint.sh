@@ -1,5 +1,12 @@
 #!/bin/bash
 
+# 컨테이너 시작 시각 (main.py 에서 워커별 기동 시간 / 첫 요청까지 시간 로그에 사용)
+export BOOT_T0=$(date +%s.%N)
+
+# APP_ENV=production: 마이그레이션 적용만 하고 reload 없이 gunicorn 멀티 워커로 기동
+# 그 외(기본 development): 기존처럼 autogenerate + --reload
+APP_ENV=${APP_ENV:-development}
+
 echo "[ENTRYPOINT] Waiting for database..."
 for i in {1..15}; do
   mysqladmin ping -h"$DB_HOST" -P"$DB_PORT" -u"$DB_USER" -p"$DB_PASSWORD" > /dev/null 2>&1 && break
@@ -7,9 +14,15 @@ for i in {1..15}; do
   sleep 1
 done
 
-# echo "[ENTRYPOINT] Running Alembic migrations..."
-# 최신 마이그레이션 스크립트를 실행 [배포용]
-# alembic upgrade head
+if [ "$APP_ENV" = "production" ]; then
+  # 최신 마이그레이션 스크립트를 실행 [배포용] - 리비전은 개발 환경에서 만들어 커밋된 것만 사용
+  echo "[ENTRYPOINT] Running Alembic migrations..."
+  alembic upgrade head || exit 1
+
+  # 워커 수(WEB_CONCURRENCY, 기본: CPU 코어 수) / 워커별 DB 풀 크기는 gunicorn.conf.py, infra/db/db.py 참고
+  echo "[ENTRYPOINT] Starting FastAPI server (production, gunicorn)..."
+  exec gunicorn -c gunicorn.conf.py main:app
+fi
 
 echo "[ENTRYPOINT] Applying Alembic migrations first..."
 alembic upgrade head
@@ -22,4 +35,4 @@ echo "[ENTRYPOINT] Applying Alembic migrations after autogenerate..."
 alembic upgrade head
 
 echo "[ENTRYPOINT] Starting FastAPI server..."
-exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
\ No newline at end of file
+exec uvicorn main:app --host 0.0.0.0 --port 8000 --reload
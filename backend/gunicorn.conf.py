@@ -0,0 +1,24 @@
+# [file] gunicorn.conf.py
+# [description] 운영(APP_ENV=production) 서빙 설정: gunicorn 마스터 + UvicornWorker N개
+#
+# 실행: gunicorn -c gunicorn.conf.py main:app
+# - WEB_CONCURRENCY: 워커 수 (기본: CPU 코어 수)
+# - 워커 수를 환경변수로 내려보내 infra/db/db.py 가 DB_MAX_CONNECTIONS 를 워커별로 나눠 풀 크기를 정함
+# - preload_app 미사용: 엔진 커넥션 풀 / 메모리 캐시(home_cache, category_product_index)는 워커마다 새로 생성
+import multiprocessing
+import os
+
+workers = int(os.getenv("WEB_CONCURRENCY") or multiprocessing.cpu_count())
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = False
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 60))                # 응답 없는 워커 재시작 (초)
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -0,0 +1,70 @@
+# [file] infra/cache/ttl_lru_cache.py
+# [description] 프로세스 내 응답 캐시 (항목별 TTL 만료 + 최대 개수 초과 시 LRU 제거)
+import threading
+import time
+from collections import OrderedDict
+
+class TTLLRUCache:
+    """
+    - get(): 만료되지 않은 값이면 반환하고 가장 최근 사용으로 이동, 아니면 None
+    - set(): 저장 후 maxsize 를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 이벤트 루프 스레드의 async 홈 라우트(db.run_sync 로 호출되는 무효화 포함)와 스레드풀에서 도는 호출자
+      (동기 get_home_recommendations, 동기 라우트의 stats 조회)가 같은 인스턴스를 공유 → 모든 연산을 잠금으로 보호
+    """
+    def __init__(self, maxsize=10000, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key → (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._data.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._data)
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
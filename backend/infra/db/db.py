@@ -3,9 +3,10 @@
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from contextlib import contextmanager
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 load_dotenv()  # .env 강제 로드
 
@@ -14,9 +15,39 @@ DATABASE_URL = (
     f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
 )
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+ASYNC_DATABASE_URL = (
+    f"mysql+aiomysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@"
+    f"{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+)
+
+# 커넥션 풀 설정 (프로세스당)
+# - DB_MAX_CONNECTIONS: 이 앱 전체(모든 워커)가 사용할 MySQL 커넥션 상한 (MySQL 기본 max_connections=151, backendMl 기본 40 과 합쳐 그 이하)
+# - 워커 수(WEB_CONCURRENCY, gunicorn.conf.py 에서 설정) × 엔진 2개(동기/비동기)로 나눠 엔진당 기본 풀 크기 결정
+# - DB_POOL_SIZE / DB_MAX_OVERFLOW 를 직접 지정하면 그 값을 사용
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY") or 1)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 100))
+_engine_budget = max(2, DB_MAX_CONNECTIONS // (WEB_CONCURRENCY * 2))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", min(20, _engine_budget * 2 // 3)))                 # 상시 유지 커넥션 수
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", min(10, _engine_budget - DB_POOL_SIZE)))     # 순간 부하 시 추가 허용 커넥션 수
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))    # 커넥션 대기 최대 시간 (초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))  # MySQL wait_timeout 이전에 커넥션 재생성 (초)
+
+pool_args = dict(
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+)
+
+engine = create_engine(DATABASE_URL, **pool_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (aiomysql) - async 라우터 전용
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_args)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db() -> Generator[Session, None, None]:
@@ -24,4 +55,8 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
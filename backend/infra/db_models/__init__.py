@@ -2,4 +2,4 @@ from .user import User, UserProfile, Address
 from .product import Product, ProductImage, Category, ProductReview
 from .order import CartItem, Order, OrderItem
 from .coupon import Coupon, UserCoupon
-from .recommendation import Recommendation
\ No newline at end of file
+from .recommendation import Recommendation, LatestRecommendation, RecommendationPayload
\ No newline at end of file
@@ -1,6 +1,6 @@
 # [file] infra/db_models/recommendation.py
-# [description] DB recommendation (1) 추천 결과
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, Enum as SqlEnum
+# [description] DB recommendation (1) 추천 결과 이력, (2) 사용자별 최신 추천 결과, (3) 사용자별 직렬화된 홈 추천 응답
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Text, JSON, LargeBinary, Enum as SqlEnum
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from infra.db.db import Base
@@ -14,6 +14,8 @@ class Recommendation(Base):
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     recommended_items = Column(Text, nullable=False)
+    # 점수 내림차순 top-k [[category_id, score], ...] (없으면 recommended_items 문자열만 사용)
+    recommended_categories = Column(JSON, nullable=True)
     model_type = Column(
         SqlEnum(ModelType, name="model_type_enum"),
         nullable=False,
@@ -21,4 +23,35 @@ class Recommendation(Base):
     )
     generated_at = Column(DateTime, default=datetime.utcnow)
 
-    user = relationship("User", back_populates="recommendations")
\ No newline at end of file
+    user = relationship("User", back_populates="recommendations")
+
+
+class LatestRecommendation(Base):
+    """
+    사용자별 가장 최근 추천 결과 1건 (recommendations 이력을 정렬/스캔하지 않고 user_id 로 바로 조회)
+    - ML 배치가 recommendations 와 같은 값으로 함께 UPSERT
+    """
+    __tablename__ = "latest_recommendations"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, autoincrement=False)
+    recommended_items = Column(Text, nullable=False)
+    recommended_categories = Column(JSON, nullable=True)
+    model_type = Column(
+        SqlEnum(ModelType, name="model_type_enum"),
+        nullable=False,
+        default=ModelType.DEEP_LEARNING
+    )
+    generated_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class RecommendationPayload(Base):
+    """
+    사용자별 /recommendations/home 입력 JSON {"user_nickname", "category_ids"} (ML 배치가 추천 저장 직후 orjson 으로 저장)
+    - 이전 형식 레이블 해석까지 끝난 순위별 카테고리 id → backend 는 상품만 category_product_index 에서 구성
+    - 상품 목록은 저장하지 않음 (배치 이후 판매된 상품이 노출되지 않도록)
+    """
+    __tablename__ = "recommendation_payloads"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, autoincrement=False)
+    payload = Column(LargeBinary, nullable=False)
+    generated_at = Column(DateTime, default=datetime.utcnow)
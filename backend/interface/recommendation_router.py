@@ -1,15 +1,63 @@
 # [file] interface / recommendation_router.py
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from infra.db.db import get_db
-from application.services.recommendation_service import get_recommendation_products_with_user
-from application.schemas.recommendation import RecommendationResponse  
+from datetime import timezone
+from email.utils import format_datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from infra.db.db import get_async_db, AsyncSessionLocal
+from application.services.recommendation_service import (
+    get_home_recommendations_async, iter_batch_recommendations_async, is_not_modified, home_cache, BATCH_MAX_USERS,
+)
+from application.services.category_product_index import category_product_index
+from application.schemas.recommendation import RecommendationResponse, BatchRecommendationRequest
+from application.schemas.json_encoding import dumps
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 @router.get("/recommendations/home", response_model=RecommendationResponse)
-def homepage_recommendation(
+async def homepage_recommendation(
     user_id: int = Query(..., description="유저 ID"),
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    if_modified_since: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return get_recommendation_products_with_user(db, user_id)
\ No newline at end of file
+    home = await get_home_recommendations_async(db, user_id)
+
+    # 브라우저 캐시에 저장하되 매 방문마다 재검증 (변경 없으면 304, 본문 없음)
+    headers = {"ETag": home.etag, "Cache-Control": "private, no-cache"}
+    if home.last_modified:
+        headers["Last-Modified"] = format_datetime(home.last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+    if is_not_modified(home, if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
+
+    # 직렬화된 JSON bytes 를 그대로 응답 (response_model 은 문서용, 재검증/재인코딩 없음)
+    return Response(content=home.body, media_type="application/json", headers=headers)
+
+@router.post("/recommendations/batch")
+async def batch_recommendation(request: BatchRecommendationRequest):
+    """
+    여러 사용자의 홈 추천을 NDJSON (한 줄에 사용자 1명의 UserRecommendationResponse) 으로 스트리밍
+    - user_ids 또는 user_id_from ~ user_id_to 범위 중 하나 지정
+    """
+    if request.user_ids:
+        if len(request.user_ids) > BATCH_MAX_USERS:
+            raise HTTPException(status_code=400, detail=f"user_ids 는 최대 {BATCH_MAX_USERS}개까지 가능합니다.")
+    elif request.user_id_from is None or request.user_id_to is None:
+        raise HTTPException(status_code=400, detail="user_ids 또는 user_id_from/user_id_to 중 하나를 지정해야 합니다.")
+    elif not 0 <= request.user_id_to - request.user_id_from < BATCH_MAX_USERS:
+        raise HTTPException(status_code=400, detail=f"ID 범위는 최대 {BATCH_MAX_USERS}명까지 가능합니다.")
+
+    async def ndjson_lines():
+        # 스트리밍이 끝날 때까지 세션 유지 (의존성 세션은 응답 전송 전에 닫힘)
+        async with AsyncSessionLocal() as db:
+            async for response in iter_batch_recommendations_async(
+                db, request.user_ids, request.user_id_from, request.user_id_to, request.limit
+            ):
+                yield dumps(response) + b"\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+@router.get("/recommendations/cache/stats")
+def recommendation_cache_stats():
+    return {"home_cache": home_cache.stats(), "category_index": category_product_index.stats()}
\ No newline at end of file
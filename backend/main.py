@@ -1,9 +1,17 @@
 # main.py
+import logging
+import os
+import time
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from interface.recommendation_router import router as recommendation_router
 from fastapi.staticfiles import StaticFiles
 
+logger = logging.getLogger("uvicorn.error")
+
+# entrypoint.sh 가 export 한 컨테이너 시작 시각 (없으면 프로세스 import 시각)
+BOOT_T0 = float(os.getenv("BOOT_T0") or time.time())
+
 app = FastAPI(title="🧠 홈 추천 API")
 
 app.add_middleware(
@@ -12,7 +20,33 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified"],
 )
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
-app.include_router(recommendation_router)
\ No newline at end of file
+app.include_router(recommendation_router)
+
+class FirstRequestLogMiddleware:
+    """
+    워커별 첫 요청 완료 시점에 컨테이너 시작부터 걸린 시간(time-to-first-request)을 한 번만 기록
+    - 순수 ASGI 미들웨어: 첫 요청 이후에는 플래그 확인 후 그대로 전달 (BaseHTTPMiddleware 의 요청별 태스크/스트림 래핑 없음)
+    """
+    def __init__(self, app):
+        self.app = app
+        self.pending = True
+
+    async def __call__(self, scope, receive, send):
+        if not self.pending or scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        self.pending = False
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            logger.info(f"[BOOT] worker pid={os.getpid()} first request {scope['path']}: "
+                        f"{time.time() - BOOT_T0:.2f}s since container start")
+
+app.add_middleware(FirstRequestLogMiddleware)
+
+@app.on_event("startup")
+async def log_startup_time():
+    logger.info(f"[BOOT] worker pid={os.getpid()} ready: {time.time() - BOOT_T0:.2f}s since container start")
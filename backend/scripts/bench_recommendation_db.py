@@ -0,0 +1,104 @@
+# [file] scripts/bench_recommendation_db.py
+# [description] 홈 추천 조회의 동기(pymysql + 스레드풀) / 비동기(aiomysql + AsyncSession) 경로 처리량 비교
+#
+# 사용법 (backend 디렉토리, .env 의 DB 접속 정보 사용, httpx 필요):
+#   python -m scripts.bench_recommendation_db --concurrency 64 --duration 20 --user-ids 1-500
+#
+# - 응답 캐시를 거치지 않는 조회 함수를 직접 노출한 임시 앱을 띄워 DB 경로만 비교
+# - DB_POOL_SIZE / DB_MAX_OVERFLOW 환경변수를 바꿔가며 실행해 풀 크기를 조정
+#   (운영 기준: DB_POOL_SIZE=20 DB_MAX_OVERFLOW=10 python -m scripts.bench_recommendation_db ...)
+# - 측정 도구일 뿐 두 경로의 성능 우열을 전제하지 않음. MySQL(compose DB) 측정 결과는 아직 없으므로
+#   결과를 인용할 때는 출력 첫 줄의 서버 버전 / 풀 설정과 함께 기록
+import argparse
+import asyncio
+import random
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from infra.db.db import engine, get_db, get_async_db, DB_POOL_SIZE, DB_MAX_OVERFLOW
+from application.services.recommendation_service import (
+    get_recommendation_products_with_user, get_recommendation_products_with_user_async,
+)
+
+app = FastAPI()
+
+@app.get("/sync")
+def sync_recommendation(user_id: int = Query(...), db: Session = Depends(get_db)):
+    return get_recommendation_products_with_user(db, user_id)
+
+@app.get("/async")
+async def async_recommendation(user_id: int = Query(...), db: AsyncSession = Depends(get_async_db)):
+    return await get_recommendation_products_with_user_async(db, user_id)
+
+def parse_user_ids(text):
+    start, _, end = text.partition("-")
+    return list(range(int(start), int(end or start) + 1))
+
+async def run_load(base_url, path, user_ids, concurrency, duration):
+    """
+    concurrency 개의 클라이언트가 duration 초 동안 연속 요청 → (처리량, p50, p99, 오류 수)
+    """
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def client(http):
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await http.get(path, params={"user_id": random.choice(user_ids)})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+            except httpx.HTTPError:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as http:
+        await http.get(path, params={"user_id": user_ids[0]})  # 워밍업 (풀/인덱스 초기화)
+        started = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1000 if latencies else 0.0
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0
+    return len(latencies) / elapsed, p50, p99, errors
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=int, default=20)
+    parser.add_argument("--user-ids", default="1-100")
+    parser.add_argument("--port", type=int, default=8099)
+    args = parser.parse_args()
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    user_ids = parse_user_ids(args.user_ids)
+    base_url = f"http://127.0.0.1:{args.port}"
+    with engine.connect():
+        pass  # 첫 연결에서 dialect 가 서버 버전을 읽음 (SQL 함수 없이 방언 공통)
+    server_version = ".".join(map(str, engine.dialect.server_version_info or ())) or "unknown"
+    print(f"server={engine.dialect.name} {server_version}, pool_size={DB_POOL_SIZE}, max_overflow={DB_MAX_OVERFLOW}, "
+          f"concurrency={args.concurrency}, duration={args.duration}s")
+    for path in ("/sync", "/async"):
+        rps, p50, p99, errors = asyncio.run(run_load(base_url, path, user_ids, args.concurrency, args.duration))
+        print(f"{path:>6}: {rps:8.1f} req/s  p50={p50:6.1f}ms  p99={p99:6.1f}ms  errors={errors}")
+
+    server.should_exit = True
+    thread.join()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# [file] scripts/bench_serialization.py
+# [description] 홈 추천 응답 1건의 직렬화 비용 비교 (추천 상품 4 / 20 / 100개)
+#
+# 사용법 (backend 디렉토리):
+#   python -m scripts.bench_serialization --repeat 2000
+#
+# - fastapi_response_model: 기존 경로 (response_model 검증 → model_dump(mode="json") → JSONResponse(json.dumps))
+# - pydantic_dump_json: 검증된 모델을 model_dump_json() 으로 직렬화
+# - orjson_prevalidated: 검증된 모델을 재검증 없이 orjson 으로 직렬화 (json_encoding.dumps)
+# - stored_bytes: 미리 직렬화된 payload 를 그대로 Response 로 감싸는 비용
+import argparse
+import timeit
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+from application.schemas.recommendation import RecommendationResponse, RecommendationItem
+from application.schemas.json_encoding import dumps
+
+def make_response(n_items):
+    items = [
+        RecommendationItem(
+            category_id=i % 7 + 1,
+            product_id=10_000 + i,
+            title=f"추천 상품 {i}",
+            price=12_900.0 + i,
+            image_url=f"/static/images/product_{i}.jpg" if i % 3 else None,
+        )
+        for i in range(n_items)
+    ]
+    return RecommendationResponse.model_construct(user_nickname="홍길동", recommendations=items)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(RecommendationResponse)
+
+    for n_items in (4, 20, 100):
+        response = make_response(n_items)
+        payload = dumps(response)
+        assert payload == response.model_dump_json().encode()
+
+        cases = {
+            "fastapi_response_model": lambda: JSONResponse(
+                adapter.dump_python(adapter.validate_python(response), mode="json")
+            ).body,
+            "pydantic_dump_json": lambda: Response(response.model_dump_json(), media_type="application/json").body,
+            "orjson_prevalidated": lambda: Response(dumps(response), media_type="application/json").body,
+            "stored_bytes": lambda: Response(payload, media_type="application/json").body,
+        }
+
+        print(f"[items={n_items}] payload={len(payload)} bytes")
+        for name, fn in cases.items():
+            seconds = min(timeit.repeat(fn, number=args.repeat, repeat=3)) / args.repeat
+            print(f"  {name:<24} {seconds * 1_000_000:8.1f} us/response")
+
+if __name__ == "__main__":
+    main()
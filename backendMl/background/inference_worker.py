@@ -3,6 +3,8 @@ import logging
 import time
 from model.inference import inference
 from model.save_recommendations import save_recommendations
+from model.materialize_payloads import materialize_recommendation_payloads
+from model.registry import model_registry
 from infra.db.database import MLSessionLocal, MainSessionLocal
 from infra.db_models.enums.model_type import ModelType
 
@@ -17,27 +19,33 @@ def inference_worker():
             ml_session = MLSessionLocal()
             main_session = MainSessionLocal()
 
-            checkpoint_path = "model/model_weight/model_v1.pt"
-
-            # 1. 추론 수행 (ML DB 세션)
-            pred, pred_label, _, _ = inference(
+            # 1. 추론 수행 (ML DB 세션, 레지스트리에 상주 중인 최신 모델 사용)
+            model_registry.refresh()
+            pred, pred_label, top_k_indices, top_k_scores, user_ids, loaded = inference(
                 session=ml_session,
-                checkpoint_path=checkpoint_path,
                 logger=logging.getLogger(),
                 max_display=5
             )
 
-            # 2. 사용자 ID 불러오기 (ML DB 세션)
-            from model.preprocess import load_transaction_features
-            df = load_transaction_features(ml_session)
-            user_ids = df['user_id'].tolist()
+            # 2. 사용자 ID 는 추론한 DataFrame 의 것을 그대로 사용 (다시 조회하면 동기화 작업과 겹쳐 행 수/순서가 달라질 수 있음)
+            # 추론 도중 모델이 교체될 수 있으므로 인덱스 → 카테고리명은 추론에 사용한 모델의 encoder 로 변환
+            encoder = loaded.encoder
 
             # 3. 추천 결과 저장 (메인 DB 세션 사용)
             save_recommendations(
                 session=main_session,
                 user_ids=user_ids,
                 recommended_labels=pred_label,
-                model_type=ModelType.DEEP_LEARNING
+                model_type=ModelType.DEEP_LEARNING,
+                top_k_indices=top_k_indices,
+                top_k_scores=top_k_scores,
+                class_labels=encoder.classes_ if encoder is not None else None
+            )
+
+            # 4. 사용자별 홈 추천 입력(닉네임 + 카테고리 id) 사전 저장 (상품은 backend 가 요청 시점에 구성)
+            materialize_recommendation_payloads(
+                session=main_session,
+                user_ids=user_ids
             )
 
             logging.info("✅ 추론 및 추천 저장 작업 완료")
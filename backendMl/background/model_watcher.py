@@ -0,0 +1,19 @@
+# [file] background/model_watcher.py
+# [description] 새 모델 체크포인트를 주기적으로 감지해 레지스트리의 상주 모델을 교체
+import logging
+import time
+from model.registry import model_registry
+
+MODEL_WATCH_INTERVAL = 60  # 1분
+
+def model_watcher():
+    logging.info("👀 모델 감시 워커 시작")
+    while True:
+        try:
+            model_registry.refresh()
+        except FileNotFoundError as e:
+            logging.warning(f"⚠️ 모델 체크포인트 없음: {e}")
+        except Exception as e:
+            logging.error(f"❌ 모델 교체 중 오류 발생: {e}", exc_info=True)
+
+        time.sleep(MODEL_WATCH_INTERVAL)
@@ -0,0 +1,31 @@
+# [file] background/runner.py
+# [description] 동기화/추론 백그라운드 워커 전용 프로세스 (운영 시 API 워커와 분리해 GIL 경합 제거)
+#
+# 실행 (backendMl 디렉토리): python -m background.runner
+# - RUN_INFERENCE_WORKER=true 일 때만 추론 워커 실행 (main.py 와 같이 기본 비활성)
+# - 추론 워커는 자체적으로 model_registry.refresh() 후 추론하므로 모델 감시 워커는 띄우지 않음
+import logging
+import os
+import threading
+from background.sync_worker import sync_worker
+from background.inference_worker import inference_worker
+
+RUN_INFERENCE_WORKER = os.getenv("RUN_INFERENCE_WORKER", "false").lower() == "true"
+
+def start_workers():
+    targets = [sync_worker]
+    if RUN_INFERENCE_WORKER:
+        targets.append(inference_worker)
+    threads = [threading.Thread(target=target, name=target.__name__, daemon=True) for target in targets]
+    for thread in threads:
+        thread.start()
+    return threads
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    logging.info(f"Starting background workers (pid={os.getpid()}, inference={RUN_INFERENCE_WORKER})")
+    for thread in start_workers():
+        thread.join()
+
+if __name__ == "__main__":
+    main()
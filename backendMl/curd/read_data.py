@@ -1,8 +1,7 @@
 # [file] curd/read_data.py
 # [description] 운영 DB 필요한 주문 및 고객 정보를 읽어오는 함수
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
-from sqlalchemy import func
+from sqlalchemy import func, extract, and_, or_
 from sqlalchemy.sql import literal_column
 from datetime import datetime, timedelta
 import logging
@@ -12,6 +11,56 @@ from infra.db_models.order import Order, OrderItem
 from infra.db_models.product import Product, Category
 from infra.db_models.coupon import Coupon
 
+STREAM_YIELD_PER = 1000  # 서버 사이드 커서에서 한 번에 가져올 row 수
+
+def _order_summary_query(session: Session):
+    '''
+    주문 상품(order_items) 단위로 고객, 상품, 쿠폰, 기본 거주지 정보를 조인한 기본 쿼리
+    - 기간/페이지 조건은 호출 측에서 추가
+    '''
+    default_address_subq = (
+        session.query(
+            Address.user_id,
+            Address.city.label("city"),
+            Address.country.label("country"),
+        )
+        .filter(Address.is_default == True)
+        .subquery()
+    )
+
+    return (
+        session.query(
+            User.id.label("customer_id"),
+            Order.id.label("order_id"),
+            Order.created_at.label("order_date"),
+            OrderItem.product_id,
+            Category.name.label("product_category"),
+            OrderItem.quantity,
+            Order.shipping_fee,
+            (Order.coupon_id != None).label("coupon_used"),
+            func.coalesce(default_address_subq.c.city, default_address_subq.c.country).label("customer_city"),
+            func.timestampdiff(
+                literal_column("DAY"),
+                User.created_at,
+                func.utc_timestamp()   
+            ).label("membership_days"),
+            Category.gst_rate,
+            extract('month', Order.created_at).label("order_month"),
+            Coupon.code.label("coupon_code"),
+            Coupon.discount_value.label("discount_value"),
+            Order.total_price.label("order_amount"),
+            User.gender.label("gender"),
+
+            (OrderItem.price / func.nullif(OrderItem.quantity, 0)).label("avg_price_per_item"),
+        )
+        .join(Order, Order.user_id == User.id)
+        .join(OrderItem, OrderItem.order_id == Order.id)
+        .join(Product, Product.id == OrderItem.product_id)
+        .join(Category, Category.id == Product.category_id)
+        .outerjoin(Coupon, Coupon.id == Order.coupon_id)
+        .outerjoin(default_address_subq, default_address_subq.c.user_id == User.id)
+    )
+
 def get_order_summary(session: Session):
     '''
     운영 DB에서 최근 1년간 주문 내역 및 관련 고객, 상품, 쿠폰 정보 조회
@@ -23,51 +72,54 @@ def get_order_summary(session: Session):
     one_year_ago = now - timedelta(days=365) # To Do. 수집 날짜는 회의를 진행하여 조정
 
     try:
-        default_address_subq = (
-            session.query(
-                Address.user_id,
-                Address.city.label("city"),
-                Address.country.label("country"),
-            )
-            .filter(Address.is_default == True)
-            .subquery()
-        )
-
         query = (
-            session.query(
-                User.id.label("customer_id"),
-                Order.id.label("order_id"),
-                Order.created_at.label("order_date"),
-                OrderItem.product_id,
-                Category.name.label("product_category"),
-                OrderItem.quantity,
-                Order.shipping_fee,
-                (Order.coupon_id != None).label("coupon_used"),
-                func.coalesce(default_address_subq.c.city, default_address_subq.c.country).label("customer_city"),
-                func.timestampdiff(
-                    literal_column("DAY"),
-                    User.created_at,
-                    func.utc_timestamp()   
-                ).label("membership_days"),
-                Category.gst_rate,
-                extract('month', Order.created_at).label("order_month"),
-                Coupon.code.label("coupon_code"),
-                Coupon.discount_value.label("discount_value"),
-                Order.total_price.label("order_amount"),
-                User.gender.label("gender"),
-
-                (OrderItem.price / func.nullif(OrderItem.quantity, 0)).label("avg_price_per_item"),
-            )
-            .join(Order, Order.user_id == User.id)
-            .join(OrderItem, OrderItem.order_id == Order.id)
-            .join(Product, Product.id == OrderItem.product_id)
-            .join(Category, Category.id == Product.category_id)
-            .outerjoin(Coupon, Coupon.id == Order.coupon_id)
-            .outerjoin(default_address_subq, default_address_subq.c.user_id == User.id)
+            _order_summary_query(session)
             .filter(Order.created_at >= one_year_ago, Order.created_at <= now)
         )
 
         return query.limit(5).all() # To Do. 개발 끝나고는 정리하기
 
     except Exception as e:
-        logging.error(f"get_order_summary 예외: {e}", exc_info=True)
\ No newline at end of file
+        logging.error(f"get_order_summary 예외: {e}", exc_info=True)
+
+def get_order_keys_after(session: Session, last_created_at: datetime, last_id: int, limit: int):
+    '''
+    워터마크 (last_created_at, last_id) 이후의 주문 키를 (created_at, id) 순으로 최대 limit건 조회
+    - 키셋 페이지네이션: 같은 시각에 생성된 주문은 id로 구분
+    - 주문 단위로 페이지를 나누므로 한 주문의 상품들이 페이지 경계에서 잘리지 않음
+    '''
+    return (
+        session.query(Order.id, Order.created_at)
+        .filter(or_(
+            Order.created_at > last_created_at,
+            and_(Order.created_at == last_created_at, Order.id > last_id),
+        ))
+        .order_by(Order.created_at, Order.id)
+        .limit(limit)
+        .all()
+    )
+
+def iter_order_summary_for_orders(session: Session, order_ids: list[int], yield_per: int = STREAM_YIELD_PER):
+    '''
+    지정한 주문들의 상세 정보를 서버 사이드 커서로 스트리밍 (get_order_summary와 동일한 컬럼 구성)
+    '''
+    if not order_ids:
+        return iter(())
+    return (
+        _order_summary_query(session)
+        .filter(Order.id.in_(order_ids))
+        .order_by(Order.created_at, Order.id, OrderItem.id)
+        .yield_per(yield_per)
+    )
+
+def iter_order_summary_between(session: Session, since: datetime, until: datetime, yield_per: int = STREAM_YIELD_PER):
+    '''
+    기간 내 전체 주문 상세 정보를 서버 사이드 커서로 스트리밍
+    - yield_per → stream_results=True (pymysql SSCursor) 로 실행되어 결과 전체를 메모리에 올리지 않음
+    - 순회가 끝나기 전까지 해당 세션의 커넥션으로 다른 쿼리를 실행하지 말 것
+    '''
+    return (
+        _order_summary_query(session)
+        .filter(Order.created_at >= since, Order.created_at <= until)
+        .yield_per(yield_per)
+    )
@@ -0,0 +1,51 @@
+# [file] curd/sync_watermark.py
+# [description] ML DB에 증분 동기화 워터마크(마지막으로 처리한 주문 위치)를 읽고 저장하는 기능
+import logging
+from datetime import datetime
+from sqlalchemy.dialects.mysql import insert
+from infra.db_models.sync_state import SyncWatermark
+
+logger = logging.getLogger(__name__)
+
+ORDERS_WATERMARK = "orders"
+
+_table_checked = False
+
+def ensure_watermark_table(session):
+    """
+    sync_watermarks 테이블이 없으면 생성 (프로세스당 1회만 확인)
+    """
+    global _table_checked
+    if _table_checked:
+        return
+    SyncWatermark.__table__.create(bind=session.get_bind(), checkfirst=True)
+    _table_checked = True
+
+def get_watermark(session, name: str = ORDERS_WATERMARK):
+    """
+    저장된 워터마크 (last_created_at, last_id) 반환. 없으면 None.
+    """
+    ensure_watermark_table(session)
+    mark = session.get(SyncWatermark, name)
+    if mark is None:
+        return None
+    return mark.last_created_at, mark.last_id
+
+def save_watermark(session, last_created_at: datetime, last_id: int, name: str = ORDERS_WATERMARK):
+    """
+    워터마크 UPSERT. 커밋은 호출 측에서 데이터 적재와 함께 수행 (같은 트랜잭션으로 묶기 위함).
+    """
+    ensure_watermark_table(session)
+    values = {
+        "name": name,
+        "last_created_at": last_created_at,
+        "last_id": last_id,
+        "updated_at": datetime.utcnow(),
+    }
+    stmt = insert(SyncWatermark.__table__).values(**values)
+    session.execute(stmt.on_duplicate_key_update(
+        last_created_at=stmt.inserted.last_created_at,
+        last_id=stmt.inserted.last_id,
+        updated_at=stmt.inserted.updated_at,
+    ))
+    logger.info(f"📌 워터마크 갱신: {name} → ({last_created_at}, {last_id})")
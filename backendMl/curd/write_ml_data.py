@@ -1,36 +1,49 @@
 # [file] curd / write_ml_data.py
 # [description] ML용 DB에 주문 관련 특성 데이터를 UPSERT(삽입 또는 업데이트) 하는 기능
 import logging
-from sqlalchemy import Table, MetaData
+import time
 from sqlalchemy.dialects.mysql import insert
-from infra.db.database import MLEngine
+from infra.db_models.ml_features import TransactionFeatures
 
 logger = logging.getLogger(__name__)
 
-def insert_transaction_features(session, row_dicts: list[dict]):
+UPSERT_CHUNK_SIZE = 1000  # 멀티 VALUES UPSERT 한 문장에 담을 row 수
+
+def insert_transaction_features(session, row_dicts: list[dict], chunk_size: int = UPSERT_CHUNK_SIZE):
     """
     ML DB에 transaction_features 테이블에 row_dicts 목록을 UPSERT 수행.
     - 중복 키 발생 시 기존 데이터 업데이트.
     - 필수 키(order_id, product_id) 검증 후 실행.
+    - chunk_size 건씩 묶어 INSERT ... VALUES (...), (...) ON DUPLICATE KEY UPDATE 한 문장으로 실행.
     """
     if not row_dicts:
         logger.warning("❗ row_dicts가 비어있음")
-        return
+        return 0
 
     # 1) 검증
     required_keys = {"order_id", "product_id"}
     for row in row_dicts:
         if not required_keys.issubset(row.keys()):
             raise ValueError(f"필수 키 누락된 row: {row}")
-    metadata = MetaData()
 
-    # 2) 테이블 메타데이터 동적 로딩
-    table = Table('transaction_features', metadata, autoload_with=MLEngine)
+    # 2) ORM 모델의 테이블 메타데이터 사용 (매 호출마다 reflection 하지 않음)
+    table = TransactionFeatures.__table__
 
-    # 3) UPSERT 처리 (중복 시 업데이트, 없으면 INSERT)
-    for row in row_dicts:
-        stmt = insert(table).values(**row)
-        upsert_stmt = stmt.on_duplicate_key_update(**row)
+    # 3) UPSERT 처리 (중복 시 업데이트, 없으면 INSERT) - chunk 단위 멀티 VALUES
+    started = time.perf_counter()
+    for start in range(0, len(row_dicts), chunk_size):
+        chunk = row_dicts[start:start + chunk_size]
+        stmt = insert(table).values(chunk)
+        upsert_stmt = stmt.on_duplicate_key_update({
+            key: stmt.inserted[key]
+            for key in chunk[0].keys() if key not in required_keys
+        })
         session.execute(upsert_stmt)
-        
-    logger.info(f"✅ {len(row_dicts)}건 transaction_features 삽입 또는 업데이트 완료")
\ No newline at end of file
+    elapsed = time.perf_counter() - started
+
+    rows_per_sec = len(row_dicts) / elapsed if elapsed > 0 else float("inf")
+    logger.info(
+        f"✅ {len(row_dicts)}건 transaction_features 삽입 또는 업데이트 완료 "
+        f"({elapsed:.2f}s, {rows_per_sec:,.0f} rows/s, chunk={chunk_size})"
+    )
+    return len(row_dicts)
@@ -0,0 +1,28 @@
+# [file] gunicorn.conf.py
+# [description] 운영(APP_ENV=production) 서빙 설정: gunicorn 마스터 + UvicornWorker N개 (/predict 전용)
+#
+# 실행: RUN_BACKGROUND_WORKERS=false gunicorn -c gunicorn.conf.py main:app
+# - 동기화/추론 워커는 background/runner.py 별도 프로세스(docker-compose backendml-worker)에서 실행
+# - WEB_CONCURRENCY: 워커 수 (기본: CPU 코어 수), 워커마다 모델을 메모리에 올림
+# - torch 연산 스레드를 워커 수로 나눠 코어 과점유 방지 (OMP_NUM_THREADS 미설정 시)
+# - 워커 수를 환경변수로 내려보내 infra/db/database.py 가 DB_MAX_CONNECTIONS 를 워커별로 나눠 풀 크기를 정함
+import multiprocessing
+import os
+
+cpu_count = multiprocessing.cpu_count()
+workers = int(os.getenv("WEB_CONCURRENCY") or cpu_count)
+os.environ["WEB_CONCURRENCY"] = str(workers)
+os.environ.setdefault("OMP_NUM_THREADS", str(max(1, cpu_count // workers)))
+os.environ.setdefault("RUN_BACKGROUND_WORKERS", "false")
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = False  # torch / 커넥션 풀은 fork 이후 워커에서 생성
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", 120))               # 모델 로드 시간 고려
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", 30))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", 5))
+
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info")
@@ -1,8 +1,9 @@
 # infra/db/database.py
 # 두 DB 세션: MainSessionLocal, MLSessionEngine
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
+from typing import Generator
 import os
 
 load_dotenv()
@@ -13,14 +14,39 @@ DB_PASSWORD = os.getenv("MYSQL_PASSWORD")
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = os.getenv("DB_PORT")
 
+# 커넥션 풀 설정 (프로세스당)
+# - DB_MAX_CONNECTIONS: 이 앱 전체(API 워커 + 백그라운드 프로세스)가 사용할 MySQL 커넥션 상한 (backend 기본 100 과 합쳐 151 이하)
+# - API 워커 수(WEB_CONCURRENCY) + 백그라운드 프로세스 1개 × 엔진 2개(Main/ML)로 나눠 엔진당 기본 풀 크기 결정
+# - DB_POOL_SIZE / DB_MAX_OVERFLOW 를 직접 지정하면 그 값을 사용
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY") or 1)
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", 40))
+_engine_budget = max(2, DB_MAX_CONNECTIONS // ((WEB_CONCURRENCY + 1) * 2))
+
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", min(5, _engine_budget * 2 // 3)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", min(10, _engine_budget - DB_POOL_SIZE)))
+
+pool_args = dict(
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE", 1800)),
+)
+
 # 운영 DB (Main)
 Main_DB_NAME = os.getenv("MYSQL_DATABASE")
 Main_DB_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{Main_DB_NAME}"
-MainEngine = create_engine(Main_DB_URL, pool_pre_ping=True)
+MainEngine = create_engine(Main_DB_URL, **pool_args)
 MainSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=MainEngine)
 
 # ML 데이터 DB
 ML_DB_NAME = os.getenv("ML_DB_NAME")
 ML_DB_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{ML_DB_NAME}"
-MLEngine = create_engine(ML_DB_URL, pool_pre_ping=True)
-MLSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=MLEngine)
\ No newline at end of file
+MLEngine = create_engine(ML_DB_URL, **pool_args)
+MLSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=MLEngine)
+
+def get_ml_db() -> Generator[Session, None, None]:
+    db = MLSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
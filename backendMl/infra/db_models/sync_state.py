@@ -0,0 +1,14 @@
+# [file] infra/db_models/sync_state.py
+# [description] ML DB 동기화 진행 상태 (1) 증분 동기화 워터마크
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from infra.db.base import Base
+
+class SyncWatermark(Base):
+    __tablename__ = "sync_watermarks"
+    __table_args__ = {"schema": "ml_data"}  # 스키마 지정
+
+    name = Column(String(50), primary_key=True)          # 동기화 대상 이름 (예: 'orders')
+    last_created_at = Column(DateTime, nullable=False)   # 마지막으로 동기화한 주문 생성 시각
+    last_id = Column(Integer, nullable=False, default=0) # 같은 시각 내 마지막 주문 ID
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,27 @@
+# [file] interface / predict_router.py
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from infra.db.database import get_ml_db
+from service.prediction_service import predict_batched, micro_batcher
+from schemas.prediction import PredictRequest, PredictResponse
+
+router = APIRouter()
+
+@router.post("/predict", response_model=PredictResponse)
+async def predict(
+    request: PredictRequest,
+    ml_db: Session = Depends(get_ml_db)
+):
+    if not request.user_ids and not request.rows:
+        raise HTTPException(status_code=400, detail="user_ids 또는 rows 중 하나는 필요합니다.")
+
+    try:
+        version, predictions = await predict_batched(ml_db, request.rows, request.user_ids, request.top_k)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=503, detail=f"모델이 준비되지 않았습니다: {e}")
+
+    return PredictResponse(model_version=version, predictions=predictions)
+
+@router.get("/predict/stats")
+async def predict_stats():
+    return micro_batcher.stats()
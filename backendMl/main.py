@@ -1,22 +1,40 @@
 # [file] main.py  
 # [description] FastAPI 서버 내 백그라운드 스레드로 운영 DB와 ML DB 동기화 작업 주기 실행
 from fastapi import FastAPI
+import os
 import threading
 import logging
 from background.sync_worker import sync_worker
 from background.inference_worker import inference_worker
+from background.model_watcher import model_watcher
+from model.registry import model_registry
+from interface.predict_router import router as predict_router
+
+# 운영(gunicorn 멀티 워커)에서는 false → 동기화/추론 워커는 background/runner.py 프로세스에서 한 번만 실행
+RUN_BACKGROUND_WORKERS = os.getenv("RUN_BACKGROUND_WORKERS", "true").lower() == "true"
 
 app = FastAPI(title="🧠 추론용 FastAPI 서버")
+app.include_router(predict_router)
 
 def start_background_workers():
-    threading.Thread(target=sync_worker, daemon=True).start()
-    # threading.Thread(target=inference_worker, daemon=True).start()
+    if RUN_BACKGROUND_WORKERS:
+        threading.Thread(target=sync_worker, daemon=True).start()
+        # threading.Thread(target=inference_worker, daemon=True).start()
+    # 모델 감시는 워커(프로세스)마다 자기 레지스트리를 갱신해야 하므로 항상 실행
+    threading.Thread(target=model_watcher, daemon=True).start()
 
 @app.on_event("startup")
 def on_startup():
-    logging.info("Starting background workers")
+    logging.info(f"Starting background workers (pid={os.getpid()}, sync={RUN_BACKGROUND_WORKERS})")
     start_background_workers()
 
 @app.get("/")
 async def root():
-    return {"message": "🧠 서버 정상 작동 중입니다."}
\ No newline at end of file
+    return {"message": "🧠 서버 정상 작동 중입니다."}
+
+@app.get("/model")
+async def model_info():
+    active = model_registry.active
+    if active is None:
+        return {"version": None}
+    return active.info()
\ No newline at end of file
@@ -0,0 +1,72 @@
+# [file] model/feature_vocab.py
+# [description] 학습 시 저장된 범주형 컬럼 어휘(feature_vocab/)를 메모리 매핑으로 로드해 학습과 같은 정수 코드로 인코딩
+import os
+import json
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+VOCAB_DIRNAME = "feature_vocab"
+META_FILENAME = "meta.json"
+CHECKPOINT_VOCAB_SUFFIX = ".vocab"  # 학습이 체크포인트마다 저장하는 어휘 (<체크포인트>.vocab/)
+
+class FeatureVocab:
+    """
+    - 컬럼별 어휘 .npy 를 np.load(mmap_mode='r') 로 열고, 최초 조회 시 컬럼별 해시 인덱스(pd.Index)를 한 번 생성
+    - encode(): 어휘 순서 = 코드 (학습의 LabelEncoder 코드와 동일), 어휘에 없는 값은 OOV 버킷 len(vocab)
+    """
+    def __init__(self, vocab_dir, version, arrays):
+        self.vocab_dir = vocab_dir
+        self.version = version
+        self._arrays = arrays
+        self._indexes = {}
+
+    @classmethod
+    def load(cls, vocab_dir):
+        with open(os.path.join(vocab_dir, META_FILENAME), encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {
+            name: np.load(os.path.join(vocab_dir, info["file"]), mmap_mode="r")
+            for name, info in meta["columns"].items()
+        }
+        logger.info(f"📚 Feature vocab 로드: {vocab_dir} (version={meta['version']}, columns={list(arrays)})")
+        return cls(vocab_dir, meta["version"], arrays)
+
+    @property
+    def columns(self):
+        return list(self._arrays)
+
+    def __contains__(self, col):
+        return col in self._arrays
+
+    def oov_code(self, col):
+        return len(self._arrays[col])
+
+    def encode(self, col, values):
+        index = self._indexes.get(col)
+        if index is None:
+            index = self._indexes[col] = pd.Index(self._arrays[col])
+        codes = index.get_indexer(pd.Series(values).astype(str))
+        codes[codes < 0] = self.oov_code(col)
+        return codes
+
+def load_feature_vocab(checkpoint_path):
+    """
+    체크포인트와 함께 저장된 <체크포인트>.vocab/ 로드
+    - 없으면 (이전 학습 코드로 만든 체크포인트) 같은 디렉토리의 공용 feature_vocab/ 를 경고와 함께 사용
+      → 공용 어휘는 마지막 학습의 어휘라 이 체크포인트의 학습 시 인코딩과 다를 수 있음
+    - 둘 다 없으면 None
+    """
+    vocab_dir = checkpoint_path + CHECKPOINT_VOCAB_SUFFIX
+    if os.path.exists(os.path.join(vocab_dir, META_FILENAME)):
+        return FeatureVocab.load(vocab_dir)
+
+    shared_dir = os.path.join(os.path.dirname(checkpoint_path), VOCAB_DIRNAME)
+    if not os.path.exists(os.path.join(shared_dir, META_FILENAME)):
+        logger.warning(f"Feature vocab 없음: {vocab_dir}")
+        return None
+    logger.warning(f"체크포인트 전용 어휘 없음: {vocab_dir} → 공용 {shared_dir} 사용 (학습 시 어휘와 다를 수 있음)")
+    return FeatureVocab.load(shared_dir)
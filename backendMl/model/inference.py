@@ -1,27 +1,38 @@
 # [file] model/inference.py
-import yaml
-import os
 import torch
-from model.model_arch import WideAndDeep
+import torch.nn.functional as F
 import logging
-import joblib
 import pandas as pd
-from model.preprocess import load_transaction_features, preprocess_for_inference
+from model.preprocess import load_transaction_features, preprocess_for_inference, WIDE_FEATURES, DEEP_FEATURES
+from model.registry import model_registry
 
-config_path = 'config.yaml'
-with open(config_path, 'r') as f:
-    config = yaml.safe_load(f)
+RECOMMEND_TOP_K = 5  # row 별로 남길 상위 카테고리 수
+
+def inference(session, checkpoint_path=None, logger=None, max_display=10, top_k=RECOMMEND_TOP_K):
+    """
+    ML DB 의 transaction_features 전체에 대해 상주 모델로 배치 추론
+    - checkpoint_path 를 지정하면 해당 체크포인트로 교체 후 추론 (기본: 레지스트리의 활성 모델)
+
+    Returns:
+        pred: (N,) argmax 클래스 인덱스
+        pred_label: (N,) argmax 카테고리명
+        top_k_indices: (N, k) 확률 내림차순 클래스 인덱스
+        top_k_scores: (N, k) 위 인덱스의 확률
+        user_ids: (N,) 각 row 의 사용자 ID (추론한 DataFrame 의 user_id 컬럼 → 위 결과와 같은 순서)
+        loaded: 추론에 실제로 사용한 LoadedModel (클래스 인덱스 → 카테고리명 변환은 이 모델의 encoder 로)
+    """
+    logger = logger or logging.getLogger(__name__)
+
+    # 1. 상주 모델 조회 (버전별 최초 1회만 로드)
+    if checkpoint_path:
+        model_registry.refresh(checkpoint_path)
+    loaded = model_registry.get()
+    logger.info(f"[MODEL VERSION] {loaded.version}")
 
-def inference(session, checkpoint_path, logger, max_display=10):
     # 2. 데이터 로딩 및 전처리
     df = load_transaction_features(session)
-    wide_features = ['product_id', 'order_id', 'customer_id']
-    deep_features = ['order_date', 'product_category', 'quantity', 'avg_price_per_item',
-                     'shipping_fee', 'coupon_used', 'gender', 'customer_city',
-                     'membership_days', 'gst_rate', 'order_month',
-                     'coupon_code', 'discount_value', 'order_amount']
-
-    wide_x, deep_x = preprocess_for_inference(df, wide_features, deep_features)
+    user_ids = df['user_id'].tolist() if not df.empty else []
+    wide_x, deep_x = preprocess_for_inference(df, WIDE_FEATURES, DEEP_FEATURES, encoder=loaded.encoder, vocab=loaded.vocab)
 
     logger.info(f"[WIDE INPUT FEATURES] {list(wide_x.columns)}")
     logger.info(f"[DEEP INPUT FEATURES] {list(deep_x.columns)}")
@@ -34,51 +45,26 @@ def inference(session, checkpoint_path, logger, max_display=10):
     if isinstance(deep_x, (pd.DataFrame, pd.Series)):
         deep_x = torch.from_numpy(deep_x.to_numpy()).float()
 
-    device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
-    wide_x = wide_x.to(device)
-    deep_x = deep_x.to(device)
-
-    # 3. Label Encoder 및 클래스 수 결정
-    encoder_path = os.path.join(os.path.dirname(checkpoint_path), 'label_encoder.pkl')
-    if os.path.exists(encoder_path):
-        encoder = joblib.load(encoder_path)
-        num_classes = len(encoder.classes_)
-        logger.info(f"Label encoder loaded, num_classes={num_classes}")
-    else:
-        encoder = None
-        num_classes = 16
-        logger.warning(f"Label encoder 없음, num_classes를 16으로 고정")
-
-    # 4. config에서 wideanddeep_args 불러오기
-    wideanddeep_cfg = config.get('wideanddeep_args', {})
-
-    # 5. 모델 초기화 (config.yaml 값 반영)
-    model = WideAndDeep(
-        wide_input_dim=wide_x.shape[1],
-        deep_input_dim=deep_x.shape[1],
-        num_classes=num_classes,
-        deep_hidden_units=wideanddeep_cfg.get('deep_hidden_units', [128, 64]),
-        dropout_p=wideanddeep_cfg.get('dropout_p', 0.0),
-        use_softmax=wideanddeep_cfg.get('use_softmax', True),
-        batch_norm=wideanddeep_cfg.get('batch_norm', True)
-    )
-
-    model.load_state_dict(torch.load(checkpoint_path, map_location=device))
-    model.to(device)
-    model.eval()
+    wide_x = wide_x.to(loaded.device)
+    deep_x = deep_x.to(loaded.device)
 
+    # 3. 추론
     with torch.no_grad():
-        output = model(wide_x, deep_x)
-        pred = output.argmax(dim=1).cpu().numpy()
+        output = loaded.model(wide_x, deep_x)
+        probs = output if loaded.model.use_softmax else F.softmax(output, dim=1)
+        top_k_scores, top_k_indices = probs.topk(min(top_k, probs.shape[1]), dim=1)
+        top_k_scores = top_k_scores.cpu().numpy()
+        top_k_indices = top_k_indices.cpu().numpy()
+        pred = top_k_indices[:, 0]
 
-    if encoder is not None:
-        pred_label = encoder.inverse_transform(pred)
+    if loaded.encoder is not None:
+        pred_label = loaded.encoder.inverse_transform(pred)
     else:
         pred_label = pred
 
     for i in range(min(max_display, len(pred))):
-        logger.info(f"[Sample {i}] Prediction={pred[i]} ({pred_label[i]})")
+        logger.info(f"[Sample {i}] Prediction={pred[i]} ({pred_label[i]}), top-{top_k_indices.shape[1]}={top_k_indices[i].tolist()}")
 
     logger.info(f"Inference 완료, 총 {len(pred)}개 샘플 처리됨.")
 
-    return pred, pred_label, None, None
\ No newline at end of file
+    return pred, pred_label, top_k_indices, top_k_scores, user_ids, loaded
@@ -0,0 +1,74 @@
+# model/materialize_payloads.py
+# 추천 저장 직후, 사용자별 홈 추천 입력(닉네임 + 순위별 카테고리 id)을 미리 풀어 recommendation_payloads 에 저장
+# - 상품 목록은 저장하지 않음: backend 가 요청 시점에 category_product_index(미판매 상품, 증분 갱신)로 구성
+import logging
+import orjson
+from sqlalchemy.dialects.mysql import insert
+from infra.db_models.recommendation import LatestRecommendation, RecommendationPayload
+from infra.db_models.user import User
+from model.save_recommendations import load_category_ids
+
+logger = logging.getLogger(__name__)
+
+PAYLOAD_CHUNK_SIZE = 1000      # 한 번에 조회/UPSERT 할 사용자 수
+
+def build_payload(nickname, category_ids):
+    """
+    backend recommendation_service.load_home_source 가 읽는 형식 {"user_nickname", "category_ids"}
+    """
+    return {"user_nickname": nickname, "category_ids": category_ids}
+
+def materialize_recommendation_payloads(session, user_ids, chunk_size=PAYLOAD_CHUNK_SIZE):
+    """
+    사용자별 홈 추천 입력을 orjson 으로 한 번 직렬화해 저장 (user_id PK UPSERT)
+
+    1. chunk 단위로 users / latest_recommendations 를 IN 쿼리로 조회
+    2. 순위별 카테고리 id 결정 (이전 형식 행은 카테고리명 → id, backend 와 같은 대소문자 무시 정확 일치)
+    3. payload bytes 를 멀티 VALUES UPSERT (generated_at 은 latest_recommendations 와 동일)
+
+    Returns:
+        int - 저장한 사용자 수
+    """
+    user_ids = sorted({int(user_id) for user_id in user_ids})
+    table = RecommendationPayload.__table__
+    saved = 0
+
+    for start in range(0, len(user_ids), chunk_size):
+        chunk = user_ids[start:start + chunk_size]
+        nicknames = dict(session.query(User.id, User.nickname).filter(User.id.in_(chunk)).all())
+        latest = session.query(LatestRecommendation).filter(LatestRecommendation.user_id.in_(chunk)).all()
+
+        # 이전 형식(카테고리명 문자열만 있는 행)은 카테고리명 → id 로 변환
+        legacy_labels = {
+            label.strip() for rec in latest if not rec.recommended_categories
+            for label in rec.recommended_items.split(",") if label.strip()
+        }
+        label_ids = load_category_ids(session, legacy_labels) if legacy_labels else {}
+
+        values = []
+        for rec in latest:
+            if rec.user_id not in nicknames:
+                continue
+            if rec.recommended_categories:
+                category_ids = [int(category_id) for category_id, _ in rec.recommended_categories]
+            else:
+                labels = [label.strip() for label in rec.recommended_items.split(",") if label.strip()]
+                category_ids = list(dict.fromkeys(label_ids[label] for label in labels if label in label_ids))
+            values.append({
+                "user_id": rec.user_id,
+                "payload": orjson.dumps(build_payload(nicknames[rec.user_id], category_ids)),
+                "generated_at": rec.generated_at,
+            })
+        if not values:
+            continue
+
+        stmt = insert(table).values(values)
+        session.execute(stmt.on_duplicate_key_update(
+            payload=stmt.inserted.payload,
+            generated_at=stmt.inserted.generated_at,
+        ))
+        saved += len(values)
+    session.commit()
+
+    logger.info(f"✅ 추천 입력 사전 저장 완료: 사용자 {saved}명")
+    return saved
@@ -3,6 +3,8 @@ import os
 import pandas as pd
 import logging
 from sklearn.preprocessing import LabelEncoder
+from sqlalchemy import func, select
+from sqlalchemy.orm import aliased
 from infra.db_models.ml_features import TransactionFeatures
 import joblib
 
@@ -18,40 +20,83 @@ logger = logging.getLogger(__name__)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ENCODER_PATH = os.path.join(BASE_DIR, "model", "model_weight", "label_encoder.pkl")
 
+WIDE_FEATURES = ['product_id', 'order_id', 'customer_id']
+DEEP_FEATURES = ['order_date', 'product_category', 'quantity', 'avg_price_per_item',
+                 'shipping_fee', 'coupon_used', 'gender', 'customer_city',
+                 'membership_days', 'gst_rate', 'order_month',
+                 'coupon_code', 'discount_value', 'order_amount']
+
+def to_feature_record(row):
+    """
+    transaction_features row (ORM 객체 또는 같은 필드를 가진 요청 스키마)를 추론 입력용 dict 로 변환
+    """
+    return {
+        "customer_id": f"USER_{row.customer_id}",
+        "order_id": f"Transaction_{row.order_id}",
+        "order_date": row.order_date,
+        "product_id": f"Product_{row.product_id}",
+        "product_category": row.product_category,
+        "quantity": row.quantity,
+        "avg_price_per_item": float(row.avg_price_per_item),
+        "shipping_fee": float(row.shipping_fee),
+        "coupon_used": "Used",
+        "coupon_code": row.coupon_code,
+        "customer_city": row.customer_city,
+        "gender": row.gender,
+        "membership_days": row.membership_days,
+        "gst_rate": float(row.gst_rate),
+        "order_month": row.order_month,
+        "discount_value": float(row.discount_value),
+        "order_amount": float(row.order_amount),
+        "label": getattr(row, "label", None),
+        "user_id": f"{row.customer_id}"
+    }
+
 def load_transaction_features(session):
     rows = session.query(TransactionFeatures).all()
 
-    data = []
-    for row in rows:
-        data.append({
-            "customer_id": f"USER_{row.customer_id}",
-            "order_id": f"Transaction_{row.order_id}",
-            "order_date": row.order_date,
-            "product_id": f"Product_{row.product_id}",
-            "product_category": row.product_category,
-            "quantity": row.quantity,
-            "avg_price_per_item": float(row.avg_price_per_item),
-            "shipping_fee": float(row.shipping_fee),
-            "coupon_used": "Used",
-            "coupon_code": row.coupon_code,
-            "customer_city": row.customer_city,
-            "gender": row.gender,
-            "membership_days": row.membership_days,
-            "gst_rate": float(row.gst_rate),
-            "order_month": row.order_month,
-            "discount_value": float(row.discount_value),
-            "order_amount": float(row.order_amount),
-            "label": row.label,
-            "user_id": f"{row.customer_id}"
-        })
+    data = [to_feature_record(row) for row in rows]
 
     df = pd.DataFrame(data)
     logger.info(f"Loaded {len(df)} rows from DB")
     logger.info(f"Sample data:\n{df.head(3)}")
     return df
 
-def preprocess_for_inference(df, wide_features, deep_features):
-    logger.info(f"[현재 작업 디렉토리] {os.getcwd()}")
+def load_user_transaction_features(session, user_ids, rows_per_user=5):
+    """
+    지정한 사용자들의 최근 거래 특성 rows_per_user 건씩 조회 (온라인 추론용)
+    - 사용자별 개수 제한은 SQL 에서 (ROW_NUMBER 윈도우, MySQL 8+) → 조회량/지연이 사용자 거래 이력 길이와 무관
+    """
+    ranked = (
+        select(
+            TransactionFeatures,
+            func.row_number().over(
+                partition_by=TransactionFeatures.customer_id,
+                order_by=(TransactionFeatures.order_date.desc(), TransactionFeatures.order_id.desc()),
+            ).label("rn"),
+        )
+        .where(TransactionFeatures.customer_id.in_(user_ids))
+        .subquery()
+    )
+    recent = aliased(TransactionFeatures, ranked)
+    rows = (
+        session.query(recent)
+        .filter(ranked.c.rn <= rows_per_user)
+        .order_by(ranked.c.customer_id, ranked.c.rn)
+        .all()
+    )
+    return pd.DataFrame([to_feature_record(row) for row in rows])
+
+def encode_with_classes(values, classes):
+    """
+    LabelEncoder.transform 과 같은 코드를 벡터 연산으로 계산 (classes_ 순서 = 코드)
+    - 고정 카테고리 pandas Categorical 사용 → 해시 조회 1회/row, sklearn 호출 없음
+    - classes 에 없는 값은 -1
+    """
+    return pd.Categorical(pd.Series(values).astype(str), categories=classes).codes.astype('int64')
+
+def preprocess_for_inference(df, wide_features, deep_features, encoder=None, vocab=None):
+    logger.debug(f"[현재 작업 디렉토리] {os.getcwd()}")
     exclude_cols = ['user_id', 'label']
     df = df.drop(columns=exclude_cols, errors='ignore')
     df.fillna(0, inplace=True)
@@ -60,15 +105,14 @@ def preprocess_for_inference(df, wide_features, deep_features):
         df['order_date'] = pd.to_datetime(df['order_date'])
         df['order_date'] = df['order_date'].dt.month + df['order_date'].dt.day / 31.0
 
-    # product_category: 저장된 인코더 사용 (없으면 새로 인코딩)
+    # product_category: 전달받은 인코더 또는 저장된 인코더 사용 (없으면 새로 인코딩)
     product_category_col = 'product_category'
     if product_category_col in df.columns:
-        if os.path.exists(ENCODER_PATH):
+        if encoder is None and os.path.exists(ENCODER_PATH):
             encoder = joblib.load(ENCODER_PATH)
-            df[product_category_col] = df[product_category_col].astype(str).apply(
-                lambda x: encoder.transform([x])[0] if x in encoder.classes_ else -1
-            )
             logger.info(f"[Label encoder loaded] {ENCODER_PATH}, num_classes={len(encoder.classes_)}")
+        if encoder is not None:
+            df[product_category_col] = encode_with_classes(df[product_category_col], encoder.classes_)
         else:
             logger.warning(f"[라벨 인코더 미존재] {ENCODER_PATH} 인코더를 찾을 수 없습니다. 새로 인코딩합니다.")
             le = LabelEncoder()
@@ -79,13 +123,18 @@ def preprocess_for_inference(df, wide_features, deep_features):
         if col == product_category_col:
             continue
         if df[col].dtype == 'object':
-            le = LabelEncoder()
-            df[col] = le.fit_transform(df[col].astype(str))
+            if vocab is not None and col in vocab:
+                # 학습 시 저장된 어휘로 인코딩 → 학습과 같은 코드, 처음 보는 값은 OOV 버킷
+                df[col] = vocab.encode(col, df[col])
+            else:
+                # 어휘가 없는 구버전 체크포인트: 배치 내 정렬된 고유값 기준 코드 (LabelEncoder().fit_transform 과 동일)
+                df[col] = pd.factorize(df[col].astype(str), sort=True)[0]
 
     wide_df = df[wide_features]
     deep_df = df[deep_features]
 
-    logger.info(f"[WIDE INPUT SHAPE] {wide_df.shape}")
-    logger.info(f"[DEEP INPUT SHAPE] {deep_df.shape}")
+    # 온라인 추론(/predict)은 요청마다 호출 → 상세 로그는 DEBUG (배치 추론은 inference() 가 INFO 로 기록)
+    logger.debug(f"[WIDE INPUT SHAPE] {wide_df.shape}")
+    logger.debug(f"[DEEP INPUT SHAPE] {deep_df.shape}")
 
     return wide_df, deep_df
\ No newline at end of file
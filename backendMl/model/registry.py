@@ -0,0 +1,166 @@
+# [file] model/registry.py
+# [description] 모델 체크포인트를 버전별로 한 번만 로드해 eval 모드로 상주시키고, 새 체크포인트가 생기면 교체하는 레지스트리
+import os
+import glob
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+
+import joblib
+import torch
+import yaml
+
+from model.model_arch import WideAndDeep
+from model.feature_vocab import FeatureVocab, load_feature_vocab
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CONFIG_PATH = os.path.join(BASE_DIR, "config.yaml")
+MODEL_DIR = os.path.join(BASE_DIR, "model", "model_weight")
+ENCODER_FILENAME = "label_encoder.pkl"
+
+@dataclass(frozen=True)
+class LoadedModel:
+    version: str              # '<파일명>@<sha256 앞 12자리>'
+    checkpoint_path: str
+    sha256: str
+    mtime: float
+    size: int
+    model: WideAndDeep
+    encoder: object           # LabelEncoder (없으면 None)
+    vocab: FeatureVocab       # 학습 시 저장된 범주형 어휘 (없으면 None)
+    num_classes: int
+    device: torch.device
+    loaded_at: datetime
+
+    def info(self):
+        return {
+            "version": self.version,
+            "checkpoint_path": self.checkpoint_path,
+            "num_classes": self.num_classes,
+            "vocab_version": self.vocab.version if self.vocab else None,
+            "device": str(self.device),
+            "loaded_at": self.loaded_at.isoformat(),
+        }
+
+class ModelRegistry:
+    """
+    - get(): 현재 활성 모델 반환 (최초 호출 시 로드). 추론 경로에서는 잠금 없이 참조만 읽음
+    - refresh(): 체크포인트의 mtime/size 가 바뀌었으면 sha256 을 비교해 새 버전이면 로드 후 참조를 원자적으로 교체
+      (교체 전에 get() 한 추론은 이전 모델로 끝까지 수행됨)
+    - 체크포인트 경로: 인자 > 환경변수 MODEL_CHECKPOINT_PATH > model_dir 내 가장 최근 *.pt
+    """
+    def __init__(self, model_dir=MODEL_DIR, config_path=CONFIG_PATH, checkpoint_path=None):
+        self.model_dir = model_dir
+        self.checkpoint_path = checkpoint_path or os.getenv("MODEL_CHECKPOINT_PATH")
+        self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+        with open(config_path, 'r') as f:
+            self.config = yaml.safe_load(f)
+        self._lock = threading.Lock()  # 로드/교체만 직렬화
+        self._active = None
+
+    @property
+    def active(self):
+        return self._active
+
+    @property
+    def active_version(self):
+        return self._active.version if self._active else None
+
+    def resolve_checkpoint(self):
+        if self.checkpoint_path:
+            return self.checkpoint_path
+        candidates = glob.glob(os.path.join(self.model_dir, "*.pt"))
+        if not candidates:
+            raise FileNotFoundError(f"체크포인트가 없습니다: {self.model_dir}/*.pt")
+        return max(candidates, key=os.path.getmtime)
+
+    def get(self) -> LoadedModel:
+        active = self._active
+        if active is None:
+            self.refresh()
+            active = self._active
+        return active
+
+    def refresh(self, checkpoint_path=None) -> bool:
+        """
+        새 체크포인트를 감지하면 로드 후 교체. 교체했으면 True
+        """
+        path = os.path.abspath(checkpoint_path or self.resolve_checkpoint())
+        stat = os.stat(path)
+
+        # 1) mtime/size 가 그대로면 파일을 읽지 않고 종료
+        active = self._active
+        if active and active.checkpoint_path == path and active.mtime == stat.st_mtime and active.size == stat.st_size:
+            return False
+
+        with self._lock:
+            active = self._active
+            # 2) 내용 해시 비교 (touch 등으로 mtime 만 바뀐 경우 재로드하지 않음)
+            digest = _sha256(path)
+            if active and active.sha256 == digest:
+                self._active = replace(active, checkpoint_path=path, mtime=stat.st_mtime, size=stat.st_size)
+                return False
+
+            # 3) 새 버전 로드 후 참조 교체
+            loaded = self._load(path, digest, stat)
+            self._active = loaded
+
+        logger.info(f"🔁 모델 교체: {active.version if active else None} → {loaded.version}")
+        return True
+
+    def _load(self, path, digest, stat) -> LoadedModel:
+        state_dict = torch.load(path, map_location=self.device)
+
+        # 입력/출력 차원은 체크포인트 가중치 shape 에서 결정
+        num_classes, wide_input_dim = state_dict['wide.weight'].shape
+        deep_input_dim = state_dict['deep_layers.0.weight'].shape[1]
+
+        encoder_path = os.path.join(os.path.dirname(path), ENCODER_FILENAME)
+        encoder = joblib.load(encoder_path) if os.path.exists(encoder_path) else None
+        if encoder is None:
+            logger.warning(f"Label encoder 없음: {encoder_path}")
+        vocab = load_feature_vocab(path)
+
+        wideanddeep_cfg = self.config.get('wideanddeep_args', {})
+        model = WideAndDeep(
+            wide_input_dim=wide_input_dim,
+            deep_input_dim=deep_input_dim,
+            num_classes=num_classes,
+            deep_hidden_units=wideanddeep_cfg.get('deep_hidden_units', [128, 64]),
+            dropout_p=wideanddeep_cfg.get('dropout_p', 0.0),
+            use_softmax=wideanddeep_cfg.get('use_softmax', True),
+            batch_norm=wideanddeep_cfg.get('batch_norm', True)
+        )
+        model.load_state_dict(state_dict)
+        model.to(self.device)
+        model.eval()
+
+        version = f"{os.path.basename(path)}@{digest[:12]}"
+        logger.info(f"📦 모델 로드 완료: {version}, num_classes={num_classes}")
+        return LoadedModel(
+            version=version,
+            checkpoint_path=path,
+            sha256=digest,
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            model=model,
+            encoder=encoder,
+            vocab=vocab,
+            num_classes=num_classes,
+            device=self.device,
+            loaded_at=datetime.utcnow(),
+        )
+
+def _sha256(path, block_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+# 프로세스 전역 레지스트리
+model_registry = ModelRegistry()
@@ -1,41 +1,163 @@
 # model/save_recommendations.py
 import json
+import logging
+from collections import Counter, defaultdict
 from datetime import datetime
-from infra.db_models.recommendation import Recommendation
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert
+from infra.db_models.recommendation import Recommendation, LatestRecommendation
+from infra.db_models.product import Category
 from infra.db_models.enums.model_type import ModelType
 
-def save_recommendations(session, user_ids, recommended_labels, model_type=ModelType.DEEP_LEARNING):
+logger = logging.getLogger(__name__)
+
+SAVE_CHUNK_SIZE = 1000  # IN 조회 및 멀티 VALUES UPSERT 한 번에 처리할 사용자 수
+SCORE_DECIMALS = 4      # recommended_categories 에 저장할 점수 소수점 자리수
+
+def dedupe_user_predictions(user_ids, recommended_labels):
+    """
+    주문(상품) 단위 예측을 사용자 단위로 합침
+    - 사용자별로 가장 많이 예측된 레이블 선택 (동률이면 먼저 나온 레이블)
+
+    Returns:
+        dict[int, str] - {user_id: 추천 레이블}
+    """
+    counts = defaultdict(Counter)
+    for user_id, rec_label in zip(user_ids, recommended_labels):
+        counts[int(user_id)][str(rec_label)] += 1
+    return {user_id: counter.most_common(1)[0][0] for user_id, counter in counts.items()}
+
+def aggregate_user_topk(user_ids, top_k_indices, top_k_scores):
+    """
+    row 단위 top-k (N, k) 를 사용자 단위로 합침
+    - 클래스별 점수 합 / 사용자 row 수 (top-k 밖의 클래스는 0 으로 간주한 평균 확률)
+    - 사용자별 점수 내림차순 상위 k 개
+
+    Returns:
+        dict[int, list[tuple[int, float]]] - {user_id: [(클래스 인덱스, 점수), ...]}
+    """
+    top_k_indices = np.asarray(top_k_indices)
+    k = top_k_indices.shape[1]
+    user_ids = np.asarray(user_ids).astype('int64')
+
+    flat = pd.DataFrame({
+        "user_id": np.repeat(user_ids, k),
+        "class_index": top_k_indices.ravel(),
+        "score": np.asarray(top_k_scores, dtype='float64').ravel(),
+    })
+    summed = flat.groupby(["user_id", "class_index"], sort=False)["score"].sum()
+    row_counts = pd.Series(user_ids).value_counts()
+    mean = summed / row_counts.reindex(summed.index.get_level_values("user_id")).to_numpy()
+    top = mean.sort_values(ascending=False, kind="stable").groupby(level="user_id", sort=False).head(k)
+
+    result = defaultdict(list)
+    for (user_id, class_index), score in top.items():
+        result[int(user_id)].append((int(class_index), float(score)))
+    return dict(result)
+
+def load_category_ids(session, labels):
+    """
+    모델 카테고리명 → categories.id (앞뒤 공백 제거 후 대소문자 무시 정확 일치)
+    - backend category_product_index.category_id 와 같은 규칙 → 사전 저장 payload 와 라이브 조회가 같은 카테고리를 사용
+
+    Returns:
+        dict[str, int] - 매칭되지 않은 레이블은 포함되지 않음
+    """
+    categories = session.query(Category.id, Category.name).order_by(Category.id).all()
+    by_name = {name.casefold(): category_id for category_id, name in categories}
+
+    category_ids = {}
+    for label in {str(label) for label in labels}:
+        category_id = by_name.get(label.strip().casefold())
+        if category_id is not None:
+            category_ids[label] = category_id
+    return category_ids
+
+def save_recommendations(session, user_ids, recommended_labels, model_type=ModelType.DEEP_LEARNING,
+                         chunk_size=SAVE_CHUNK_SIZE, top_k_indices=None, top_k_scores=None, class_labels=None):
     """
     추천 결과를 DB에 저장하거나 업데이트하는 함수
-    
+
     Args:
         session: DB 세션 (SQLAlchemy 세션)
         user_ids: list of int - 사용자 ID 리스트
         recommended_labels: list of str - 추천 결과 레이블 리스트 (pred_label)
         model_type: ModelType enum - 모델 유형
-    
+        chunk_size: int - 한 번에 처리할 사용자 수
+        top_k_indices: (N, k) array - row 별 상위 클래스 인덱스 (inference 반환값, 없으면 top-1 만 저장)
+        top_k_scores: (N, k) array - 위 인덱스의 확률
+        class_labels: 클래스 인덱스 → 카테고리명 (LabelEncoder.classes_)
+
     Returns:
-        None
+        int - 저장한 사용자 수
     """
-    for user_id, rec_label in zip(user_ids, recommended_labels):
-        # 추천 결과를 문자열 형태로 저장 (리스트가 아닌 단일 문자열)
-        rec_item_str = rec_label
-        
-        # 기존 추천 결과가 있으면 조회
-        existing_rec = session.query(Recommendation).filter_by(user_id=user_id).first()
-        
-        if existing_rec:
-            # 존재하면 업데이트 (추천 결과 및 기타 정보 갱신)
-            existing_rec.recommended_items = rec_item_str
-            existing_rec.model_type = model_type
-            existing_rec.generated_at = datetime.utcnow()
-        else:
-            # 없으면 신규 생성
-            recommendation = Recommendation(
-                user_id=user_id,
-                recommended_items=rec_item_str,
-                model_type=model_type,
-                generated_at=datetime.utcnow()
-            )
-            session.add(recommendation)
+    # 1) 같은 사용자의 여러 예측을 하나로 합침
+    #    - top-k 가 있으면: recommended_items = 순서대로 쉼표로 이은 카테고리명,
+    #      recommended_categories = [[category_id, score], ...] (점수 내림차순)
+    #    - 없으면: 기존처럼 최다 예측 레이블 하나
+    if top_k_indices is not None and class_labels is not None:
+        user_topk = aggregate_user_topk(user_ids, top_k_indices, top_k_scores)
+        category_ids = load_category_ids(session, class_labels)
+        user_labels = []
+        for user_id, ranked in user_topk.items():
+            labels = [str(class_labels[class_index]) for class_index, _ in ranked]
+            encoded = [
+                [category_ids[label], round(score, SCORE_DECIMALS)]
+                for label, (_, score) in zip(labels, ranked) if label in category_ids
+            ]
+            user_labels.append((user_id, ",".join(labels), encoded or None))
+    else:
+        user_labels = [
+            (user_id, rec_label, None)
+            for user_id, rec_label in dedupe_user_predictions(user_ids, recommended_labels).items()
+        ]
+    generated_at = datetime.utcnow()
+    table = Recommendation.__table__
+
+    for start in range(0, len(user_labels), chunk_size):
+        chunk = user_labels[start:start + chunk_size]
+
+        # 2) 기존 추천 결과를 IN 쿼리 한 번으로 조회 (사용자별 가장 최근 행)
+        existing_ids = dict(
+            session.query(Recommendation.user_id, func.max(Recommendation.id))
+            .filter(Recommendation.user_id.in_([user_id for user_id, *_ in chunk]))
+            .group_by(Recommendation.user_id)
+            .all()
+        )
+
+        # 3) 기존 행은 id로 덮어쓰고, 없으면 id=NULL 로 신규 생성 → 멀티 VALUES UPSERT 한 문장
+        values = [
+            {
+                "id": existing_ids.get(user_id),
+                "user_id": user_id,
+                "recommended_items": rec_label,
+                "recommended_categories": rec_categories,
+                "model_type": model_type,
+                "generated_at": generated_at,
+            }
+            for user_id, rec_label, rec_categories in chunk
+        ]
+        stmt = insert(table).values(values)
+        session.execute(stmt.on_duplicate_key_update(
+            recommended_items=stmt.inserted.recommended_items,
+            recommended_categories=stmt.inserted.recommended_categories,
+            model_type=stmt.inserted.model_type,
+            generated_at=stmt.inserted.generated_at,
+        ))
+
+        # 4) 사용자별 최신 추천 (user_id PK) 도 같은 값으로 UPSERT → 조회 시 이력 정렬 불필요
+        latest = insert(LatestRecommendation.__table__).values([
+            {key: value for key, value in row.items() if key != "id"} for row in values
+        ])
+        session.execute(latest.on_duplicate_key_update(
+            recommended_items=latest.inserted.recommended_items,
+            recommended_categories=latest.inserted.recommended_categories,
+            model_type=latest.inserted.model_type,
+            generated_at=latest.inserted.generated_at,
+        ))
     session.commit()
+
+    logger.info(f"✅ 추천 결과 저장 완료: 예측 {len(user_ids)}건 → 사용자 {len(user_labels)}명")
+    return len(user_labels)
@@ -0,0 +1,42 @@
+# [file] schemas/prediction.py
+# [description] 온라인 추론(/predict) 요청/응답 스키마
+from datetime import datetime
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+class TransactionFeatureRow(BaseModel):
+    customer_id: int
+    order_id: int = 0
+    order_date: datetime
+    product_id: int
+    product_category: str
+    quantity: int = 1
+    avg_price_per_item: float
+    shipping_fee: float = 0.0
+    coupon_used: bool = False
+    customer_city: Optional[str] = None
+    gender: Optional[str] = None
+    membership_days: int = 0
+    gst_rate: float = 0.0
+    order_month: int
+    coupon_code: Optional[str] = None
+    discount_value: float = 0.0
+    order_amount: float = 0.0
+
+class PredictRequest(BaseModel):
+    user_ids: List[int] = []                      # ML DB 의 최근 거래 특성으로 추론
+    rows: List[TransactionFeatureRow] = []        # 요청에 담긴 거래 특성으로 바로 추론
+    top_k: int = Field(3, ge=1)
+
+class CategoryScore(BaseModel):
+    category: str
+    category_index: int
+    probability: float
+
+class UserPrediction(BaseModel):
+    user_id: int
+    top_k: List[CategoryScore]
+
+class PredictResponse(BaseModel):
+    model_version: str
+    predictions: List[UserPrediction]
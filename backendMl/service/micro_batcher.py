@@ -0,0 +1,132 @@
+# [file] service / micro_batcher.py
+# [description] 동시에 들어온 온라인 추론 요청을 모아 한 번의 forward 로 처리하는 asyncio 기반 마이크로 배처
+import asyncio
+import bisect
+import logging
+import time
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+class Histogram:
+    """
+    상한값 기준 버킷 카운터 (마지막 버킷은 +Inf)
+    """
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += 1
+        self.sum += value
+
+    def snapshot(self):
+        labels = [f"le_{b}" for b in self.bounds] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.total,
+            "avg": self.sum / self.total if self.total else 0.0,
+        }
+
+class MicroBatcher:
+    """
+    submit() 으로 들어온 요청을 최대 max_wait_us 동안 또는 max_batch_rows 행이 찰 때까지 모은 뒤
+    wide_x / deep_x 를 이어 붙여 runner(loaded, wide_x, deep_x) 를 한 번 호출하고 결과를 요청별로 나눠 돌려줌
+    - 같은 모델 버전(loaded)의 요청끼리만 묶음 (모델 교체 직후 섞이지 않도록)
+    - forward 는 기본 executor 스레드에서 실행 → 이벤트 루프를 막지 않음
+    """
+    def __init__(self, runner, max_wait_us=2000, max_batch_rows=256):
+        self.runner = runner
+        self.max_wait = max_wait_us / 1_000_000
+        self.max_batch_rows = max_batch_rows
+        self.queue_depth = Histogram([0, 1, 2, 4, 8, 16, 32, 64, 128])
+        self.batch_rows = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256, 512])
+        self.batch_requests = Histogram([1, 2, 4, 8, 16, 32, 64])
+        self._queue = None
+        self._task = None
+        self._pending = None  # 다른 모델 버전이라 다음 배치로 넘긴 요청
+
+    async def submit(self, loaded, wide_x, deep_x):
+        """
+        요청 하나 (N행) 를 큐에 넣고 해당 N행의 출력 텐서를 기다림
+        """
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((loaded, wide_x, deep_x, future))
+        return await future
+
+    def stats(self):
+        return {
+            "max_wait_us": int(self.max_wait * 1_000_000),
+            "max_batch_rows": self.max_batch_rows,
+            "queue_depth": self.queue_depth.snapshot(),
+            "batch_rows": self.batch_rows.snapshot(),
+            "batch_requests": self.batch_requests.snapshot(),
+        }
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._pending = None
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                logger.error(f"❌ 마이크로 배치 추론 실패: {e}", exc_info=True)
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _collect(self):
+        # 1) 첫 요청 대기
+        if self._pending is not None:
+            first, self._pending = self._pending, None
+        else:
+            first = await self._queue.get()
+        self.queue_depth.observe(self._queue.qsize())
+
+        # 2) max_wait 안에서 max_batch_rows 까지 추가 요청 수집
+        batch = [first]
+        rows = first[1].shape[0]
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_rows:
+            if not self._queue.empty():
+                # 이미 도착한 요청은 기다리지 않고 바로 꺼냄
+                item = self._queue.get_nowait()
+            else:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            if item[0] is not first[0]:
+                self._pending = item
+                break
+            batch.append(item)
+            rows += item[1].shape[0]
+        return batch
+
+    async def _process(self, batch):
+        loaded = batch[0][0]
+        sizes = [item[1].shape[0] for item in batch]
+        wide_x = torch.cat([item[1] for item in batch])
+        deep_x = torch.cat([item[2] for item in batch])
+
+        self.batch_rows.observe(sum(sizes))
+        self.batch_requests.observe(len(batch))
+
+        output = await asyncio.get_running_loop().run_in_executor(None, self.runner, loaded, wide_x, deep_x)
+
+        for (*_, future), part in zip(batch, torch.split(output, sizes)):
+            if not future.done():
+                future.set_result(part)
@@ -0,0 +1,89 @@
+# [file] service / prediction_service.py
+# [description] 상주 모델(WideAndDeep)로 사용자/거래 특성에 대한 top-k 카테고리 확률을 계산하는 온라인 추론 로직
+import asyncio
+import pandas as pd
+import torch
+import torch.nn.functional as F
+from model.preprocess import (
+    to_feature_record, load_user_transaction_features, preprocess_for_inference,
+    WIDE_FEATURES, DEEP_FEATURES,
+)
+from model.registry import model_registry
+from service.micro_batcher import MicroBatcher
+
+async def predict_batched(ml_session, rows, user_ids, top_k):
+    """
+    온라인 추론 진입점 (/predict)
+    1) 입력: 요청에 담긴 거래 특성 rows, 없으면 ML DB 의 사용자별 최근 거래 특성 (user_ids)
+    2) 배치 추론과 동일한 전처리 (preprocess_for_inference, 상주 인코더/어휘 사용) → 스레드에서 수행해 이벤트 루프를 막지 않음
+    3) forward 는 micro_batcher 가 다른 동시 요청과 묶어서 한 번에 실행
+    4) 같은 사용자의 여러 row 는 확률 평균 후 top-k 선택
+
+    Returns:
+        (model_version, [{"user_id": int, "top_k": [{"category", "category_index", "probability"}]}])
+    """
+    loaded = await asyncio.to_thread(model_registry.get)
+    if rows:
+        df = pd.DataFrame([to_feature_record(row) for row in rows])
+    else:
+        df = await asyncio.to_thread(load_user_transaction_features, ml_session, user_ids)
+    if df.empty:
+        return loaded.version, []
+
+    row_user_ids, wide_x, deep_x = await asyncio.to_thread(prepare_inputs, loaded, df)
+    probs = await micro_batcher.submit(loaded, wide_x, deep_x)
+    return loaded.version, aggregate_topk(row_user_ids, probs, top_k, loaded.encoder)
+
+def prepare_inputs(loaded, df):
+    """
+    DataFrame → (user_ids, wide_x, deep_x) 텐서
+    """
+    user_ids = df["user_id"].astype(int).to_numpy()
+    wide_df, deep_df = preprocess_for_inference(df, WIDE_FEATURES, DEEP_FEATURES, encoder=loaded.encoder, vocab=loaded.vocab)
+
+    wide_x = torch.from_numpy(wide_df.to_numpy(dtype="float32")).to(loaded.device)
+    deep_x = torch.from_numpy(deep_df.to_numpy(dtype="float32")).to(loaded.device)
+    return user_ids, wide_x, deep_x
+
+def run_model(loaded, wide_x, deep_x):
+    """
+    forward 1회 → 클래스 확률 (N, C)
+    """
+    with torch.inference_mode():
+        output = loaded.model(wide_x, deep_x)
+        return output if loaded.model.use_softmax else F.softmax(output, dim=1)
+
+def aggregate_topk(user_ids, probs, top_k, encoder=None):
+    """
+    row 단위 확률 (N, C) 을 사용자 단위로 평균낸 뒤 top-k 카테고리 선택
+    """
+    inverse, unique_ids = pd.factorize(user_ids)
+    inverse = torch.from_numpy(inverse).to(probs.device)
+    summed = torch.zeros(len(unique_ids), probs.shape[1], device=probs.device).index_add_(0, inverse, probs)
+    counts = torch.bincount(inverse, minlength=len(unique_ids)).unsqueeze(1)
+    user_probs = summed / counts
+
+    k = min(top_k, user_probs.shape[1])
+    top_probs, top_idx = user_probs.topk(k, dim=1)
+    top_probs = top_probs.cpu().tolist()
+    top_idx = top_idx.cpu().tolist()
+
+    predictions = []
+    for user_id, idx_list, prob_list in zip(unique_ids, top_idx, top_probs):
+        labels = encoder.inverse_transform(idx_list) if encoder is not None else idx_list
+        predictions.append({
+            "user_id": int(user_id),
+            "top_k": [
+                {"category": str(label), "category_index": int(idx), "probability": float(prob)}
+                for label, idx, prob in zip(labels, idx_list, prob_list)
+            ],
+        })
+    return predictions
+
+# 프로세스 전역 마이크로 배처 (config.yaml serving 섹션)
+serving_cfg = model_registry.config.get('serving', {})
+micro_batcher = MicroBatcher(
+    run_model,
+    max_wait_us=serving_cfg.get('max_wait_us', 2000),
+    max_batch_rows=serving_cfg.get('max_batch_rows', 256),
+)
@@ -1,17 +1,91 @@
 # [file] service / sync_service.py
 # [description] 운영 DB에서 원시 데이터를 읽어와 ML DB에 삽입하는 동기화 로직 구현
 import logging
-from curd.read_data import get_order_summary
-from curd.write_ml_data import insert_transaction_features
+from datetime import datetime, timedelta
+from itertools import islice
+from curd.read_data import get_order_summary, get_order_keys_after, iter_order_summary_for_orders, iter_order_summary_between
+from curd.write_ml_data import insert_transaction_features, UPSERT_CHUNK_SIZE
 from curd.write_main_data import delete_processed_orders 
+from curd.sync_watermark import get_watermark, save_watermark
 
-def sync_data_to_ml_data(main_session, ml_session):
+SYNC_PAGE_SIZE = 500        # 한 페이지에 가져올 주문 수
+SYNC_MAX_PAGES = 20         # 한 주기에 처리할 최대 페이지 수 (밀린 데이터는 다음 주기에 이어서 처리)
+INITIAL_SYNC_DAYS = 365     # 워터마크가 없을 때 최초 수집 기간
+
+def sync_data_to_ml_data(main_session, ml_session, incremental=True):
+    """
+    incremental=True (기본): 워터마크 이후 신규 주문만 페이지 단위로 동기화 (sync_incremental)
+    incremental=False: 최근 1년 전체를 스트리밍으로 동기화 (sync_full_window)
+    """
+    if incremental:
+        return sync_incremental(main_session, ml_session)
+    return sync_full_window(main_session, ml_session, stream=True)
+
+def sync_incremental(main_session, ml_session, page_size=SYNC_PAGE_SIZE, max_pages=SYNC_MAX_PAGES):
+    """
+    1) ML DB에서 워터마크 (마지막 주문 created_at, id) 조회 (없으면 INITIAL_SYNC_DAYS 이전부터)
+    2) 워터마크 이후 주문을 page_size 단위로 조회
+    3) 주문 상세를 ML DB에 삽입 (UPSERT) 후 워터마크를 같은 트랜잭션에서 갱신 및 커밋
+    4) 더 이상 신규 주문이 없거나 max_pages에 도달하면 종료
+    """
+    mark = get_watermark(ml_session)
+    if mark is None:
+        mark = (datetime.utcnow() - timedelta(days=INITIAL_SYNC_DAYS), 0)
+        logging.info(f"📌 워터마크 없음, {INITIAL_SYNC_DAYS}일 전부터 동기화 시작")
+
+    total_orders = 0
+    total_rows = 0
+    for _ in range(max_pages):
+        # 2) 워터마크 이후 주문 키 조회
+        order_keys = get_order_keys_after(main_session, mark[0], mark[1], page_size)
+        if not order_keys:
+            break
+
+        # 3) 주문 상세 스트리밍 → 변환 → chunk 단위 UPSERT
+        order_ids = [k.id for k in order_keys]
+        row_count = write_in_chunks(
+            ml_session,
+            iter_row_dicts(iter_order_summary_for_orders(main_session, order_ids))
+        )
+        delete_processed_orders(main_session, order_ids)
+
+        # 데이터와 워터마크를 함께 커밋 → 실패 시 다음 주기에 같은 페이지부터 재시도
+        last = order_keys[-1]
+        mark = (last.created_at, last.id)
+        save_watermark(ml_session, mark[0], mark[1])
+        ml_session.commit()
+
+        total_orders += len(order_keys)
+        total_rows += row_count
+
+        # 4) 마지막 페이지
+        if len(order_keys) < page_size:
+            break
+
+    if total_orders == 0:
+        logging.info("🚫 처리할 주문 없음")
+        return
+
+    logging.info(f"📦 증분 동기화 완료: 주문 {total_orders}건, 상품 {total_rows}건")
+
+def sync_full_window(main_session, ml_session, stream=False):
     """
-    1) 운영 DB에서 최근 주문 데이터 조회
-    2) SQLAlchemy 결과를 딕셔너리 리스트로 변환
-    3) ML DB에 삽입 (UPSERT)
-    4) 처리 완료된 주문 ID를 운영 DB에서 삭제 (현재 주석 혹은 비활성화 상태)
+    stream=False: 최근 주문 샘플 조회 후 동기화 (get_order_summary, 개발 테스트용)
+    stream=True: 최근 1년 주문 전체를 서버 사이드 커서로 읽어 chunk 단위로 동기화 (메모리 사용량 일정)
     """
+    if stream:
+        now = datetime.utcnow()
+        since = now - timedelta(days=INITIAL_SYNC_DAYS)
+        row_count = write_in_chunks(
+            ml_session,
+            iter_row_dicts(iter_order_summary_between(main_session, since, now))
+        )
+        if row_count == 0:
+            logging.info("🚫 처리할 주문 없음")
+            return
+        logging.info(f"📦 처리 완료: {row_count}건")
+        return
+
     # 1) 운영 DB에서 최근 주문 데이터 조회
     raw_data = get_order_summary(main_session)
     if not raw_data:
@@ -30,13 +104,35 @@ def sync_data_to_ml_data(main_session, ml_session):
 
     logging.info(f"📦 처리 완료: {len(rows)}건")
 
+def write_in_chunks(ml_session, row_iter, chunk_size=UPSERT_CHUNK_SIZE):
+    """
+    row dict 이터레이터를 chunk_size 단위로 끊어 ML DB에 UPSERT
+    - 한 번에 chunk 하나만 메모리에 유지
+    - 스트리밍 중에는 운영 DB 세션 커넥션이 점유되므로 운영 DB 쓰기는 순회가 끝난 뒤 수행할 것
+    Returns: 적재한 row 수
+    """
+    total = 0
+    while True:
+        chunk = list(islice(row_iter, chunk_size))
+        if not chunk:
+            break
+        insert_transaction_features(ml_session, chunk, chunk_size=chunk_size)
+        total += len(chunk)
+    return total
+
 def transform_to_row_dict(order_data):
     """
     SQLAlchemy 쿼리 결과 객체 리스트를 ML DB 삽입용 dict 리스트로 변환
     - 타입 캐스팅 및 기본값 처리 포함
     """
-    return [
-        {
+    return list(iter_row_dicts(order_data))
+
+def iter_row_dicts(order_data):
+    """
+    transform_to_row_dict의 제너레이터 버전 (스트리밍 결과를 한 건씩 변환)
+    """
+    for r in order_data:
+        yield {
             "customer_id": r.customer_id,
             "order_id": r.order_id,
             "order_date": r.order_date,
@@ -56,5 +152,3 @@ def transform_to_row_dict(order_data):
             "order_amount": float(r.order_amount),
             "label": None
         }
-        for r in order_data
-    ]
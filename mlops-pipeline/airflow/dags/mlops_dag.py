@@ -12,6 +12,7 @@ from minio.error import S3Error
 from pathlib import Path
 from docker.types import Mount
 from generate_new_onlinesales import generate_new_onlinesales
+from feature_store import STORE_DIRNAME, MANIFEST_FNAME
 
 # 설정 상수
 CFG = OmegaConf.load("/opt/airflow/dags/config.yaml")
@@ -64,10 +65,10 @@ def check_and_upload_csv(**context):
 
 
 def _branch_by_merged_file(**_):
-    """merged_data.pkl 존재 여부로 분기"""
+    """피처 저장소(feature_store/manifest.json) 존재 여부로 분기"""
     client = Minio(M_ENDPOINT, M_ACCESS, M_SECRET, secure=False)
     try:
-        client.stat_object(RAW_BUCKET, "merged_data.pkl")
+        client.stat_object(RAW_BUCKET, f"{STORE_DIRNAME}/{MANIFEST_FNAME}")
         return "generate_new_onlinesales"  # 정규 사이클
     except S3Error:
         return "initial_merge"  # 초기 병합
@@ -0,0 +1,131 @@
+# artifact_cache.py
+# MinIO 오브젝트 로컬 캐시 (ETag 기준) + 프로세스 공용 MinIO 클라이언트
+#
+# - fetch: stat_object 로 ETag 확인 → 로컬 파일의 ETag/크기가 같으면 다운로드 생략
+# - fetch_many: 서로 독립적인 오브젝트를 스레드 풀로 병렬 다운로드
+# - upload: 업로드 결과 ETag 를 기록 → 방금 올린 파일은 다음 fetch 때 다시 받지 않음
+# - 인덱스: <data_dir>/.artifact_cache.json ({"bucket/object": {"etag", "size", "path"}})
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import urllib3
+from minio import Minio
+
+INDEX_FNAME = '.artifact_cache.json'
+ARTIFACT_FETCH_WORKERS = int(os.getenv("ARTIFACT_FETCH_WORKERS", 8))
+
+
+@lru_cache(maxsize=None)
+def get_minio_client(endpoint, access_key, secret_key):
+    """
+    접속 정보별 MinIO 클라이언트 1개 (커넥션 풀 공유, 병렬 다운로드 수만큼 풀 크기 확보)
+    """
+    http_client = urllib3.PoolManager(
+        maxsize=ARTIFACT_FETCH_WORKERS,
+        timeout=urllib3.Timeout(connect=10, read=300),
+        retries=urllib3.Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504]),
+    )
+    return Minio(endpoint, access_key=access_key, secret_key=secret_key,
+                 secure=False, http_client=http_client)
+
+
+@lru_cache(maxsize=None)
+def get_artifact_cache(data_dir, endpoint, access_key, secret_key):
+    """
+    data_dir 별 캐시 1개 (같은 프로세스 안의 make_features / merge_data / get_data_path 가 공유)
+    """
+    return ArtifactCache(get_minio_client(endpoint, access_key, secret_key), data_dir)
+
+
+class ArtifactCache:
+    def __init__(self, client, data_dir):
+        self.client = client
+        self.index_path = os.path.join(data_dir, INDEX_FNAME)
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    def fetch(self, bucket, object_name, local_path, etag=None):
+        """
+        오브젝트 → local_path (ETag 가 같고 로컬 파일이 온전하면 다운로드 생략)
+
+        Parameters:
+            etag: 이미 알고 있는 ETag (list_objects 결과 등) → stat_object 생략
+
+        Returns:
+            bool - 실제로 다운로드했는지
+        """
+        local_path = str(local_path)
+        if etag is None:
+            stat = self.client.stat_object(bucket, object_name)
+            etag, size = stat.etag, stat.size
+        else:
+            size = None
+
+        key = f"{bucket}/{object_name}"
+        cached = self._index.get(key)
+        if cached and cached['etag'] == etag and cached['path'] == local_path and self._intact(local_path, cached, size):
+            return False
+
+        os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+        tmp_path = f"{local_path}.part"
+        self.client.fget_object(bucket, object_name, tmp_path)
+        os.replace(tmp_path, local_path)
+        self._record(key, etag, local_path)
+        return True
+
+    def fetch_many(self, items, max_workers=ARTIFACT_FETCH_WORKERS):
+        """
+        여러 오브젝트 병렬 fetch
+
+        Parameters:
+            items: [(bucket, object_name, local_path) 또는 (bucket, object_name, local_path, etag), ...]
+
+        Returns:
+            dict - {object_name: 다운로드 여부 또는 Exception}
+        """
+        items = list(items)
+        if not items:
+            return {}
+
+        def run(item):
+            try:
+                return self.fetch(*item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            results = list(pool.map(run, items))
+        return {item[1]: result for item, result in zip(items, results)}
+
+    def upload(self, bucket, object_name, local_path):
+        """
+        fput_object 후 결과 ETag 기록
+        """
+        result = self.client.fput_object(bucket, object_name, str(local_path))
+        self._record(f"{bucket}/{object_name}", result.etag, str(local_path))
+        return result
+
+    def _intact(self, local_path, cached, size):
+        if not os.path.exists(local_path):
+            return False
+        actual = os.path.getsize(local_path)
+        return actual == cached['size'] and (size is None or actual == size)
+
+    def _record(self, key, etag, local_path):
+        with self._lock:
+            self._index[key] = {"etag": etag, "size": os.path.getsize(local_path), "path": local_path}
+            os.makedirs(os.path.dirname(self.index_path) or '.', exist_ok=True)
+            tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.index_path)
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
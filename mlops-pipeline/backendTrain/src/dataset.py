@@ -1,18 +1,39 @@
 import os
+import json
+import shutil
+from datetime import datetime, timezone
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import joblib
-from minio import Minio
-from utils import get_data_path, mapping_columns, split_wide_deep_by_type, CATEGORY_MAP, MONTH_MAP
+from artifact_cache import get_artifact_cache, get_minio_client
+from utils import get_data_path, fetch_raw_data, read_raw_data, read_raw_csv, mapping_columns, split_wide_deep_by_type, wide_deep_columns, file_sha256, CATEGORY_MAP, MONTH_MAP
+from feature_vocab import (VOCAB_DIRNAME, META_FNAME, build_feature_vocab, save_feature_vocab,
+                           load_feature_vocab, encode_with_vocab, vocab_files)
+from feature_store import (STORE_DIRNAME, MANIFEST_FNAME, ROW_COL, write_feature_store, append_feature_store,
+                           read_feature_store, read_manifest, upload_feature_store, row_groups, read_row_group)
 
 import torch
-from torch.utils.data import Dataset
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
 from sklearn.preprocessing import LabelEncoder
 from pathlib import Path
 
 print("Current Working Directory:", os.getcwd())
 SYMBOLS = ['Customer', 'Discount', 'Marketing',
            'Onlinesales', 'Tax']  # !!! 수정 금지 !!!
+MERGE_SOURCE_SYMBOLS = ['Customer', 'Discount', 'Onlinesales', 'Tax']  # 병합 결과에 영향을 주는 원본 CSV
+DIM_CACHE_DIRNAME = 'dimension_cache'
+INCREMENTAL_MERGE = os.getenv("INCREMENTAL_MERGE", "true").lower() == "true"
+APPLIED_NEW_SALES_KEEP = 100  # manifest 에 기록해 둘 반영 완료 새 거래 CSV sha256 개수
+APPLIED_NEW_SALES_PREFIX = 'applied/'             # new-sales 버킷의 반영 완료 새 거래 CSV 보관 위치 (<반영시각>-<sha256>.csv)
+APPLIED_NEW_SALES_DIRNAME = 'new_sales_applied'   # 보관 CSV 로컬 사본 (전체 재병합 시 재생)
+IN_COLUMNS = ['고객ID', '거래ID', '거래날짜', '제품ID', '제품카테고리', '수량', '평균금액', '배송료', '쿠폰상태',
+              '성별', '고객지역', '가입기간', 'GST', '월', '쿠폰코드', '할인율', '거래금액']
+OUT_COLUMNS = ['제품카테고리']
+LABEL_COLS = ['성별', '고객지역', '쿠폰코드', '월', '고객ID', '거래ID', '제품ID', '쿠폰상태']  # 어휘로 인코딩할 문자열형 컬럼
+VALID_ROWS = 100  # 병합 순서 마지막 N 행은 검증용 (is_training=False)
+STREAM_SHUFFLE_BUFFER = int(os.getenv("STREAM_SHUFFLE_BUFFER", 200000))  # 스트리밍 학습 셔플 버퍼 (행 수)
 
 
 class InfoDataset(Dataset):
@@ -21,19 +42,13 @@ class InfoDataset(Dataset):
                  minio_access_key="admin", minio_secret_key="admin",
                  raw_data_bucket="raw-data", new_sales_bucket="new-sales", **kwargs):
         if in_columns is None:
-            in_columns = ['고객ID', '거래ID', '거래날짜', '제품ID', '제품카테고리', '수량', '평균금액', '배송료', '쿠폰상태',
-                          '성별', '고객지역', '가입기간', 'GST', '월', '쿠폰코드', '할인율', '거래금액']
+            in_columns = IN_COLUMNS
         if out_columns is None:
-            out_columns = ['제품카테고리']
+            out_columns = OUT_COLUMNS
 
         print("[DEBUG] MinIO endpoint:", minio_endpoint)
 
-        self.minio_client = Minio(
-            minio_endpoint,
-            access_key=minio_access_key,
-            secret_key=minio_secret_key,
-            secure=False
-        )
+        self.minio_client = get_minio_client(minio_endpoint, minio_access_key, minio_secret_key)
         self.raw_data_bucket = raw_data_bucket
         self.new_sales_bucket = new_sales_bucket
 
@@ -52,124 +67,508 @@ class InfoDataset(Dataset):
         return (self.wide_x[idx], self.deep_x[idx]), self.y[idx]
 
 
+class StreamingInfoDataset(IterableDataset):
+    """
+    InfoDataset 의 스트리밍 버전 (메모리보다 큰 피처 저장소 학습용)
+
+    1. __init__: 저장소 동기화 후 row group 단위 1회 스캔 (어휘/타겟 컬럼만) → 어휘, LabelEncoder, 검증 분할 기준 준비
+    2. __iter__: row group 을 하나씩 읽어 make_features 와 같은 변환 → 셔플 버퍼에서 섞어 한 행씩 반환
+       - 에폭마다 row group 순서를 섞고 (set_epoch), DataLoader worker 별로 row group 을 나눠 읽음
+    - 메모리: row group 1개 + 셔플 버퍼 (shuffle_buffer 행) + 어휘
+    - wide_input_dim / deep_input_dim / num_classes 는 데이터를 전부 읽지 않고 속성으로 제공
+    """
+    def __init__(self, is_training=True, in_columns=None, out_columns=None, data_dir='/opt/airflow/data',
+                 new_onlinesales_path=None, minio_endpoint="127.0.0.1:9000",
+                 minio_access_key="admin", minio_secret_key="admin",
+                 raw_data_bucket="raw-data", new_sales_bucket="new-sales",
+                 shuffle_buffer=STREAM_SHUFFLE_BUFFER, seed=None, **kwargs):
+        self.is_training = is_training
+        self.in_columns = list(in_columns or IN_COLUMNS)
+        self.out_column = (out_columns or OUT_COLUMNS)[0]
+        self.use_columns = list(dict.fromkeys(self.in_columns + [self.out_column]))
+        self.store_dir = Path(data_dir) / STORE_DIRNAME
+        self.shuffle_buffer = shuffle_buffer if is_training else 0
+        self.seed = torch.initial_seed() if seed is None else seed
+        self.epoch = 0
+        self._indexes = {}  # 컬럼별 어휘 pd.Index (프로세스마다 처음 쓸 때 한 번 생성, pickle 제외)
+
+        cache = get_artifact_cache(str(data_dir), minio_endpoint, minio_access_key, minio_secret_key)
+        sync_feature_store(self.store_dir, data_dir, new_onlinesales_path, cache,
+                           minio_endpoint, minio_access_key, minio_secret_key, raw_data_bucket, new_sales_bucket)
+
+        uniques, targets, groups, split_row, num_rows = scan_feature_store(
+            self.store_dir, [col for col in LABEL_COLS if col in self.use_columns], self.out_column)
+        self.vocab = load_or_build_vocab(uniques, list(uniques), is_training, data_dir, cache, raw_data_bucket)
+        self.encoder = load_or_fit_label_encoder(targets, is_training, Path(data_dir) / "label_encoder.pkl",
+                                                 cache, raw_data_bucket)
+
+        # 학습: 병합 순서 split_row 미만, 검증: 이상 (make_features 의 [:-VALID_ROWS] / [-VALID_ROWS:] 와 같은 분할)
+        self.row_range = (0, split_row) if is_training else (split_row, None)
+        self.row_groups = [group for group in groups if self._overlaps(group)]
+        self.num_samples = num_rows - VALID_ROWS if is_training else min(num_rows, VALID_ROWS)
+        self.num_samples = max(self.num_samples, 0)
+
+        # 입력 컬럼 순서는 행이 없는 프레임으로 결정 (변환 후 dtype 기준 → make_features 와 같은 순서)
+        empty = self._transform(read_row_group(self.store_dir, groups[0]['file'], groups[0]['index'],
+                                               self.use_columns).iloc[:0])
+        self.wide_cols, self.deep_cols = wide_deep_columns(empty[mapping_columns(self.in_columns)])
+        self.wide_input_dim, self.deep_input_dim = len(self.wide_cols), len(self.deep_cols)
+        self.num_classes = len(self.encoder.classes_)
+        print(f"[DEBUG] streaming {self.store_dir}: rows={self.num_samples}, row_groups={len(self.row_groups)}, "
+              f"shuffle_buffer={self.shuffle_buffer}")
+
+    def __len__(self):
+        return self.num_samples
+
+    def __getstate__(self):
+        # DataLoader worker 로 보낼 때 어휘 Index 는 빼고 보냄 (worker 에서 다시 생성)
+        state = self.__dict__.copy()
+        state['_indexes'] = {}
+        return state
+
+    def set_epoch(self, epoch):
+        """
+        에폭마다 호출 → row group 순서 / 셔플 버퍼 난수가 에폭별로 달라짐 (worker 프로세스에도 전달됨)
+        """
+        self.epoch = epoch
+
+    def __iter__(self):
+        worker = get_worker_info()
+        worker_id, num_workers = (worker.id, worker.num_workers) if worker is not None else (0, 1)
+
+        # 모든 worker 가 같은 순서로 섞은 뒤 자기 몫(row group)만 읽음 → 행 중복/누락 없음
+        groups = list(self.row_groups)
+        if self.shuffle_buffer:
+            order = np.random.default_rng([self.seed, self.epoch]).permutation(len(groups))
+            groups = [groups[i] for i in order]
+        groups = groups[worker_id::num_workers]
+        rng = np.random.default_rng([self.seed, self.epoch, worker_id])
+
+        buffer, buffered = [], 0
+        for group in groups:
+            chunk = self._load(group)
+            if not self.shuffle_buffer:
+                yield from self._rows(chunk)
+                continue
+            buffer.append(chunk)
+            buffered += len(chunk[2])
+            if buffered >= self.shuffle_buffer:
+                yield from self._rows(self._concat(buffer), rng)
+                buffer, buffered = [], 0
+        if buffer:
+            yield from self._rows(self._concat(buffer), rng)
+
+    def _overlaps(self, group):
+        start, end = self.row_range
+        if group['row_min'] is None:
+            return True
+        return group['row_max'] >= start and (end is None or group['row_min'] < end)
+
+    def _load(self, group):
+        """
+        row group 1개 → (wide, deep, y) 텐서 (분할 범위 밖 / 타겟 결측 행 제외)
+        """
+        df = read_row_group(self.store_dir, group['file'], group['index'], self.use_columns)
+        start, end = self.row_range
+        keep = (df[ROW_COL] >= start) & df[self.out_column].notna()
+        if end is not None:
+            keep &= df[ROW_COL] < end
+        df = self._transform(df[keep.to_numpy()].reset_index(drop=True))
+        return (torch.from_numpy(df[self.wide_cols].to_numpy(dtype=np.float32)),
+                torch.from_numpy(df[self.deep_cols].to_numpy(dtype=np.float32)),
+                torch.from_numpy(df[mapping_columns([self.out_column])[0]].to_numpy(dtype=np.float32)))
+
+    def _transform(self, df):
+        """
+        make_features 와 같은 결측 채우기 / 어휘 인코딩 / 타겟 인코딩 / 영문 컬럼명
+        """
+        fill_missing(df)
+        for col in LABEL_COLS:
+            if col in df.columns:
+                df[col] = encode_with_vocab(df[col], self._index(col))
+        df[self.out_column] = encode_with_vocab(df[self.out_column], self._index(self.out_column))
+        df = df[self.use_columns]
+        df.columns = mapping_columns(df.columns.tolist())
+        return df
+
+    def _index(self, col):
+        """
+        컬럼별 어휘 pd.Index (타겟 컬럼은 LabelEncoder classes_) → row group 마다 다시 만들지 않음
+        """
+        index = self._indexes.get(col)
+        if index is None:
+            vocab = self.encoder.classes_ if col == self.out_column else self.vocab[mapping_columns([col])[0]]
+            index = self._indexes[col] = pd.Index(vocab)
+        return index
+
+    @staticmethod
+    def _concat(chunks):
+        return tuple(torch.cat(parts) for parts in zip(*chunks))
+
+    @staticmethod
+    def _rows(chunk, rng=None):
+        wide, deep, y = chunk
+        order = rng.permutation(len(y)) if rng is not None else range(len(y))
+        for idx in order:
+            yield (wide[idx], deep[idx]), y[idx]
+
+
 def merge_data(symbols, data_dir, new_onlinesales_path=None,
                minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
                minio_secret_key="admin", raw_data_bucket="raw-data", new_sales_bucket="new-sales"):
+    """
+    전체 병합: 원본 CSV 5종 + 이전 사이클에 반영한 새 거래 CSV (보관본, 반영 순서) + 이번 새 거래 CSV 를 모두 읽어 병합
+    - 보관본을 다시 붙이므로 전체 재병합(원본 CSV 변경 등)을 해도 증분 추가했던 거래가 빠지지 않음
+
+    Returns:
+        merged (pd.DataFrame), sources (dict - 증분 병합 검증용 원본 CSV sha256),
+        applied (list - 병합에 포함된 새 거래 CSV sha256, 반영 순서)
+    """
     print("merging raw csv files...")
 
-    # 기본 5종 로드
-    dfs = {symbol: pd.read_csv(get_data_path(
-        symbol, data_dir, minio_endpoint, minio_access_key, minio_secret_key, raw_data_bucket))
-        for symbol in symbols}
+    # 기본 5종 로드 (ETag 가 바뀐 CSV 만 병렬 다운로드)
+    paths = fetch_raw_data(symbols, data_dir, minio_endpoint, minio_access_key,
+                           minio_secret_key, raw_data_bucket)
+    dfs = read_raw_data(paths)
 
     for name, df in dfs.items():
         print(f"[DEBUG] {name} rows: {len(df)}")
 
-    # 새 거래 CSV가 지정된 경우에만 시도
-    if new_onlinesales_path:
-        client = Minio(minio_endpoint, access_key=minio_access_key,
-                       secret_key=minio_secret_key, secure=False)
-        fetched = False
-        try:
-            # 오브젝트 존재 확인 후 다운로드
-            client.stat_object(new_sales_bucket, "Onlinesales_new.csv")
-            client.fget_object(
-                new_sales_bucket, "Onlinesales_new.csv", new_onlinesales_path)
+    # 차원 테이블 캐시 갱신 (다음 사이클의 증분 병합에서 CSV 파싱 없이 사용)
+    sources = {symbol: file_sha256(paths[symbol]) for symbol in MERGE_SOURCE_SYMBOLS}
+    dims = save_dimension_tables(dfs, data_dir, sources)
+
+    # 보관된 새 거래 CSV (이전 사이클 반영분) + 새 거래 CSV가 지정된 경우 이번 CSV (같은 sha256 은 한 번만)
+    cache = get_artifact_cache(str(data_dir), minio_endpoint, minio_access_key, minio_secret_key)
+    batches = dict(fetch_applied_new_sales(data_dir, cache, new_sales_bucket))
+    new_path = fetch_new_onlinesales(data_dir, new_onlinesales_path, minio_endpoint, minio_access_key,
+                                     minio_secret_key, new_sales_bucket)
+    if new_path:
+        batches.setdefault(file_sha256(new_path), new_path)
+    if batches:
+        new_dfs = [read_raw_csv(path, 'Onlinesales') for path in batches.values()]
+        # 기존 Onlinesales 에 "추가"
+        dfs['Onlinesales'] = pd.concat(
+            [dfs['Onlinesales']] + new_dfs, ignore_index=True)
+        print(
+            f"[DEBUG] Onlinesales rows after concat: {len(dfs['Onlinesales'])} (new sales batches: {len(batches)})")
+
+    merged = _merge_frames(dfs['Onlinesales'], dims)
+    print("🔍 최종 병합된 컬럼 목록:", merged.columns.tolist())
+    return merged, sources, list(batches)
+
+
+def merge_new_sales(data_dir, new_path, minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
+                    minio_secret_key="admin", raw_data_bucket="raw-data"):
+    """
+    증분 병합: 새 거래 CSV 행만 캐시된 차원 테이블과 조인 (사이클 비용 O(새 행))
+
+    Returns:
+        merged_new (pd.DataFrame), sources (dict) - 차원 캐시가 원본 CSV 와 다르면 (None, sources)
+    """
+    paths = fetch_raw_data(MERGE_SOURCE_SYMBOLS, data_dir, minio_endpoint, minio_access_key,
+                           minio_secret_key, raw_data_bucket)
+    sources = {symbol: file_sha256(path) for symbol, path in paths.items()}
+    dims = load_dimension_tables(data_dir, sources)
+    if dims is None:
+        return None, sources
+
+    new_df = read_raw_csv(new_path, 'Onlinesales')
+    print(f"[DEBUG] Onlinesales_new rows: {len(new_df)}")
+    return _merge_frames(new_df, dims), sources
+
+
+def fetch_new_onlinesales(data_dir, new_onlinesales_path, minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
+                          minio_secret_key="admin", new_sales_bucket="new-sales"):
+    """
+    MinIO new_sales 버킷의 Onlinesales_new.csv → new_onlinesales_path (실패 시 로컬 파일 사용)
+
+    Returns:
+        str | None - 사용할 로컬 경로 (없으면 None)
+    """
+    if not new_onlinesales_path:
+        return None
+    cache = get_artifact_cache(data_dir, minio_endpoint, minio_access_key, minio_secret_key)
+    fetched = False
+    try:
+        # 오브젝트 존재/ETag 확인 후 바뀐 경우만 다운로드
+        if cache.fetch(new_sales_bucket, "Onlinesales_new.csv", new_onlinesales_path):
             print(
                 f"Downloaded Onlinesales_new.csv from MinIO: {new_sales_bucket}/Onlinesales_new.csv")
-            fetched = True
-        except Exception as e:
-            print(f"[INFO] MinIO 에서 Onlinesales_new.csv 확인/다운로드 실패: {e}")
-
-        # 로컬에 있으면 사용 (MinIO 실패시 대체)
-        if fetched or os.path.exists(new_onlinesales_path):
-            new_df = pd.read_csv(new_onlinesales_path)
-            # 기존 Onlinesales 에 "추가"
-            dfs['Onlinesales'] = pd.concat(
-                [dfs['Onlinesales'], new_df], ignore_index=True)
-            print(
-                f"[DEBUG] Onlinesales rows after concat: {len(dfs['Onlinesales'])}")
-        else:
-            print("[INFO] Onlinesales_new.csv 가 MinIO/로컬에 없음. 새 거래 병합 생략.")
-
+        fetched = True
+    except Exception as e:
+        print(f"[INFO] MinIO 에서 Onlinesales_new.csv 확인/다운로드 실패: {e}")
+
+    # 로컬에 있으면 사용 (MinIO 실패시 대체)
+    if fetched or os.path.exists(new_onlinesales_path):
+        return new_onlinesales_path
+    print("[INFO] Onlinesales_new.csv 가 MinIO/로컬에 없음. 새 거래 병합 생략.")
+    return None
+
+
+def archive_new_sales(data_dir, new_path, new_sha, cache, new_sales_bucket="new-sales"):
+    """
+    반영하는 새 거래 CSV 를 로컬 사본 + new-sales 버킷 applied/<반영시각>-<sha256>.csv 로 보관
+    - Onlinesales_new.csv 는 매 사이클 덮어써지므로, 전체 재병합 때 이전 반영분을 다시 붙이려면 보관본이 필요
+    - 같은 sha256 이 이미 보관돼 있으면 생략 (재시도 / 학습 단계 재호출)
+    - 업로드 실패 시 로컬 사본만 남김 → 다음 fetch_applied_new_sales 에서 다시 업로드
+    """
+    local_dir = Path(data_dir) / APPLIED_NEW_SALES_DIRNAME
+    if any(local_dir.glob(f"*-{new_sha}.csv")):
+        return
+    os.makedirs(local_dir, exist_ok=True)
+    name = f"{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}-{new_sha}.csv"
+    shutil.copyfile(new_path, local_dir / f"{name}.tmp")
+    os.replace(local_dir / f"{name}.tmp", local_dir / name)
+    try:
+        cache.upload(new_sales_bucket, APPLIED_NEW_SALES_PREFIX + name, local_dir / name)
+    except Exception as e:
+        print(f"[INFO] 새 거래 CSV 보관본 업로드 실패 (로컬 사본 유지): {e}")
+
+
+def fetch_applied_new_sales(data_dir, cache, new_sales_bucket="new-sales"):
+    """
+    보관된 새 거래 CSV 를 반영 순서대로 준비
+
+    1. new-sales 버킷 applied/ 목록 기준으로 로컬에 없는 (ETag 가 바뀐) 파일만 병렬 다운로드
+    2. 로컬에만 있는 파일 (업로드 실패분) 은 업로드
+    3. 파일명(반영시각) 순 정렬, 같은 sha256 은 처음 것만
+    - MinIO 실패 시 로컬 사본만 사용
+
+    Returns:
+        list - [(sha256, 로컬 경로), ...]
+    """
+    local_dir = Path(data_dir) / APPLIED_NEW_SALES_DIRNAME
+    os.makedirs(local_dir, exist_ok=True)
+    try:
+        remote = {obj.object_name[len(APPLIED_NEW_SALES_PREFIX):]: obj.etag
+                  for obj in cache.client.list_objects(new_sales_bucket, prefix=APPLIED_NEW_SALES_PREFIX)}
+        results = cache.fetch_many(
+            (new_sales_bucket, APPLIED_NEW_SALES_PREFIX + name, str(local_dir / name), etag)
+            for name, etag in remote.items())
+        failed = [name for name, result in results.items() if isinstance(result, Exception)]
+        if failed:
+            print(f"[INFO] 새 거래 CSV 보관본 다운로드 실패 {len(failed)}개 (로컬 사본만 사용): {failed[:3]}")
+        for path in local_dir.glob("*.csv"):
+            if path.name not in remote:
+                cache.upload(new_sales_bucket, APPLIED_NEW_SALES_PREFIX + path.name, path)
+    except Exception as e:
+        print(f"[INFO] MinIO {new_sales_bucket}/{APPLIED_NEW_SALES_PREFIX} 동기화 실패 (로컬 사본만 사용): {e}")
+
+    batches = {}
+    for path in sorted(local_dir.glob("*.csv")):
+        batches.setdefault(path.stem.split('-', 1)[1], str(path))
+    return list(batches.items())
+
+
+def _merge_frames(onlinesales, dims):
+    """
+    거래 행 + 차원 테이블 조인 (전체 / 증분 병합 공통)
+    - dims: 조인 키로 인덱스된 Customer(고객ID) / Tax(제품카테고리) / Discount(제품카테고리, 월)
+    """
     # 병합 순서: Onlinesales + Customer → Tax → Discount
-    merged = pd.merge(dfs['Onlinesales'], dfs['Customer'], on='고객ID')
-    merged = pd.merge(merged, dfs['Tax'], on='제품카테고리')
+    merged = onlinesales.join(dims['Customer'], on='고객ID', how='inner')
+    merged = merged.join(dims['Tax'], on='제품카테고리', how='inner')
 
     # 제품카테고리 매핑
     merged['제품카테고리'] = merged['제품카테고리'].map(
         CATEGORY_MAP).fillna(merged['제품카테고리'])
 
-    # Discount에서 'Notebooks' 제외
-    discount_df = dfs['Discount'][dfs['Discount']
-                                  ['제품카테고리'] != 'Notebooks'].copy()
-
-    # 월 파생 후 문자열로 매핑
-    merged['월'] = pd.to_datetime(merged['거래날짜']).dt.month.map(MONTH_MAP)
+    # 월 파생 후 문자열로 매핑 (거래날짜는 read_raw_csv 에서 datetime64 로 한 번만 파싱)
+    if not pd.api.types.is_datetime64_any_dtype(merged['거래날짜']):
+        merged['거래날짜'] = pd.to_datetime(merged['거래날짜'], errors='coerce')
+    merged['월'] = merged['거래날짜'].dt.month.map(MONTH_MAP)
 
     # Discount 병합
-    merged = pd.merge(merged, discount_df, on=['제품카테고리', '월'])
+    merged = merged.join(dims['Discount'], on=['제품카테고리', '월'], how='inner')
+    merged = merged.reset_index(drop=True)
 
-    # 거래날짜 정수화
-    merged['거래날짜'] = pd.to_datetime(merged['거래날짜'], errors='coerce')
-    merged['거래날짜'] = merged['거래날짜'].dt.strftime('%Y%m%d').astype(float)
+    # 거래날짜 정수화 (YYYYMMDD, 문자열 변환 없이 연/월/일 산술, NaT → NaN)
+    dates = merged['거래날짜'].dt
+    merged['거래날짜'] = (dates.year * 10000 + dates.month * 100 + dates.day).astype(float)
 
     # 거래금액 공식 적용
     merged['거래금액'] = merged['평균금액'] * merged['수량'] * \
         (1 + merged['GST']) + merged['배송료']
-
-    print("🔍 최종 병합된 컬럼 목록:", merged.columns.tolist())
     return merged
 
 
+def _index_dimension_tables(dfs):
+    # Discount에서 'Notebooks' 제외
+    discount_df = dfs['Discount'][dfs['Discount']['제품카테고리'] != 'Notebooks']
+    return {
+        'Customer': dfs['Customer'].set_index('고객ID'),
+        'Tax': dfs['Tax'].set_index('제품카테고리'),
+        'Discount': discount_df.set_index(['제품카테고리', '월']),
+    }
+
+
+def save_dimension_tables(dfs, data_dir, sources):
+    """
+    조인 키로 인덱스된 차원 테이블을 data_dir/dimension_cache 에 Parquet 으로 저장 (meta.json: 원본 CSV sha256)
+    """
+    dims = _index_dimension_tables(dfs)
+    cache_dir = Path(data_dir) / DIM_CACHE_DIRNAME
+    os.makedirs(cache_dir, exist_ok=True)
+    for symbol, dim in dims.items():
+        dim.to_parquet(cache_dir / f"{symbol}.parquet")
+    with open(cache_dir / "meta.json", 'w', encoding='utf-8') as f:
+        json.dump({"sources": sources}, f, ensure_ascii=False, indent=2)
+    return dims
+
+
+def load_dimension_tables(data_dir, sources):
+    """
+    차원 테이블 캐시 로드 (원본 CSV sha256 이 저장 시점과 다르면 None → 전체 병합)
+    """
+    cache_dir = Path(data_dir) / DIM_CACHE_DIRNAME
+    try:
+        with open(cache_dir / "meta.json", encoding='utf-8') as f:
+            cached = json.load(f)["sources"]
+    except (OSError, ValueError, KeyError):
+        return None
+    if any(cached.get(symbol) != sources[symbol] for symbol in ('Customer', 'Discount', 'Tax')):
+        print("[INFO] 차원 테이블 원본 CSV 변경 감지. 전체 병합으로 전환.")
+        return None
+    return {symbol: pd.read_parquet(cache_dir / f"{symbol}.parquet")
+            for symbol in ('Customer', 'Tax', 'Discount')}
+
+
 def make_features(in_columns, out_columns, is_training, data_dir='/opt/airflow/data', new_onlinesales_path=None,
                   minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
                   minio_secret_key="admin", raw_data_bucket="raw-data", new_sales_bucket="new-sales"):
 
-    save_fname = 'merged_data.pkl'
-
-    merged_path = Path(data_dir) / save_fname
+    store_dir = Path(data_dir) / STORE_DIRNAME
     label_path = Path(data_dir) / "label_encoder.pkl"
 
-    client = Minio(minio_endpoint, access_key=minio_access_key,
-                   secret_key=minio_secret_key, secure=False)
+    cache = get_artifact_cache(str(data_dir), minio_endpoint, minio_access_key, minio_secret_key)
 
-    # Download merged_data.pkl from MinIO if exists
-    if not new_onlinesales_path and os.path.exists(merged_path):
-        print(f'loading from {merged_path}')
-        df = pd.read_pickle(merged_path)
-    else:
-        print('merging raw csv files...')
-        df = merge_data(SYMBOLS, data_dir, new_onlinesales_path,
-                        minio_endpoint, minio_access_key, minio_secret_key, raw_data_bucket, new_sales_bucket)
-        df.to_pickle(merged_path)
-        print(f'saved to {merged_path}')
-        # Upload to MinIO raw_data bucket
-        try:
-            client.fput_object(raw_data_bucket, save_fname, merged_path)
-            print(
-                f"Uploaded {save_fname} to MinIO: {raw_data_bucket}/{save_fname}")
-        except Exception as e:
-            print(f"Failed to upload {save_fname} to MinIO: {e}")
+    # 병합 데이터는 월별 Parquet 피처 저장소 (필요한 컬럼만 읽음)
+    use_columns = list(dict.fromkeys(in_columns + out_columns))
+    sync_feature_store(store_dir, data_dir, new_onlinesales_path, cache,
+                       minio_endpoint, minio_access_key, minio_secret_key, raw_data_bucket, new_sales_bucket)
+    df = read_feature_store(store_dir, columns=use_columns)
 
     df.dropna(subset=out_columns, inplace=True)
-    df.fillna(0, inplace=True)
+    fill_missing(df)
 
-    # 문자열형 컬럼 인코딩
-    label_cols = ['성별', '고객지역', '쿠폰코드', '월', '고객ID', '거래ID', '제품ID', '쿠폰상태']
-    for col in label_cols:
+    # 문자열형 컬럼 인코딩 (학습 시 어휘를 한 번 만들어 저장 → 검증/서빙은 같은 어휘로 인코딩)
+    vocab = load_or_build_vocab(df, LABEL_COLS, is_training, data_dir, cache, raw_data_bucket)
+    for col in LABEL_COLS:
         if col in df.columns:
-            df[col] = LabelEncoder().fit_transform(df[col].astype(str))
+            df[col] = encode_with_vocab(df[col], vocab[mapping_columns([col])[0]])
 
     # 타겟 인코딩
+    encoder = load_or_fit_label_encoder(df[out_columns[0]], is_training, label_path, cache, raw_data_bucket)
+    df[out_columns[0]] = encoder.transform(df[out_columns[0]])
+
+    df = df[in_columns + out_columns]
+    df = df.loc[:, ~df.columns.duplicated()]
+
+    df.columns = mapping_columns(df.columns.tolist())
+    in_columns = mapping_columns(in_columns)
+    out_columns = mapping_columns(out_columns)
+
+    x_df = df[in_columns]
+    y = df[out_columns].to_numpy().astype(float).squeeze()
+
+    wide_x, deep_x = split_wide_deep_by_type(x_df)
+
+    return ((wide_x[:-VALID_ROWS], deep_x[:-VALID_ROWS]), y[:-VALID_ROWS]) if is_training \
+        else ((wide_x[-VALID_ROWS:], deep_x[-VALID_ROWS:]), y[-VALID_ROWS:])
+
+
+def scan_feature_store(store_dir, label_cols, target_col):
+    """
+    스트리밍 학습 준비용 1회 스캔 (row group 단위, 어휘/타겟/행 순서 컬럼만)
+
+    1. row group 을 Arrow Table 로 읽어 타겟 결측 행 제외
+    2. 컬럼별 고유값은 pyarrow.compute.unique (dictionary 컬럼은 사용된 코드만) → 문자열 numpy 배열
+    3. row group 별 고유값 배열을 모아 두었다가 누적 크기만큼 쌓이면 한 번에 정렬 병합 (_merge_uniques)
+    - 메모리: row group 1개 + 컬럼별 고유값 배열 (Python set / 객체 없이 고정폭 문자열)
+      고유값 자체는 줄일 수 없음 → 거래ID 처럼 행마다 다른 컬럼은 O(행 수). 이 크기는 만들어질 어휘
+      (feature_vocab/*.npy) 와 같으므로 어휘를 만드는 이상 스캔이 그보다 커지지는 않음
+
+    Returns:
+        uniques (dict) - {컬럼: 정렬된 고유값 np.ndarray} (결측 '0', 타겟 결측 행 제외 → make_features 의 어휘와 같음)
+        targets (np.ndarray) - 타겟 고유값
+        groups (list) - row group 목록 (feature_store.row_groups)
+        split_row (int) - 타겟이 있는 행 중 병합 순서 마지막 VALID_ROWS 행의 시작 행 번호
+        num_rows (int) - 타겟이 있는 행 수
+    """
+    groups = row_groups(store_dir)
+    merged = {col: [np.array([], dtype=str), []] for col in label_cols + [target_col]}  # [병합된 배열, 병합 대기 배열들]
+    tail = np.array([], dtype='int64')  # 타겟이 있는 행 중 행 번호가 가장 큰 VALID_ROWS 개
+    num_rows = 0
+    for group in groups:
+        table = read_row_group(store_dir, group['file'], group['index'], list(dict.fromkeys(label_cols + [target_col])),
+                               as_table=True)
+        table = table.filter(pc.is_valid(table[target_col]))
+        num_rows += table.num_rows
+        for col in merged:
+            _merge_uniques(merged[col], _unique_strings(table[col]))
+        rows = np.concatenate([tail, table[ROW_COL].to_numpy()])
+        tail = np.partition(rows, -VALID_ROWS)[-VALID_ROWS:] if len(rows) > VALID_ROWS else rows
+    split_row = int(tail.min()) if len(tail) == VALID_ROWS else 0
+    uniques = {col: _merge_uniques(merged[col]) for col in label_cols}
+    return uniques, _merge_uniques(merged[target_col]), groups, split_row, num_rows
+
+
+def _unique_strings(column):
+    """
+    Arrow 컬럼 → 고유값 문자열 배열 (결측은 '0', fill_missing 과 같은 값)
+    """
+    values = pc.unique(column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column)
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+        return pc.fill_null(values, '0').to_numpy(zero_copy_only=False).astype(str)
+    return values.to_pandas().astype(object).fillna('0').astype(str).to_numpy()
+
+
+def _merge_uniques(state, values=None):
+    """
+    state = [병합된 정렬 배열, 대기 배열 목록] 에 values 추가
+    - 대기 배열 합계가 병합된 배열 크기 이상이 되면 np.unique 로 병합 (전체 정렬 횟수 O(log row group 수))
+    - values 없이 호출하면 남은 대기 배열까지 병합해 반환
+    """
+    if values is not None:
+        state[1].append(values)
+        if sum(len(part) for part in state[1]) < len(state[0]):
+            return state[0]
+    if state[1]:
+        state[0] = np.unique(np.concatenate([state[0]] + state[1]))
+        state[1] = []
+    return state[0]
+
+
+def fill_missing(df):
+    """
+    결측 채우기 (in-place): 문자열 컬럼은 category → 결측은 '0' 범주 (기존 fillna(0) 후 문자열 인코딩과 같은 값), 나머지는 0
+    """
+    cat_cols = df.select_dtypes(include=['category']).columns
+    for col in cat_cols:
+        if df[col].isna().any():
+            if '0' not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories(['0'])
+            df[col] = df[col].fillna('0')
+    df.fillna({col: 0 for col in df.columns if col not in cat_cols}, inplace=True)
+    return df
+
+
+def load_or_fit_label_encoder(values, is_training, label_path, cache, raw_data_bucket):
+    """
+    타겟 LabelEncoder 준비
+    1. 학습: values 로 fit → label_path 저장 → MinIO 업로드
+    2. 검증/추론: MinIO 에서 내려받은 (또는 로컬에 있는) 인코더 로드, 모르는 값이 있으면 다시 fit
+    """
     if is_training:
-        encoder = LabelEncoder()
-        df[out_columns[0]] = encoder.fit_transform(df[out_columns[0]])
+        encoder = LabelEncoder().fit(values)
         joblib.dump(encoder, label_path)
         print(f"🔒 LabelEncoder 저장됨: {label_path}")
         # Upload to MinIO raw_data bucket
         try:
-            client.fput_object(
+            cache.upload(
                 raw_data_bucket, 'label_encoder.pkl', label_path)
             print(
                 f"Uploaded label_encoder.pkl to MinIO: {raw_data_bucket}/label_encoder.pkl")
@@ -177,42 +576,140 @@ def make_features(in_columns, out_columns, is_training, data_dir='/opt/airflow/d
             print(f"Failed to upload label_encoder.pkl to MinIO: {e}")
     else:
         try:
-            client.fget_object(
-                raw_data_bucket, 'label_encoder.pkl', label_path)
-            print(
-                f"Downloaded label_encoder.pkl from MinIO: {raw_data_bucket}/label_encoder.pkl")
+            if cache.fetch(raw_data_bucket, 'label_encoder.pkl', label_path):
+                print(
+                    f"Downloaded label_encoder.pkl from MinIO: {raw_data_bucket}/label_encoder.pkl")
         except Exception as e:
             print(f"Failed to download label_encoder.pkl from MinIO: {e}")
         encoder = joblib.load(label_path)
-        try:
-            df[out_columns[0]] = encoder.transform(df[out_columns[0]])
-        except ValueError as e:
-            print(f"Error in LabelEncoder: {e}. Re-fitting encoder.")
-            encoder = LabelEncoder()
-            df[out_columns[0]] = encoder.fit_transform(df[out_columns[0]])
+        unseen = sorted(set(np.asarray(values)) - set(encoder.classes_))
+        if unseen:
+            print(f"Error in LabelEncoder: y contains previously unseen labels: {unseen}. Re-fitting encoder.")
+            encoder = LabelEncoder().fit(values)
             joblib.dump(encoder, label_path)
             try:
-                client.fput_object(
+                cache.upload(
                     raw_data_bucket, 'label_encoder.pkl', label_path)
                 print(
                     f"Uploaded updated label_encoder.pkl to MinIO: {raw_data_bucket}/label_encoder.pkl")
             except Exception as e:
                 print(f"Failed to upload label_encoder.pkl to MinIO: {e}")
         print(f"📦 LabelEncoder 로드됨: {label_path}")
-
-    df = df[in_columns + out_columns]
-    df = df.loc[:, ~df.columns.duplicated()]
-
-    df.columns = mapping_columns(df.columns.tolist())
-    in_columns = mapping_columns(in_columns)
-    out_columns = mapping_columns(out_columns)
-
-    x_df = df[in_columns]
-    y = df[out_columns].to_numpy().astype(float).squeeze()
-
-    wide_x, deep_x = split_wide_deep_by_type(x_df)
-
-    return ((wide_x[:-100], deep_x[:-100]), y[:-100]) if is_training else ((wide_x[-100:], deep_x[-100:]), y[-100:])
+    return encoder
+
+
+def sync_feature_store(store_dir, data_dir, new_onlinesales_path, cache,
+                       minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
+                       minio_secret_key="admin", raw_data_bucket="raw-data", new_sales_bucket="new-sales"):
+    """
+    새 거래 CSV 가 없고 로컬 저장소가 있으면 그대로 사용, 아니면 update_feature_store
+    """
+    if not new_onlinesales_path and (store_dir / MANIFEST_FNAME).exists():
+        print(f'loading from {store_dir}')
+        return read_manifest(store_dir)
+    return update_feature_store(store_dir, data_dir, new_onlinesales_path, cache,
+                                minio_endpoint, minio_access_key, minio_secret_key, raw_data_bucket, new_sales_bucket)
+
+
+def update_feature_store(store_dir, data_dir, new_onlinesales_path, cache,
+                         minio_endpoint="127.0.0.1:9000", minio_access_key="admin",
+                         minio_secret_key="admin", raw_data_bucket="raw-data", new_sales_bucket="new-sales"):
+    """
+    피처 저장소 갱신
+    0. 새 거래 CSV 는 반영 전에 보관 (archive_new_sales) → 이후 전체 재병합에서 다시 붙임
+    1. 저장소가 있고 새 거래 CSV 가 있으면 증분 병합 → 새 파티션 파일만 추가 / 업로드
+       - 이미 반영한 CSV(sha256 이 manifest 의 applied_new_sales 에 있음)는 건너뜀 (재시도 / 학습 단계 재호출)
+    2. 그 외 (저장소 없음, 원본 CSV 변경, 스키마 불일치, INCREMENTAL_MERGE=false) 는
+       전체 병합 (원본 + 보관된 새 거래 CSV 전체) 후 교체
+    """
+    new_path = None
+    if new_onlinesales_path:
+        new_path = fetch_new_onlinesales(data_dir, new_onlinesales_path, minio_endpoint, minio_access_key,
+                                         minio_secret_key, new_sales_bucket)
+    if new_path:
+        new_sha = file_sha256(new_path)
+        archive_new_sales(data_dir, new_path, new_sha, cache, new_sales_bucket)
+
+    if INCREMENTAL_MERGE and new_path and (store_dir / MANIFEST_FNAME).exists():
+        manifest = read_manifest(store_dir)
+        applied = manifest.get('applied_new_sales', [])
+        if new_sha in applied:
+            print(f'[INFO] Onlinesales_new.csv 이미 반영됨 (sha256={new_sha[:12]}). 병합 생략.')
+            return manifest
+
+        merged_new, sources = merge_new_sales(data_dir, new_path, minio_endpoint, minio_access_key,
+                                              minio_secret_key, raw_data_bucket)
+        if merged_new is not None and manifest.get('sources') == sources:
+            try:
+                manifest, new_files, removed = append_feature_store(
+                    merged_new, store_dir,
+                    applied_new_sales=(applied + [new_sha])[-APPLIED_NEW_SALES_KEEP:])
+            except ValueError as e:
+                print(f"[INFO] 증분 추가 불가 ({e}). 전체 병합으로 전환.")
+            else:
+                print(f'appended {len(merged_new)} rows to {store_dir} '
+                      f'(rows={manifest["num_rows"]}, files={len(new_files)}, compacted={len(removed)})')
+                try:
+                    upload_feature_store(cache, raw_data_bucket, store_dir, files=new_files, removed=removed)
+                    print(f"Uploaded {len(new_files)} new files of {STORE_DIRNAME} to MinIO: {raw_data_bucket}/{STORE_DIRNAME}")
+                except Exception as e:
+                    print(f"Failed to upload {STORE_DIRNAME} to MinIO: {e}")
+                return manifest
+
+    merged, sources, applied = merge_data(SYMBOLS, data_dir, new_onlinesales_path, minio_endpoint, minio_access_key,
+                                          minio_secret_key, raw_data_bucket, new_sales_bucket)
+    manifest = write_feature_store(merged, store_dir, sources=sources,
+                                   applied_new_sales=applied[-APPLIED_NEW_SALES_KEEP:])
+    del merged
+    print(f'saved to {store_dir} (rows={manifest["num_rows"]}, partitions={len(manifest["partitions"])})')
+    # Upload to MinIO raw_data bucket
+    try:
+        upload_feature_store(cache, raw_data_bucket, store_dir)
+        print(
+            f"Uploaded {STORE_DIRNAME} to MinIO: {raw_data_bucket}/{STORE_DIRNAME}")
+    except Exception as e:
+        print(f"Failed to upload {STORE_DIRNAME} to MinIO: {e}")
+    return manifest
+
+
+def load_or_build_vocab(df, label_cols, is_training, data_dir, cache, raw_data_bucket):
+    """
+    범주형 컬럼 어휘 준비
+    1. 학습: 현재 데이터로 어휘 생성 → data_dir/feature_vocab 에 저장 → MinIO 업로드
+    2. 검증/추론: MinIO 에서 내려받은 (또는 로컬에 있는) 어휘 로드, 없으면 새로 생성
+    """
+    vocab_dir = Path(data_dir) / VOCAB_DIRNAME
+
+    if not is_training:
+        try:
+            # list_objects 의 ETag 로 바뀐 파일만 병렬 다운로드
+            objects = list(cache.client.list_objects(raw_data_bucket, prefix=f"{VOCAB_DIRNAME}/"))
+            results = cache.fetch_many(
+                (raw_data_bucket, obj.object_name, str(Path(data_dir) / obj.object_name), obj.etag)
+                for obj in objects)
+            errors = [result for result in results.values() if isinstance(result, Exception)]
+            if errors:
+                raise errors[0]
+            print(f"Downloaded {VOCAB_DIRNAME} from MinIO: {raw_data_bucket}/{VOCAB_DIRNAME} "
+                  f"({sum(1 for result in results.values() if result)}/{len(results)} files changed)")
+        except Exception as e:
+            print(f"Failed to download {VOCAB_DIRNAME} from MinIO: {e}")
+        if (vocab_dir / META_FNAME).exists():
+            vocab, meta = load_feature_vocab(vocab_dir)
+            print(f"📦 Feature vocab 로드됨: {vocab_dir} (version={meta['version']})")
+            return vocab
+        print(f"Feature vocab 없음: {vocab_dir}. 새로 생성합니다.")
+
+    meta = save_feature_vocab(build_feature_vocab(df, label_cols), vocab_dir)
+    print(f"🔒 Feature vocab 저장됨: {vocab_dir} (version={meta['version']})")
+    try:
+        for fname in vocab_files(vocab_dir):
+            cache.upload(raw_data_bucket, f"{VOCAB_DIRNAME}/{fname}", str(vocab_dir / fname))
+        print(f"Uploaded {VOCAB_DIRNAME} to MinIO: {raw_data_bucket}/{VOCAB_DIRNAME}")
+    except Exception as e:
+        print(f"Failed to upload {VOCAB_DIRNAME} to MinIO: {e}")
+    vocab, _ = load_feature_vocab(vocab_dir)
+    return vocab
 
 
 if __name__ == "__main__":
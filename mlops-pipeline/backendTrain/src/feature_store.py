@@ -0,0 +1,348 @@
+# feature_store.py
+# 병합된 학습 데이터(merge_data 결과)를 거래 월별로 파티션된 Parquet 으로 저장/조회하는 컬럼형 피처 저장소
+#
+# feature_store/
+#   manifest.json                       ← 파티션/파일/행 수/스키마 (MinIO 존재 여부 확인에도 사용)
+#   txn_month=202301/part-0.parquet
+#   txn_month=202302/part-0.parquet ...
+#
+# - 문자열 컬럼은 category(dictionary 인코딩)로 저장 → 읽을 때도 category 로 복원
+# - 필요한 컬럼 / 월만 읽기 (read_feature_store(columns=..., months=...))
+# - 읽기는 memory_map, 쓰기는 임시 디렉토리에 만든 뒤 교체 → 다른 프로세스가 반쯤 쓰인 파일을 읽지 않음
+# - 증분 추가(append_feature_store)는 새 파티션 파일만 쓰고 manifest 를 원자적으로 교체
+#   (읽기는 manifest 에 있는 파일만 사용 → manifest 교체 전까지 새 파일은 보이지 않음)
+# - 파일은 ROW_GROUP_ROWS 행 단위 row group 으로 작성 → 스트리밍 학습은 row group 하나씩 읽음 (row_groups / read_row_group)
+# - 증분 추가로 파티션 파일 수가 COMPACT_FILES 를 넘으면 그 파티션을 한 파일로 다시 씀 (작은 파일 누적 방지)
+
+import json
+import os
+import shutil
+import uuid
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+STORE_DIRNAME = 'feature_store'
+MANIFEST_FNAME = 'manifest.json'
+PARTITION_COL = 'txn_month'   # 거래날짜(YYYYMMDD) → YYYYMM, 날짜 없음은 0
+ROW_COL = '_row'              # 병합 순서 (학습/검증 분할이 행 순서에 의존 → 읽을 때 복원)
+ROW_GROUP_ROWS = int(os.getenv("FEATURE_STORE_ROW_GROUP_ROWS", 65536))  # row group 최대 행 수 (스트리밍 읽기 단위)
+COMPACT_FILES = int(os.getenv("FEATURE_STORE_COMPACT_FILES", 32))         # 파티션 파일 수 상한 (넘으면 한 파일로 압축)
+
+
+def to_store_frame(df, row_offset=0):
+    """
+    저장용 변환: 문자열 컬럼 → category, 파티션 컬럼 / 행 순서 컬럼 추가
+    """
+    out = df.copy()
+    for col in out.select_dtypes(include=['object']).columns:
+        out[col] = out[col].astype('category')
+    months = (out['거래날짜'] // 100).fillna(0).astype('int32')
+    out[PARTITION_COL] = months
+    out[ROW_COL] = np.arange(row_offset, row_offset + len(out), dtype='int64')
+    return out
+
+
+def to_store_table(frame):
+    """
+    DataFrame → Arrow Table (dictionary 인덱스 폭을 int32 로 통일 → 파티션 파일끼리 스키마가 같도록)
+    """
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    schema = pa.schema([
+        field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+        if pa.types.is_dictionary(field.type) else field
+        for field in table.schema
+    ], metadata=table.schema.metadata)
+    return table.cast(schema)
+
+
+def write_feature_store(df, store_dir, **extra):
+    """
+    전체 병합 데이터를 월별 파티션으로 저장 (기존 저장소 교체)
+
+    1. store_dir.tmp 에 파티션별 Parquet 작성 (dictionary 인코딩, zstd 압축)
+    2. manifest.json 작성 (extra: sources / applied_new_sales 등 병합 이력)
+    3. 기존 디렉토리와 교체 (rename) 후 정리
+
+    Returns:
+        dict - manifest
+    """
+    store_dir = str(store_dir)
+    tmp_dir = f"{store_dir}.tmp"
+    old_dir = f"{store_dir}.old"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+    table = to_store_table(to_store_frame(df))
+    _write_partitions(table, tmp_dir, 'part-{i}.parquet')
+    files = _list_files(tmp_dir)
+    manifest = {
+        "partition_col": PARTITION_COL,
+        "files": [],
+        "partitions": {},
+        "num_rows": 0,
+        "schema": {field.name: str(field.type) for field in table.schema
+                   if field.name not in (PARTITION_COL, ROW_COL)},
+        **extra,
+    }
+    manifest = _add_files(manifest, tmp_dir, files)
+    _write_manifest(tmp_dir, manifest)
+
+    if os.path.exists(store_dir):
+        os.rename(store_dir, old_dir)
+    os.rename(tmp_dir, store_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return manifest
+
+
+def append_feature_store(df, store_dir, **extra):
+    """
+    새 병합 행을 기존 저장소에 추가 (기존 파일은 그대로, 새 파티션 파일만 작성)
+
+    1. 행 순서 컬럼은 기존 num_rows 부터 이어서 부여
+    2. 기존 파일 스키마로 맞춰 part-<id>-{i}.parquet 작성 (컬럼이 다르면 ValueError → 호출 측에서 전체 재구축)
+    3. 파일 수가 COMPACT_FILES 를 넘은 파티션은 한 파일로 압축 (_compact_partitions)
+    4. manifest 에 새 파일/행 수/extra 반영 후 원자적 교체 → 압축으로 교체된 파일 삭제
+
+    Returns:
+        (dict - manifest, list - 새로 추가된 파일 상대 경로, list - 삭제된 파일 상대 경로)
+    """
+    store_dir = str(store_dir)
+    manifest = read_manifest(store_dir)
+    if df.empty:
+        manifest.update(extra)
+        _write_manifest(store_dir, manifest)
+        return manifest, [], []
+
+    table = to_store_table(to_store_frame(df, row_offset=manifest['num_rows']))
+    existing = pq.read_schema(os.path.join(store_dir, manifest['files'][0]))
+    if set(existing.names) != set(table.schema.names) - {PARTITION_COL}:
+        raise ValueError(f"feature store columns differ: {sorted(set(existing.names) ^ (set(table.schema.names) - {PARTITION_COL}))}")
+    target = pa.schema(list(existing) + [table.schema.field(PARTITION_COL)], metadata=existing.metadata)
+    table = table.select(target.names).cast(target)
+
+    before = set(_list_files(store_dir))
+    _write_partitions(table, store_dir, f"part-{uuid.uuid4().hex[:8]}-{{i}}.parquet")
+    new_files = sorted(set(_list_files(store_dir)) - before)
+
+    manifest = _add_files(manifest, store_dir, new_files)
+    months = sorted({rel.split('/')[0] for rel in new_files})
+    manifest, compacted, removed = _compact_partitions(manifest, store_dir, months)
+    manifest.update(extra)
+    _write_manifest(store_dir, manifest)
+
+    # manifest 교체 후 삭제 (교체 전까지 읽기는 이전 파일 사용)
+    for rel in removed:
+        os.remove(os.path.join(store_dir, rel))
+    new_files = sorted(set(new_files) - set(removed)) + compacted
+    return manifest, new_files, removed
+
+
+def read_feature_store(store_dir, columns=None, months=None):
+    """
+    저장소 → DataFrame (병합 순서 유지)
+
+    Parameters:
+        columns: 읽을 컬럼 목록 (None 이면 전체, 파티션/행 순서 컬럼은 제외하고 반환)
+        months: 읽을 거래 월 목록 (YYYYMM 정수, None 이면 전체) → manifest 에서 해당 파티션 파일만 열기
+    """
+    store_dir = str(store_dir)
+    manifest = read_manifest(store_dir)
+    files = manifest['files']
+    if months is not None:
+        wanted = {f"{PARTITION_COL}={int(m)}" for m in months}
+        files = [rel for rel in files if rel.split('/')[0] in wanted]
+
+    data_cols = [name for name in manifest['schema']]
+    columns = data_cols if columns is None else list(columns)
+    if not files:
+        return pd.DataFrame(columns=columns)
+
+    dataset = ds.dataset(
+        [os.path.join(store_dir, rel) for rel in files],
+        format='parquet', partitioning='hive', partition_base_dir=store_dir,
+        filesystem=pafs.LocalFileSystem(use_mmap=True),
+    )
+    table = dataset.to_table(columns=columns + [ROW_COL])
+    table = table.sort_by(ROW_COL).drop_columns([ROW_COL])
+    return table.to_pandas()
+
+
+def row_groups(store_dir):
+    """
+    manifest 파일들의 row group 목록 (Parquet footer 만 읽음)
+
+    Returns:
+        list - [{"file", "index", "num_rows", "row_min", "row_max"}, ...] (row_min/max: 행 순서 컬럼 통계)
+    """
+    store_dir = str(store_dir)
+    groups = []
+    for rel in read_manifest(store_dir)['files']:
+        metadata = pq.ParquetFile(os.path.join(store_dir, rel)).metadata
+        row_idx = metadata.schema.to_arrow_schema().get_field_index(ROW_COL)
+        for index in range(metadata.num_row_groups):
+            group = metadata.row_group(index)
+            stats = group.column(row_idx).statistics
+            groups.append({
+                "file": rel,
+                "index": index,
+                "num_rows": group.num_rows,
+                "row_min": int(stats.min) if stats is not None and stats.has_min_max else None,
+                "row_max": int(stats.max) if stats is not None and stats.has_min_max else None,
+            })
+    return groups
+
+
+def read_row_group(store_dir, rel, index, columns, as_table=False):
+    """
+    row group 하나 → DataFrame (columns + 행 순서 컬럼, memory_map)
+    - as_table: Arrow Table 그대로 반환 (pandas 변환 없이 pyarrow.compute 로 처리할 때)
+    """
+    parquet = pq.ParquetFile(os.path.join(str(store_dir), rel), memory_map=True)
+    table = parquet.read_row_group(index, columns=list(columns) + [ROW_COL])
+    return table if as_table else table.to_pandas()
+
+
+def read_manifest(store_dir):
+    with open(os.path.join(store_dir, MANIFEST_FNAME), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def store_files(store_dir):
+    """
+    MinIO 업로드 대상 파일 (store_dir 기준 상대 경로, manifest.json 은 마지막)
+    """
+    return read_manifest(store_dir)['files'] + [MANIFEST_FNAME]
+
+
+def upload_feature_store(cache, bucket, store_dir, files=None, removed=()):
+    """
+    저장소 파일을 MinIO bucket/feature_store/ 아래로 업로드 (cache: artifact_cache.ArtifactCache)
+    - files: 업로드할 파일 (None 이면 전체 → 새 manifest 에 없는 이전 파티션 파일은 삭제)
+      증분 추가 후에는 새 파일만 넘겨 O(새 행) 로 업로드
+    - removed: 증분 추가 중 압축으로 교체된 파일 → manifest 업로드 후 삭제
+    - manifest.json 을 마지막에 올려, manifest 가 보이면 파티션 파일이 모두 올라간 상태가 되도록 함
+    """
+    full = files is None
+    files = read_manifest(store_dir)['files'] if full else list(files)
+    for rel in files + [MANIFEST_FNAME]:
+        cache.upload(bucket, f"{STORE_DIRNAME}/{rel}", os.path.join(store_dir, rel))
+    if not full:
+        for rel in removed:
+            cache.client.remove_object(bucket, f"{STORE_DIRNAME}/{rel}")
+        return
+    keep = {f"{STORE_DIRNAME}/{rel}" for rel in store_files(store_dir)}
+    for obj in cache.client.list_objects(bucket, prefix=f"{STORE_DIRNAME}/", recursive=True):
+        if obj.object_name not in keep:
+            cache.client.remove_object(bucket, obj.object_name)
+
+
+def download_feature_store(cache, bucket, store_dir):
+    """
+    MinIO 의 manifest 기준으로 저장소를 store_dir 에 맞춤 (cache: artifact_cache.ArtifactCache)
+
+    1. manifest 를 임시 경로로 받음
+    2. manifest 의 파일 중 ETag 가 바뀐 (또는 로컬에 없는) 파일만 병렬 다운로드
+    3. manifest 교체 후 manifest 에 없는 로컬 파티션 파일 정리
+    """
+    store_dir = str(store_dir)
+    os.makedirs(store_dir, exist_ok=True)
+    staged = os.path.join(store_dir, f"{MANIFEST_FNAME}.download")
+    cache.client.fget_object(bucket, f"{STORE_DIRNAME}/{MANIFEST_FNAME}", staged)
+    with open(staged, encoding='utf-8') as f:
+        files = json.load(f)['files']
+
+    # ETag 는 list_objects 한 번으로 확인 (파일별 stat_object 생략)
+    etags = {obj.object_name: obj.etag
+             for obj in cache.client.list_objects(bucket, prefix=f"{STORE_DIRNAME}/", recursive=True)}
+    results = cache.fetch_many(
+        (bucket, f"{STORE_DIRNAME}/{rel}", os.path.join(store_dir, rel), etags.get(f"{STORE_DIRNAME}/{rel}"))
+        for rel in files)
+    failed = {name: result for name, result in results.items() if isinstance(result, Exception)}
+    if failed:
+        raise next(iter(failed.values()))
+    os.replace(staged, os.path.join(store_dir, MANIFEST_FNAME))
+
+    for rel in set(_list_files(store_dir)) - set(files):
+        os.remove(os.path.join(store_dir, rel))
+    manifest = read_manifest(store_dir)
+    manifest['downloaded_files'] = sum(1 for result in results.values() if result)
+    return manifest
+
+
+def _write_partitions(table, base_dir, basename_template):
+    pq.write_to_dataset(
+        table, base_dir,
+        partition_cols=[PARTITION_COL],
+        basename_template=basename_template,
+        existing_data_behavior='overwrite_or_ignore',
+        use_dictionary=True,
+        compression='zstd',
+        row_group_size=ROW_GROUP_ROWS,
+    )
+
+
+def _list_files(store_dir):
+    return sorted(
+        os.path.relpath(os.path.join(root, fname), store_dir).replace(os.sep, '/')
+        for root, _, fnames in os.walk(store_dir) for fname in fnames if fname.endswith('.parquet')
+    )
+
+
+def _add_files(manifest, store_dir, files):
+    """
+    manifest 에 파일 목록 / 파티션별 행 수 (Parquet footer 기준) 반영
+    """
+    partitions = {int(month): rows for month, rows in manifest['partitions'].items()}
+    for rel in files:
+        month = int(rel.split('/')[0].split('=')[1])
+        partitions[month] = partitions.get(month, 0) + pq.ParquetFile(os.path.join(store_dir, rel)).metadata.num_rows
+    return {
+        **manifest,
+        "files": manifest['files'] + list(files),
+        "partitions": {str(month): rows for month, rows in sorted(partitions.items())},
+        "num_rows": sum(partitions.values()),
+    }
+
+
+def _compact_partitions(manifest, store_dir, partitions):
+    """
+    파일 수가 COMPACT_FILES 를 넘은 파티션을 한 파일로 다시 씀 (행 순서 컬럼 기준 정렬, 같은 스키마 / row group 크기)
+    - 새 파일은 임시 이름으로 쓴 뒤 rename → manifest 교체 전에는 읽기에 보이지 않음
+    - 이전 파일 삭제는 호출 측에서 manifest 교체 후
+
+    Parameters:
+        partitions: 확인할 파티션 디렉토리 이름 목록 (txn_month=YYYYMM)
+
+    Returns:
+        (dict - manifest (파일 목록 교체, 행 수 동일), list - 새 파일, list - 교체된 파일)
+    """
+    files = list(manifest['files'])
+    compacted, removed = [], []
+    for partition in partitions:
+        parts = [rel for rel in files if rel.split('/')[0] == partition]
+        if len(parts) <= COMPACT_FILES:
+            continue
+        table = pa.concat_tables([pq.ParquetFile(os.path.join(store_dir, rel)).read() for rel in parts])
+        table = table.sort_by(ROW_COL)
+        rel = f"{partition}/part-{uuid.uuid4().hex[:8]}-0.parquet"
+        tmp_path = os.path.join(store_dir, f"{rel}.tmp")
+        pq.write_table(table, tmp_path, use_dictionary=True, compression='zstd', row_group_size=ROW_GROUP_ROWS)
+        os.replace(tmp_path, os.path.join(store_dir, rel))
+
+        index = files.index(parts[0])
+        files = [f for f in files if f not in parts]
+        files.insert(index, rel)
+        compacted.append(rel)
+        removed.extend(parts)
+    return {**manifest, "files": files}, compacted, removed
+
+
+def _write_manifest(store_dir, manifest):
+    tmp_path = os.path.join(store_dir, f"{MANIFEST_FNAME}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(store_dir, MANIFEST_FNAME))
@@ -0,0 +1,86 @@
+# feature_vocab.py
+# 학습 시 범주형 컬럼의 어휘(고유값 목록)를 한 번 만들어 저장하고, 학습/서빙 모두 같은 코드로 인코딩하기 위한 모듈
+
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from utils import mapping_columns
+
+VOCAB_DIRNAME = 'feature_vocab'
+META_FNAME = 'meta.json'
+CHECKPOINT_VOCAB_SUFFIX = '.vocab'  # 체크포인트별 어휘 디렉토리 (<체크포인트>.vocab/, 서빙이 체크포인트와 함께 로드)
+
+
+def build_feature_vocab(df, columns):
+    """
+    컬럼별 정렬된 고유값 (LabelEncoder.classes_ 와 같은 순서 → 알려진 값의 코드는 기존과 동일)
+    - df: DataFrame 또는 {컬럼: Series / np.ndarray} (스트리밍 학습은 컬럼별 고유값 배열만 넘김)
+    """
+    return {col: np.unique(np.asarray(df[col]).astype(str)) for col in columns if col in df}
+
+
+def save_feature_vocab(vocab, vocab_dir):
+    """
+    컬럼별 어휘를 고정폭 유니코드 .npy 로 저장 (np.load(mmap_mode='r') 로 메모리 매핑 가능)
+    - 파일명/meta 의 컬럼명은 서빙 쪽 영문 컬럼명 (mapping_columns)
+    - version: 전체 어휘 내용의 sha256 앞 12자리
+    """
+    os.makedirs(vocab_dir, exist_ok=True)
+    digest = hashlib.sha256()
+    columns = {}
+    for col, values in vocab.items():
+        name = mapping_columns([col])[0]
+        arr = np.asarray(values, dtype=str)
+        fname = f"{name}.npy"
+        np.save(os.path.join(vocab_dir, fname), arr)
+        digest.update(name.encode('utf-8'))
+        digest.update(arr.tobytes())
+        columns[name] = {"file": fname, "size": int(len(arr))}
+
+    meta = {
+        "version": digest.hexdigest()[:12],
+        "oov_code": "size",  # 어휘에 없는 값 → 코드 len(vocab)
+        "columns": columns,
+    }
+    with open(os.path.join(vocab_dir, META_FNAME), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return meta
+
+
+def load_feature_vocab(vocab_dir):
+    """
+    저장된 어휘 로드 → {영문 컬럼명: np.ndarray(mmap)}, meta
+    """
+    with open(os.path.join(vocab_dir, META_FNAME), encoding='utf-8') as f:
+        meta = json.load(f)
+    vocab = {name: np.load(os.path.join(vocab_dir, info["file"]), mmap_mode='r')
+             for name, info in meta["columns"].items()}
+    return vocab, meta
+
+
+def encode_with_vocab(values, vocab_arr):
+    """
+    어휘 기준 정수 코드 (해시 조회), 어휘에 없는 값은 OOV 버킷 len(vocab_arr)
+    - vocab_arr: 어휘 배열 또는 미리 만든 pd.Index (반복 호출 시 Index / 해시 테이블 재생성 방지)
+    """
+    index = vocab_arr if isinstance(vocab_arr, pd.Index) else pd.Index(vocab_arr)
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # category 컬럼은 범주(고유값)만 조회 후 코드로 펼침, 결측(-1)은 OOV
+        lookup = index.get_indexer(values.cat.categories.astype(str))
+        lookup = np.append(lookup, -1)
+        codes = lookup[values.cat.codes.to_numpy()]
+    else:
+        codes = index.get_indexer(values.astype(str))
+    codes[codes < 0] = len(index)
+    return codes
+
+
+def vocab_files(vocab_dir):
+    """
+    MinIO 업로드/다운로드 대상 파일 목록 (meta.json 포함)
+    """
+    return [fname for fname in os.listdir(vocab_dir)
+            if fname == META_FNAME or fname.endswith('.npy')]
@@ -2,8 +2,9 @@ import os
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from minio import Minio
+from artifact_cache import get_artifact_cache
 from utils import get_data_path, mapping_columns, CATEGORY_MAP, MONTH_MAP
+from feature_store import STORE_DIRNAME, download_feature_store, read_feature_store
 import re
 import pandas as pd
 import numpy as np
@@ -13,33 +14,32 @@ def generate_new_onlinesales(data_dir="/opt/airflow/data", num_samples=50, minio
                              minio_access_key="admin", minio_secret_key="password",
                              raw_data_bucket="raw-data", new_sales_bucket="new-sales"):
     """
-    Generate Onlinesales_new.csv with 50 random transactions based on merged_data.pkl.
-    Downloads merged_data.pkl from MinIO raw_data bucket and uploads Onlinesales_new.csv to new_sales bucket.
+    Generate Onlinesales_new.csv with 50 random transactions based on the merged feature store.
+    Downloads feature_store (Parquet) from MinIO raw_data bucket, reads only the columns it samples from,
+    and uploads Onlinesales_new.csv to new_sales bucket.
     Saves the file locally in data_dir for compatibility.
     """
     import tempfile
 
-    # Initialize MinIO client
-    client = Minio(
-        minio_endpoint,
-        access_key=minio_access_key,
-        secret_key=minio_secret_key,
-        secure=False
-    )
-
-    # Download merged_data.pkl from MinIO
-    merged_path = os.path.join(data_dir, "merged_data.pkl")
+    # Shared MinIO client + ETag cache (only changed feature store files are downloaded)
     os.makedirs(data_dir, exist_ok=True)
+    cache = get_artifact_cache(data_dir, minio_endpoint, minio_access_key, minio_secret_key)
+    client = cache.client
+
+    # Download feature store from MinIO
+    store_dir = os.path.join(data_dir, STORE_DIRNAME)
     try:
-        client.fget_object(raw_data_bucket, "merged_data.pkl", merged_path)
+        manifest = download_feature_store(cache, raw_data_bucket, store_dir)
         print(
-            f"Downloaded merged_data.pkl from MinIO: {raw_data_bucket}/merged_data.pkl")
+            f"Synced {STORE_DIRNAME} from MinIO: {raw_data_bucket}/{STORE_DIRNAME} "
+            f"({manifest['downloaded_files']}/{len(manifest['files'])} files downloaded)")
     except Exception as e:
         raise FileNotFoundError(
-            f"Failed to download merged_data.pkl from MinIO: {e}")
+            f"Failed to download {STORE_DIRNAME} from MinIO: {e}")
 
-    # Load merged_data.pkl
-    merged_df = pd.read_pickle(merged_path)
+    # Load only the sampled columns
+    merged_df = read_feature_store(
+        store_dir, columns=['고객ID', '거래ID', '제품ID', '제품카테고리', '쿠폰상태', '평균금액', '배송료'])
 
     # Columns for Onlinesales_new.csv (based on original Onlinesales.csv)
     onlinesales_columns = [
@@ -62,7 +62,8 @@ def generate_new_onlinesales(data_dir="/opt/airflow/data", num_samples=50, minio
         return int(m.group(1)) if m else np.nan
 
     # ① 기존 max 계산 대체
-    nums = merged_df['거래ID'].apply(extract_num).dropna()
+    # 거래ID 는 category → 고유값(범주)만 검사
+    nums = pd.Series(merged_df['거래ID'].cat.categories).apply(extract_num).dropna()
     last_transaction_num = int(nums.max()) if not nums.empty else 0
 
     # Generate random transactions
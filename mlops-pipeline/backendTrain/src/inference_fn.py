@@ -2,6 +2,7 @@ import os
 import torch
 import joblib
 import pandas as pd
+from torch.utils.data import DataLoader, IterableDataset
 import dataset as module_data
 import model as module_arch
 
@@ -9,7 +10,11 @@ def inference(config, checkpoint_path, output_path="inference_result.csv"):
     dataset = getattr(module_data, config.dataset.type)(
         is_training=False, **config.dataset.args
     )
-    (x_wide, x_deep), y = dataset[:][0], dataset[:][1]
+    if isinstance(dataset, IterableDataset):
+        # 스트리밍 데이터셋: 검증 구간(마지막 VALID_ROWS 행)을 한 배치로 모음
+        (x_wide, x_deep), y = next(iter(DataLoader(dataset, batch_size=max(len(dataset), 1))))
+    else:
+        (x_wide, x_deep), y = dataset[:][0], dataset[:][1]
     wide_input_dim, deep_input_dim = x_wide.shape[1], x_deep.shape[1]
 
     encoder = joblib.load(os.path.join(config.dataset.args.data_dir, 'label_encoder.pkl'))
@@ -1,7 +1,9 @@
 import os
+import shutil
 import torch
-from torch.utils.data import DataLoader
+from torch.utils.data import DataLoader, IterableDataset
 from utils import fix_seed, MetricTracker
+from feature_vocab import VOCAB_DIRNAME, CHECKPOINT_VOCAB_SUFFIX
 import dataset as module_data
 import model as module_arch
 import metric as module_metric
@@ -10,6 +12,45 @@ import mlflow
 import mlflow.pytorch
 
 
+def snapshot_feature_vocab(vocab_src, snapshot_dir):
+    """
+    학습 데이터셋이 사용한 feature vocab 복사본 (체크포인트별 어휘의 원본, 학습 종료 시 삭제)
+
+    Returns:
+        str | None - 복사본 경로 (어휘가 없으면 None)
+    """
+    if not os.path.isdir(vocab_src):
+        return None
+    shutil.rmtree(snapshot_dir, ignore_errors=True)
+    shutil.copytree(vocab_src, snapshot_dir)
+    return snapshot_dir
+
+
+def save_checkpoint(state_dict, ckpt_path, vocab_snapshot=None):
+    """
+    체크포인트 저장 (서빙 레지스트리가 *.pt 를 보는 시점엔 짝이 되는 어휘가 이미 있도록)
+
+    1. 어휘 복사본 → <ckpt>.vocab/ (임시 디렉토리에 하드링크 후 rename, 복사본은 학습 중 바뀌지 않으므로 체크포인트끼리 파일 공유)
+    2. 가중치 → <ckpt>.tmp 저장 후 os.replace
+    """
+    if vocab_snapshot:
+        vocab_dst = ckpt_path + CHECKPOINT_VOCAB_SUFFIX
+        tmp_dir = f"{vocab_dst}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.copytree(vocab_snapshot, tmp_dir, copy_function=_link_or_copy)
+        shutil.rmtree(vocab_dst, ignore_errors=True)
+        os.rename(tmp_dir, vocab_dst)
+    torch.save(state_dict, f"{ckpt_path}.tmp")
+    os.replace(f"{ckpt_path}.tmp", ckpt_path)
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def train(config, logger):
     fix_seed(config.seed)
 
@@ -34,17 +75,29 @@ def train(config, logger):
         train_dataset = getattr(module_data, config.dataset.type)(
             is_training=True, **config.dataset.args
         )
+        # 데이터셋이 사용한 어휘를 바로 복사해 둠 (학습 중 다음 사이클이 data_dir 어휘를 다시 써도 체크포인트와 어긋나지 않음)
+        vocab_snapshot = snapshot_feature_vocab(
+            os.path.join(config.dataset.args.data_dir, VOCAB_DIRNAME),
+            os.path.join(os.path.abspath(config.train.save_dir), f".vocab-{datetime.datetime.now():%Y%m%d_%H%M%S}"))
+        if vocab_snapshot is None:
+            logger.warning(f"Feature vocab 없음: {config.dataset.args.data_dir}/{VOCAB_DIRNAME}")
+        # 스트리밍 데이터셋(IterableDataset)은 셔플 버퍼로 직접 섞음 → DataLoader shuffle 사용 불가
+        streaming = isinstance(train_dataset, IterableDataset)
         train_dataloader = DataLoader(
             dataset=train_dataset,
             batch_size=config.dataloader.args.batch_size,
-            shuffle=config.dataloader.args.shuffle,
+            shuffle=config.dataloader.args.shuffle and not streaming,
             num_workers=config.dataloader.args.num_workers,
             drop_last=True
         )
 
-        (x_wide, x_deep), _ = train_dataset[0]
-        wide_input_dim, deep_input_dim = x_wide.shape[0], x_deep.shape[0]
-        num_classes = int(train_dataset.y.max().item()) + 1
+        if streaming:
+            wide_input_dim, deep_input_dim = train_dataset.wide_input_dim, train_dataset.deep_input_dim
+            num_classes = train_dataset.num_classes
+        else:
+            (x_wide, x_deep), _ = train_dataset[0]
+            wide_input_dim, deep_input_dim = x_wide.shape[0], x_deep.shape[0]
+            num_classes = int(train_dataset.y.max().item()) + 1
 
         # 데이터셋 정보 로깅
         mlflow.log_params({
@@ -104,6 +157,8 @@ def train(config, logger):
         for epoch in range(1, config.train.epochs + 1):
             model.train()
             tracker.reset()
+            if streaming:
+                train_dataset.set_epoch(epoch)
 
             for batch_idx, ((x_wide, x_deep), target) in enumerate(train_dataloader):
                 x_wide, x_deep, target = x_wide.to(
@@ -152,7 +207,7 @@ def train(config, logger):
                 ckpt_path = os.path.join(ckpt_dir, f"model-e{epoch}-{ts}.pt")
 
                 try:
-                    torch.save(model.state_dict(), ckpt_path)
+                    save_checkpoint(model.state_dict(), ckpt_path, vocab_snapshot)
                     logger.info(f"✅ Saved checkpoint: {ckpt_path}")
 
                     # 파일 존재 확인
@@ -174,12 +229,15 @@ def train(config, logger):
         final_path = os.path.join(
             ckpt_dir, f"model-final-{datetime.datetime.now():%Y%m%d_%H%M%S}.pt")
         try:
-            torch.save(model.state_dict(), final_path)
+            # 학습에 사용한 feature vocab 은 <체크포인트>.vocab/ 에 가중치보다 먼저 저장 (서빙은 체크포인트별 어휘 로드)
+            save_checkpoint(model.state_dict(), final_path, vocab_snapshot)
             logger.info(f"✅ Saved final model: {final_path}")
 
             # MLflow에 최종 모델 저장
             mlflow.pytorch.log_model(model, "model")
             mlflow.log_artifact(final_path, artifact_path="final_model")
+            if vocab_snapshot:
+                mlflow.log_artifacts(final_path + CHECKPOINT_VOCAB_SUFFIX, artifact_path=f"final_model/{VOCAB_DIRNAME}")
 
             # Best 메트릭 로깅
             mlflow.log_metrics({
@@ -189,3 +247,7 @@ def train(config, logger):
 
         except Exception as e:
             logger.error(f"❌ Error saving final model: {e}")
+
+        # 어휘 복사본 정리 (체크포인트별 어휘는 하드링크 / 복사본이라 그대로 남음)
+        if vocab_snapshot:
+            shutil.rmtree(vocab_snapshot, ignore_errors=True)
@@ -1,11 +1,13 @@
 # utils.py
 
 import os
+import hashlib
 import random
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import torch
 import pandas as pd
-from minio import Minio
+from artifact_cache import get_artifact_cache
 
 
 CATEGORY_MAP = {
@@ -22,42 +24,101 @@ MONTH_MAP = {
 }
 
 
+RAW_DATA_FILES = {
+    'Customer': 'Customer_info.csv',
+    'Discount': 'Discount_info.csv',
+    'Onlinesales': 'Onlinesales_info.csv',
+    'Tax': 'Tax_info.csv',
+    'Marketing': 'Marketing_info.csv'
+}
+
+
 def get_data_path(symbol, data_dir, minio_endpoint="127.0.0.1:9000",
                   minio_access_key="admin", minio_secret_key="admin",
                   raw_data_bucket="raw-data"):
     """
-    Get the local path for a CSV file, downloading from MinIO raw_data bucket if needed.
+    Get the local path for a CSV file, downloading from MinIO raw_data bucket only if its ETag changed.
     """
-    mapping = {
-        'Customer': 'Customer_info.csv',
-        'Discount': 'Discount_info.csv',
-        'Onlinesales': 'Onlinesales_info.csv',
-        'Tax': 'Tax_info.csv',
-        'Marketing': 'Marketing_info.csv'
-    }
-    if symbol not in mapping:
+    return fetch_raw_data([symbol], data_dir, minio_endpoint, minio_access_key,
+                          minio_secret_key, raw_data_bucket)[symbol]
+
+
+def fetch_raw_data(symbols, data_dir, minio_endpoint="127.0.0.1:9000",
+                   minio_access_key="admin", minio_secret_key="admin",
+                   raw_data_bucket="raw-data"):
+    """
+    여러 원본 CSV 를 ETag 캐시를 거쳐 병렬로 받아 {symbol: local_path} 반환
+    (MinIO 실패 시 로컬 파일이 있으면 그대로 사용)
+    """
+    unknown = [symbol for symbol in symbols if symbol not in RAW_DATA_FILES]
+    if unknown:
         raise ValueError(
-            f"Symbol '{symbol}' is not recognized. Allowed values: {list(mapping.keys())}")
+            f"Symbol '{unknown[0]}' is not recognized. Allowed values: {list(RAW_DATA_FILES.keys())}")
+
+    cache = get_artifact_cache(data_dir, minio_endpoint, minio_access_key, minio_secret_key)
+    paths = {symbol: os.path.join(data_dir, RAW_DATA_FILES[symbol]) for symbol in symbols}
+    results = cache.fetch_many(
+        (raw_data_bucket, RAW_DATA_FILES[symbol], paths[symbol]) for symbol in symbols)
+
+    for symbol in symbols:
+        fname = RAW_DATA_FILES[symbol]
+        result = results[fname]
+        if isinstance(result, Exception):
+            print(f"Failed to download {fname} from MinIO: {result}")
+            if not os.path.exists(paths[symbol]):
+                raise FileNotFoundError(
+                    f"{fname} not found locally or in MinIO")
+        elif result:
+            print(f"Downloaded {fname} from MinIO: {raw_data_bucket}/{fname}")
+        else:
+            print(f"Using cached {fname} (ETag unchanged): {paths[symbol]}")
+    return paths
+
+
+# 원본 CSV 컬럼 타입 (타입 추론 생략, 조인 키는 문자열 유지). 스키마에 없는 컬럼은 추론
+# - 수치형은 float64 (결측이 있어도 읽기 실패 없음, 학습 피처는 어차피 float 로 변환)
+RAW_DATA_DTYPES = {
+    'Customer': {'고객ID': 'object', '성별': 'object', '고객지역': 'object', '가입기간': 'float64'},
+    'Discount': {'월': 'object', '제품카테고리': 'object', '쿠폰코드': 'object', '할인율': 'float64'},
+    'Onlinesales': {'고객ID': 'object', '거래ID': 'object', '거래날짜': 'object', '제품ID': 'object', '제품카테고리': 'object',
+                    '수량': 'float64', '평균금액': 'float64', '배송료': 'float64', '쿠폰상태': 'object'},
+    'Tax': {'제품카테고리': 'object', 'GST': 'float64'},
+    'Marketing': {},
+}
+RAW_DATE_COLUMNS = {'Onlinesales': ['거래날짜']}  # 읽을 때 한 번만 datetime 으로 변환
+RAW_READ_WORKERS = int(os.getenv("RAW_READ_WORKERS", 5))
 
-    client = Minio(
-        minio_endpoint,
-        access_key=minio_access_key,
-        secret_key=minio_secret_key,
-        secure=False
-    )
 
-    local_path = os.path.join(data_dir, mapping[symbol])
-    try:
-        client.fget_object(raw_data_bucket, mapping[symbol], local_path)
-        print(
-            f"Downloaded {mapping[symbol]} from MinIO: {raw_data_bucket}/{mapping[symbol]}")
-    except Exception as e:
-        print(f"Failed to download {mapping[symbol]} from MinIO: {e}")
-        if not os.path.exists(local_path):
-            raise FileNotFoundError(
-                f"{mapping[symbol]} not found locally or in MinIO")
+def read_raw_csv(path, symbol):
+    """
+    원본 CSV 1개 읽기 (pyarrow 엔진 + 고정 dtype, 날짜 컬럼은 datetime64 로 한 번 변환 / 잘못된 값은 NaT)
+    - 새 거래 CSV(Onlinesales_new.csv)는 symbol='Onlinesales' 로 읽음
+    """
+    df = pd.read_csv(path, engine='pyarrow', dtype=RAW_DATA_DTYPES.get(symbol, {}))
+    for col in RAW_DATE_COLUMNS.get(symbol, []):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    return df
 
-    return local_path
+
+def read_raw_data(paths, max_workers=RAW_READ_WORKERS):
+    """
+    {symbol: path} → {symbol: DataFrame} (스레드 풀 병렬 읽기, pyarrow 파서는 GIL 밖에서 동작)
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(paths)))) as pool:
+        futures = {symbol: pool.submit(read_raw_csv, path, symbol) for symbol, path in paths.items()}
+        return {symbol: future.result() for symbol, future in futures.items()}
+
+
+def file_sha256(path, block_size=1 << 20):
+    """
+    파일 내용 sha256 (병합에 사용한 원본/새 거래 CSV 식별용)
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
 
 
 def fix_seed(seed):
@@ -91,17 +152,17 @@ def mapping_columns(columns):
     return [mapping_dict.get(col, col) for col in columns]
 
 
-def split_wide_deep_by_type(df: pd.DataFrame, wide_cat_cols=None):
+def wide_deep_columns(df: pd.DataFrame, wide_cat_cols=None):
     """
-    범주형 컬럼은 wide, 수치형 컬럼은 deep으로 자동 분리
+    wide / deep 컬럼 목록 (df 컬럼 순서 유지 → 전체 로드 / 스트리밍 학습의 입력 순서가 같음)
 
     Parameters:
-        df: pd.DataFrame (입력 피처 전체 포함)
+        df: pd.DataFrame (입력 피처 전체 포함, 행이 없어도 됨)
         wide_cat_cols: 명시적으로 wide로 강제할 컬럼 목록 (optional)
 
     Returns:
-        wide_x: np.ndarray
-        deep_x: np.ndarray
+        wide_cols: list
+        deep_cols: list
     """
     # 명시적 범주형이 주어지면 사용, 아니면 자동 탐지
     if wide_cat_cols is None:
@@ -109,12 +170,29 @@ def split_wide_deep_by_type(df: pd.DataFrame, wide_cat_cols=None):
             include=['object', 'category']).columns.tolist()
         inferred_cats += [col for col in df.columns if 'id' in col or col in [
             '성별', '월', '쿠폰코드', '고객지역', '쿠폰상태']]
-        wide_cat_cols = list(set(inferred_cats) & set(df.columns))
+        wide_cat_cols = inferred_cats
 
+    wide_cols = [col for col in df.columns if col in wide_cat_cols]
     # 나머지는 deep
     deep_cols = [col for col in df.columns if col not in wide_cat_cols]
+    return wide_cols, deep_cols
+
+
+def split_wide_deep_by_type(df: pd.DataFrame, wide_cat_cols=None):
+    """
+    범주형 컬럼은 wide, 수치형 컬럼은 deep으로 자동 분리
+
+    Parameters:
+        df: pd.DataFrame (입력 피처 전체 포함)
+        wide_cat_cols: 명시적으로 wide로 강제할 컬럼 목록 (optional)
+
+    Returns:
+        wide_x: np.ndarray
+        deep_x: np.ndarray
+    """
+    wide_cols, deep_cols = wide_deep_columns(df, wide_cat_cols)
 
-    wide_x = df[wide_cat_cols].to_numpy().astype(float)
+    wide_x = df[wide_cols].to_numpy().astype(float)
     deep_x = df[deep_cols].to_numpy().astype(float)
 
     return wide_x, deep_x